@@ -1,6 +1,6 @@
 from itertools import groupby
 
-from unctl.list import load_checks
+from unctl.list import MANIFEST_PATH, discover_checks, save_manifest
 
 
 def update_readme_section(file_path, section, checks_list):
@@ -69,7 +69,10 @@ def update_checks(grouped_objects: dict):
 
 
 if __name__ == "__main__":
-    checks = load_checks()
+    save_manifest()
+    print(f"{MANIFEST_PATH} updated successfully.")
+
+    checks = discover_checks()
 
     severity_mapping = {
         "Critical": 1,
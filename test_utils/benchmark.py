@@ -0,0 +1,183 @@
+"""
+Scaling benchmark of unctl Kubernetes scans over generated clusters.
+
+Measures collection, check execution, report aggregation and display on
+clusters of growing size, and estimates how each of them grows with the
+number of pods. Growth well above 1 means the cost grows faster than the
+cluster, e.g. a check comparing every pod with every other one.
+
+    python -m test_utils.benchmark --sizes 1000 10000 100000
+"""
+
+import argparse
+import asyncio
+import contextlib
+import io
+import json
+import math
+import tempfile
+import time
+from unittest.mock import patch
+
+from prettytable import PrettyTable
+
+from test_utils.generators import ClusterSpec, generate_cluster
+from test_utils.harness import Harness
+from test_utils.utils import get_test_config
+from unctl.__main__ import unctl_process_args
+from unctl.constants import CheckProviders
+from unctl.lib.display.display import Displays
+from unctl.lib.timings import Timings
+from unctl.scanrkube import DataCollector, KubernetesDataCollector, ResourceChecker
+
+__all__ = ["PHASES", "run_benchmark", "growth"]
+
+PHASES = ("collect", "execute", "reports", "display")
+# growth rates above this are reported as superlinear
+SUPERLINEAR = 1.3
+
+
+class _CollectedData(DataCollector):
+    """Serves data collected beforehand, so checks are measured alone."""
+
+    def __init__(self, data):
+        self._data = data
+
+    async def fetch_data(self, resources=None):
+        return self._data
+
+
+@contextlib.contextmanager
+def _timed(results, phase):
+    start = time.perf_counter()
+    yield
+    results[phase] = time.perf_counter() - start
+
+
+async def _scan(checks, raw_json):
+    results = {}
+    display = Displays.get_display(CheckProviders.K8S)
+    display.init(unctl_process_args(["k8s"]))
+
+    collector = KubernetesDataCollector(raw_json=raw_json)
+    resources = set().union(*(check.Resources or () for check in checks))
+    with _timed(results, "collect"):
+        async with collector.session():
+            data = await collector.fetch_data(resources)
+
+    timings = Timings()
+    app = ResourceChecker(
+        display, _CollectedData(data), checks, CheckProviders.K8S, timings=timings
+    )
+    # progress bars and tables are not part of the report
+    with contextlib.redirect_stdout(io.StringIO()):
+        with _timed(results, "execute"):
+            reports = await app.execute()
+        with _timed(results, "reports"):
+            app.failing_objects
+        with _timed(results, "display"):
+            display.display_results_table(reports, sort_by="object")
+
+    results["checks"] = {timing.check: timing.wall for timing in timings.checks}
+    return results
+
+
+def run_benchmark(sizes, checks=None, raw_json=False, seed=0):
+    """Returns measurements of each of the cluster sizes, keyed by size."""
+    harness = Harness.create(raw_json=raw_json)
+    checks = harness.k8s_cluster.get_checks(*(checks or ()))
+
+    measurements = {}
+    with tempfile.NamedTemporaryFile("w", suffix=".yaml") as config:
+        config.write(get_test_config(provider="k8s", filename="config.yaml"))
+        config.flush()
+        for size in sizes:
+            k8s_cluster = Harness.setup_k8s_cluster()
+            k8s_cluster.add_generated(
+                generate_cluster(ClusterSpec(pods=size, seed=seed))
+            )
+            with patch(
+                "kubernetes_asyncio.config.kube_config.KUBE_CONFIG_DEFAULT_LOCATION",
+                config.name,
+            ), k8s_cluster.spin_up():
+                measurements[size] = asyncio.run(_scan(checks, raw_json))
+    return measurements
+
+
+def growth(measurements, key):
+    """
+    Estimates exponent of the growth between the two largest sizes, e.g.
+    1 for linear and 2 for quadratic costs.
+    """
+    sizes = sorted(measurements)
+    if len(sizes) < 2:
+        return None
+    small, large = sizes[-2], sizes[-1]
+    before, after = key(measurements[small]), key(measurements[large])
+    if not before or not after:
+        return None
+    return math.log(after / before) / math.log(large / small)
+
+
+def _table(title, rows, measurements):
+    sizes = sorted(measurements)
+    table = PrettyTable([title, *(f"{size} pods (s)" for size in sizes), "Growth"])
+    table.align = "l"
+    for name, key in rows:
+        rate = growth(measurements, key)
+        table.add_row(
+            [
+                name,
+                *(f"{key(measurements[size]):.3f}" for size in sizes),
+                "-"
+                if rate is None
+                else f"{rate:.2f}" + (" !" if rate > SUPERLINEAR else ""),
+            ]
+        )
+    return table
+
+
+def _print_results(measurements):
+    print(
+        _table(
+            "Phase",
+            [(phase, lambda m, p=phase: m[p]) for phase in PHASES],
+            measurements,
+        )
+    )
+    largest = measurements[max(measurements)]
+    checks = sorted(largest["checks"], key=largest["checks"].get, reverse=True)
+    print(
+        _table(
+            "Check",
+            [(check, lambda m, c=check: m["checks"].get(c, 0)) for check in checks],
+            measurements,
+        )
+    )
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--sizes",
+        help="Numbers of pods of the generated clusters",
+        nargs="+",
+        type=int,
+        default=[1000, 10000, 100000],
+    )
+    parser.add_argument("-c", "--checks", help="Benchmark only these checks", nargs="+")
+    parser.add_argument(
+        "--raw-json", help="Run checks on raw JSON", action="store_true"
+    )
+    parser.add_argument("--output", help="Save measurements as JSON to OUTPUT")
+    options = parser.parse_args(argv)
+
+    measurements = run_benchmark(options.sizes, options.checks, options.raw_json)
+    _print_results(measurements)
+    if options.output:
+        with open(options.output, "w") as file:
+            json.dump(measurements, file, indent=2)
+
+
+if __name__ == "__main__":
+    main()
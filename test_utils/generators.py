@@ -0,0 +1,286 @@
+import base64
+import random
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+
+__all__ = ["ClusterSpec", "generate_cluster"]
+
+_STARTED = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+@dataclass
+class ClusterSpec:
+    """
+    Shape of a generated cluster.
+
+    Counts are totals across all the namespaces. `label_cardinality` is the
+    number of distinct `app` labels per namespace, every app gets a service
+    selecting its pods. `broken_ratio` is the share of objects generated in
+    a state checks should report, e.g. crash looping or referencing missing
+    ConfigMaps.
+    """
+
+    pods: int = 1000
+    namespaces: int = 10
+    nodes: int | None = None
+    configmaps: int | None = None
+    secrets: int | None = None
+    events: int | None = None
+    label_cardinality: int = 20
+    broken_ratio: float = 0.02
+    seed: int = 0
+
+    def __post_init__(self):
+        # typical ratios, a node runs ~30 pods, each app has ConfigMap, Secret
+        apps = self.namespaces * self.label_cardinality
+        if self.nodes is None:
+            self.nodes = max(self.pods // 30, 1)
+        if self.configmaps is None:
+            self.configmaps = apps
+        if self.secrets is None:
+            self.secrets = apps
+        if self.events is None:
+            self.events = self.pods // 2
+
+
+def _uid(rng):
+    return str(uuid.UUID(int=rng.getrandbits(128)))
+
+
+def _metadata(rng, name, namespace=None, labels=None, **extra):
+    metadata = {
+        "name": name,
+        "uid": _uid(rng),
+        "resourceVersion": str(rng.randrange(1, 10**9)),
+        "creationTimestamp": _STARTED.isoformat(),
+        **extra,
+    }
+    if namespace is not None:
+        metadata["namespace"] = namespace
+    if labels is not None:
+        metadata["labels"] = labels
+    return metadata
+
+
+def _node(rng, name):
+    resources = {"cpu": "8000m", "memory": "32000000Ki", "pids": "32768"}
+    return {
+        "metadata": _metadata(rng, name, labels={"kubernetes.io/hostname": name}),
+        "status": {
+            "allocatable": {**resources, "pods": "110"},
+            "capacity": {**resources, "memory": "32600000Ki", "pods": "110"},
+            "conditions": [
+                {"type": "MemoryPressure", "status": "False"},
+                {"type": "DiskPressure", "status": "False"},
+                {"type": "PIDPressure", "status": "False"},
+                {"type": "Ready", "status": "True"},
+            ],
+        },
+    }
+
+
+def _container_status(rng, name, broken):
+    if broken:
+        state = {"waiting": {"reason": "CrashLoopBackOff"}}
+    else:
+        state = {"running": {"startedAt": _STARTED.isoformat()}}
+    return {
+        "name": name,
+        "image": f"registry.local/{name}:1.0",
+        "imageID": "",
+        "ready": not broken,
+        "restartCount": rng.randrange(11, 100) if broken else rng.randrange(3),
+        "state": state,
+    }
+
+
+def _pod(rng, spec, namespace, app, node, index):
+    broken = rng.random() < spec.broken_ratio
+    # broken pods reference ConfigMap and Secret which don't exist
+    config = f"{app}-missing" if broken else f"{app}-config"
+    secret = f"{app}-missing" if broken else f"{app}-secret"
+    replica_set = f"{app}-5d8c7b9f4"
+    return {
+        "metadata": _metadata(
+            rng,
+            f"{replica_set}-{index:05x}",
+            namespace,
+            labels={"app": app, "pod-template-hash": "5d8c7b9f4"},
+            ownerReferences=[
+                {
+                    "apiVersion": "apps/v1",
+                    "kind": "ReplicaSet",
+                    "name": replica_set,
+                    "uid": _uid(rng),
+                    "controller": True,
+                }
+            ],
+        ),
+        "spec": {
+            "nodeName": node,
+            "containers": [
+                {
+                    "name": "main",
+                    "image": f"registry.local/{app}:1.0",
+                    "env": [
+                        {"name": "LOG_LEVEL", "value": "info"},
+                        {
+                            "name": "CONFIG",
+                            "valueFrom": {
+                                "configMapKeyRef": {"name": config, "key": "config"}
+                            },
+                        },
+                        {
+                            "name": "TOKEN",
+                            "valueFrom": {
+                                "secretKeyRef": {"name": secret, "key": "token"}
+                            },
+                        },
+                    ],
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                }
+            ],
+            "volumes": [{"name": "config", "configMap": {"name": config}}],
+        },
+        "status": {
+            "phase": "Running",
+            "conditions": [
+                {"type": "Ready", "status": "False" if broken else "True"},
+            ],
+            "containerStatuses": [_container_status(rng, "main", broken)],
+        },
+    }
+
+
+def _service(rng, namespace, app):
+    return {
+        "metadata": _metadata(rng, app, namespace, labels={"app": app}),
+        "spec": {
+            "selector": {"app": app},
+            "ports": [{"port": 80, "targetPort": 8080, "protocol": "TCP"}],
+        },
+    }
+
+
+def _endpoints(rng, namespace, app, pods):
+    addresses = [
+        {
+            "ip": f"10.{i // 65536 % 256}.{i // 256 % 256}.{i % 256}",
+            "targetRef": {
+                "kind": "Pod",
+                "name": pod["metadata"]["name"],
+                "namespace": namespace,
+            },
+        }
+        for i, pod in enumerate(pods)
+    ]
+    return {
+        "metadata": _metadata(rng, app, namespace),
+        "subsets": [{"addresses": addresses, "ports": [{"port": 8080}]}]
+        if addresses
+        else None,
+    }
+
+
+def _configmap(rng, namespace, name):
+    return {
+        "metadata": _metadata(rng, name, namespace),
+        "data": {"config": "key=value\n" * 8},
+    }
+
+
+def _secret(rng, namespace, name):
+    token = base64.b64encode(rng.randbytes(24)).decode()
+    return {
+        "metadata": _metadata(rng, name, namespace),
+        "type": "Opaque",
+        "data": {"token": token},
+    }
+
+
+def _event(rng, pod, index):
+    metadata = pod["metadata"]
+    warning = rng.random() < 0.3
+    seen = _STARTED + timedelta(seconds=rng.randrange(86400))
+    return {
+        "metadata": _metadata(
+            rng, f"{metadata['name']}.{index:x}", metadata["namespace"]
+        ),
+        "involvedObject": {
+            "kind": "Pod",
+            "name": metadata["name"],
+            "namespace": metadata["namespace"],
+            "uid": metadata["uid"],
+        },
+        "type": "Warning" if warning else "Normal",
+        "reason": "BackOff" if warning else "Pulled",
+        "message": "Back-off restarting failed container"
+        if warning
+        else "Container image already present on machine",
+        "count": rng.randrange(1, 20),
+        "firstTimestamp": _STARTED.isoformat(),
+        "lastTimestamp": seen.isoformat(),
+    }
+
+
+def _names(prefix, count, namespaces, apps):
+    """Spreads `count` objects over the namespaces, named after the apps."""
+    for i in range(count):
+        namespace = namespaces[i % len(namespaces)]
+        # first round of objects is named the way pods reference them
+        rounds, app = divmod(i // len(namespaces), len(apps[namespace]))
+        name = f"{apps[namespace][app]}-{prefix}"
+        yield namespace, f"{name}-{rounds}" if rounds else name
+
+
+def generate_cluster(spec: ClusterSpec) -> dict[str, list[dict]]:
+    """
+    Generates API JSON objects of a cluster shaped by `spec`, grouped by
+    kind the way `TestingK8SCLuster.add_*` methods name them. The same spec
+    always generates the same cluster.
+    """
+    rng = random.Random(spec.seed)
+    namespaces = [f"namespace-{i}" for i in range(spec.namespaces)]
+    apps = {
+        namespace: [f"app-{i}" for i in range(spec.label_cardinality)]
+        for namespace in namespaces
+    }
+    nodes = [_node(rng, f"node-{i}") for i in range(spec.nodes)]
+
+    pods = []
+    pods_by_app = {}
+    for i in range(spec.pods):
+        namespace = namespaces[i % len(namespaces)]
+        app = apps[namespace][rng.randrange(len(apps[namespace]))]
+        node = nodes[rng.randrange(len(nodes))]["metadata"]["name"]
+        pod = _pod(rng, spec, namespace, app, node, i)
+        pods.append(pod)
+        pods_by_app.setdefault((namespace, app), []).append(pod)
+
+    services = []
+    endpoints = []
+    for namespace in namespaces:
+        for app in apps[namespace]:
+            services.append(_service(rng, namespace, app))
+            app_pods = pods_by_app.get((namespace, app), [])
+            endpoints.append(_endpoints(rng, namespace, app, app_pods))
+
+    return {
+        "nodes": nodes,
+        "pods": pods,
+        "services": services,
+        "endpoints": endpoints,
+        "configmaps": [
+            _configmap(rng, namespace, name)
+            for namespace, name in _names("config", spec.configmaps, namespaces, apps)
+        ],
+        "secrets": [
+            _secret(rng, namespace, name)
+            for namespace, name in _names("secret", spec.secrets, namespaces, apps)
+        ],
+        "events": [
+            _event(rng, pods[i % len(pods)], i)
+            for i in range(spec.events if pods else 0)
+        ],
+    }
@@ -33,8 +33,11 @@ class BaseProvider(BaseTestingDatasource):
 
 @dataclass
 class TestingK8SCLuster(BaseProvider):
+    # whether checks run on top of raw JSON objects instead of OpenAPI models
+    raw_json: bool = False
+
     async def run_check(self, check_id, *, display=None):
-        collector = KubernetesDataCollector()
+        collector = KubernetesDataCollector(raw_json=self.raw_json)
         display = display or Displays.get_display(CheckProviders.K8S)
 
         check = self.get_check(check_id)
@@ -112,6 +115,18 @@ class TestingK8SCLuster(BaseProvider):
     def add_events(self, *events):
         self.data.events.items.extend(events)
 
+    def add_watch_event(self, resource, event_type, obj):
+        self.data.add_watch_event(resource, event_type, obj)
+
+    def add_failure(self, resource, status, headers=None):
+        """Fails the next list request of the resource, e.g. `pods`."""
+        self.data.add_failure(resource, status, headers)
+
+    def add_generated(self, resources):
+        """Adds objects grouped by kind, e.g. made by `generate_cluster`."""
+        for kind, items in resources.items():
+            getattr(self, f"add_{kind}")(*items)
+
 
 class Harness:
     """
@@ -124,8 +139,10 @@ class Harness:
         self.k8s_cluster = k8s_cluster
 
     @classmethod
-    def create(cls):
-        return cls(cls.setup_k8s_cluster())
+    def create(cls, raw_json=False):
+        k8s_cluster = cls.setup_k8s_cluster()
+        k8s_cluster.raw_json = raw_json
+        return cls(k8s_cluster)
 
     @contextlib.contextmanager
     def spin_up(self):
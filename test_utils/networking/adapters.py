@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 import json
 from collections import namedtuple
@@ -34,6 +35,29 @@ class AIOHTTPResponse:
         return _inner().__await__()
 
 
+@dataclass
+class AIOHTTPWatchResponse(AIOHTTPResponse):
+    """
+    Streams `response_data` events one JSON per line, then keeps
+    the watch open the same way apiserver does until it times out.
+    """
+
+    @property
+    def content(self):
+        return self._stream()
+
+    async def _stream(self):
+        for event in self.response_data:
+            yield json.dumps(event).encode("utf-8") + b"\n"
+        await asyncio.Event().wait()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc_info):
+        pass
+
+
 class MockAdapters:
     """
     This adapter serves just 1 purpose: abstract mocking
@@ -1,8 +1,11 @@
+import re
 from dataclasses import dataclass, field
 from http import HTTPStatus
 from typing import Type
+from urllib.parse import parse_qs, urlsplit
 
 from kubernetes.client import (
+    ApiClient,
     V1ConfigMapList,
     V1DeploymentList,
     V1ServiceList,
@@ -23,9 +26,51 @@ from kubernetes.client import (
     V1StorageClassList,
     CoreV1EventList,
 )
-from test_utils.networking.adapters import AIOHTTPAdapter, AIOHTTP_REQUEST_SPEC
+from test_utils.networking.adapters import (
+    AIOHTTPAdapter,
+    AIOHTTPWatchResponse,
+    AIOHTTP_REQUEST_SPEC,
+)
 from test_utils.networking.data_sources.base import BaseDataSource
 from test_utils.networking.data_sources.decorators import http_intercepts
+from unctl.lib.k8s.events import matches_field_selector
+
+_NAMESPACED_PATH = re.compile(r"/namespaces/([^/]+)/")
+
+
+def _as_json(item):
+    # items are added either as models or as API JSON
+    return item if isinstance(item, dict) else item.to_dict()
+
+
+def _selected(obj, namespace, label_selector, field_selector):
+    metadata = obj.get("metadata") or {}
+    if namespace is not None and metadata.get("namespace") != namespace:
+        return False
+    if label_selector is not None and not _matches_labels(
+        metadata.get("labels") or {}, label_selector
+    ):
+        return False
+    return matches_field_selector(obj, field_selector)
+
+
+def _matches_labels(labels, label_selector):
+    """Matches equality-based and existence requirements of the selector."""
+    for term in filter(None, label_selector.split(",")):
+        if "!=" in term:
+            key, value = term.split("!=", 1)
+            if labels.get(key) == value:
+                return False
+        elif "=" in term:
+            key, value = term.replace("==", "=").split("=", 1)
+            if labels.get(key) != value:
+                return False
+        elif term.startswith("!"):
+            if term[1:] in labels:
+                return False
+        elif term not in labels:
+            return False
+    return True
 
 
 @dataclass
@@ -74,6 +119,20 @@ class K8SCluster(BaseDataSource):
         default_factory=lambda: V1StorageClassList(items=[])
     )
     events: CoreV1EventList = field(default_factory=lambda: CoreV1EventList(items=[]))
+    # events served by the next watch of the resource, e.g. `pods`
+    watch_events: dict = field(default_factory=dict)
+    # `(status, headers)` served to the next list requests of the resource
+    failures: dict = field(default_factory=dict)
+
+    def add_failure(self, resource, status, headers=None):
+        self.failures.setdefault(resource, []).append((status, headers or {}))
+
+    def add_watch_event(self, resource, event_type, obj):
+        event = {
+            "type": event_type,
+            "object": ApiClient().sanitize_for_serialization(obj),
+        }
+        self.watch_events.setdefault(resource, []).append(event)
 
     def _response(
         self,
@@ -86,6 +145,60 @@ class K8SCluster(BaseDataSource):
             status=status, response_data=data, reason=None, headers=headers or {}
         )
 
+    def _list_response(
+        self,
+        request: AIOHTTP_REQUEST_SPEC,
+        resource_list,
+        response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
+    ):
+        """
+        Serves list with respect to its namespace and `limit`/`continue`/
+        `labelSelector`/`fieldSelector` query parameters the same way apiserver
+        filters and chunks the list responses, and to `Accept` header asking
+        for the metadata only.
+        Watch requests stream the events added for the resource, list requests
+        fail with the failures added for the resource first.
+        """
+        url = urlsplit(request.url)
+        query = parse_qs(url.query)
+        resource = url.path.rsplit("/", 1)[-1]
+        if "watch" not in query and self.failures.get(resource):
+            status, headers = self.failures[resource].pop(0)
+            return self._response(
+                {"kind": "Status", "code": status}, response_type, status, headers
+            )
+        if "watch" in query:
+            events = self.watch_events.pop(resource, [])
+            return AIOHTTPWatchResponse(
+                status=HTTPStatus.OK, reason=None, headers={}, response_data=events
+            )
+
+        items = resource_list.items
+        namespace = _NAMESPACED_PATH.search(url.path)
+        selectors = (
+            namespace and namespace[1],
+            query.get("labelSelector", [None])[0],
+            query.get("fieldSelector", [None])[0],
+        )
+        if any(selectors):
+            items = [item for item in items if _selected(_as_json(item), *selectors)]
+        metadata = None
+        if "limit" in query:
+            # only the page gets serialized, large lists are served in linear time
+            start = int(query.get("continue", [0])[0])
+            end = start + int(query["limit"][0])
+            metadata = {"continue": str(end) if end < len(items) else None}
+            items = items[start:end]
+
+        data = type(resource_list)(items=items).to_dict()
+        accept = request.kwargs.get("headers", {}).get("Accept", "")
+        if "as=PartialObjectMetadataList" in accept:
+            data["kind"] = "PartialObjectMetadataList"
+            data["items"] = [{"metadata": item["metadata"]} for item in data["items"]]
+        if metadata is not None:
+            data["metadata"] = metadata
+        return self._response(data, response_type)
+
     @http_intercepts("GET", "configmaps")
     def get_configmaps(
         self,
@@ -93,7 +206,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.configmaps.to_dict(), response_type)
+        return self._list_response(request, self.configmaps, response_type)
 
     @http_intercepts("GET", "deployments")
     def get_deployments(
@@ -102,7 +215,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.deployments.to_dict(), response_type)
+        return self._list_response(request, self.deployments, response_type)
 
     @http_intercepts("GET", "services")
     def get_services(
@@ -111,7 +224,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.services.to_dict(), response_type)
+        return self._list_response(request, self.services, response_type)
 
     @http_intercepts("GET", "cronjobs")
     def get_cronjobs(
@@ -120,7 +233,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.cronjobs.to_dict(), response_type)
+        return self._list_response(request, self.cronjobs, response_type)
 
     @http_intercepts("GET", "networkpolicies")
     def get_network_policies(
@@ -129,7 +242,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.network_policies.to_dict(), response_type)
+        return self._list_response(request, self.network_policies, response_type)
 
     @http_intercepts("GET", "pods")
     def get_pods(
@@ -138,7 +251,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.pods.to_dict(), response_type)
+        return self._list_response(request, self.pods, response_type)
 
     @http_intercepts("GET", "secrets")
     def get_secrets(
@@ -147,7 +260,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.secrets.to_dict(), response_type)
+        return self._list_response(request, self.secrets, response_type)
 
     @http_intercepts("GET", "daemonsets")
     def get_daemonsets(
@@ -156,7 +269,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.daemonsets.to_dict(), response_type)
+        return self._list_response(request, self.daemonsets, response_type)
 
     @http_intercepts("GET", "horizontalpodautoscalers")
     def get_hpas(
@@ -165,7 +278,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.hpas.to_dict(), response_type)
+        return self._list_response(request, self.hpas, response_type)
 
     @http_intercepts("GET", "replicationcontrollers")
     def get_replicationControllers(
@@ -174,7 +287,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.replication_controllers.to_dict(), response_type)
+        return self._list_response(request, self.replication_controllers, response_type)
 
     @http_intercepts("GET", "replicasets")
     def get_replicasets(
@@ -183,7 +296,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.replicasets.to_dict(), response_type)
+        return self._list_response(request, self.replicasets, response_type)
 
     @http_intercepts("GET", "statefulsets")
     def get_statefulsets(
@@ -192,7 +305,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.statefulsets.to_dict(), response_type)
+        return self._list_response(request, self.statefulsets, response_type)
 
     @http_intercepts("GET", "ingresses")
     def get_ingresses(
@@ -201,7 +314,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.ingresses.to_dict(), response_type)
+        return self._list_response(request, self.ingresses, response_type)
 
     @http_intercepts("GET", "ingressclasses")
     def get_ingressclasses(
@@ -210,16 +323,16 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.ingressclasses.to_dict(), response_type)
+        return self._list_response(request, self.ingressclasses, response_type)
 
-    @http_intercepts("GET", "nodes?watch=False")
+    @http_intercepts("GET", "nodes")
     def get_nodes(
         self,
         request: AIOHTTP_REQUEST_SPEC,
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.nodes.to_dict(), response_type)
+        return self._list_response(request, self.nodes, response_type)
 
     @http_intercepts("GET", "endpoints")
     def get_endpoints(
@@ -228,7 +341,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.endpoints.to_dict(), response_type)
+        return self._list_response(request, self.endpoints, response_type)
 
     @http_intercepts("GET", "persistentvolumeclaims")
     def get_pvcs(
@@ -237,7 +350,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.pvcs.to_dict(), response_type)
+        return self._list_response(request, self.pvcs, response_type)
 
     @http_intercepts("GET", "storageclasses")
     def get_storage_classes(
@@ -246,7 +359,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.storageclasses.to_dict(), response_type)
+        return self._list_response(request, self.storageclasses, response_type)
 
     @http_intercepts("GET", "events")
     def get_events(
@@ -255,7 +368,7 @@ class K8SCluster(BaseDataSource):
         response_type: Type[AIOHTTPAdapter.RESPONSE_TYPE],
         context,
     ):
-        return self._response(self.events.to_dict(), response_type)
+        return self._list_response(request, self.events, response_type)
 
     # if no interceptor found, use default
     def __interceptor_missing__(
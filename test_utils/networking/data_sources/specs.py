@@ -14,6 +14,10 @@ class HTTPInterceptorSpec(BaseInterceptorSpec):
 
         escaped_url = re.escape(url)
         pattern = re.sub(r"\\{[^/]+}", r"[^/]+", escaped_url)
+        # namespaced lists are served by the same interceptors
+        prefix, _, resource = pattern.rpartition("/")
+        if prefix:
+            pattern = f"{prefix}/(namespaces/[^/]+/)?{resource}"
         self.url_pattern = f"^.*/{pattern}[^/]*$"
 
     def validate(self, request):
@@ -75,8 +75,8 @@ def configure_k8s(_k8s_temp_config):
             os.unlink(_k8s_temp_config.name)
 
 
-@pytest.fixture
-def harness():
-    h = Harness.create()
+@pytest.fixture(params=[False, True], ids=["models", "raw_json"])
+def harness(request):
+    h = Harness.create(raw_json=request.param)
     with h.spin_up():
         yield h
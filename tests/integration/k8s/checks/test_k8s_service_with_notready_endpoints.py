@@ -44,7 +44,7 @@ async def test_k8s_service_with_notready_endpoints_negative(
 
     # Create Endpoint object
     endpoint = V1Endpoints(
-        metadata=V1ObjectMeta(name=endpoint_name),
+        metadata=V1ObjectMeta(name=endpoint_name, namespace=service_namespace),
         subsets=[
             V1EndpointSubset(
                 not_ready_addresses=[
@@ -94,7 +94,7 @@ async def test_k8s_service_with_notready_endpoints_positive(
 
     # Create Endpoint object
     endpoint = V1Endpoints(
-        metadata=V1ObjectMeta(name=endpoint_name),
+        metadata=V1ObjectMeta(name=endpoint_name, namespace=service_namespace),
     )
 
     harness.k8s_cluster.add_services(service)
@@ -0,0 +1,346 @@
+import asyncio
+from datetime import datetime, timedelta, timezone
+
+import pytest
+from kubernetes.client import (
+    CoreV1Event,
+    V1Node,
+    V1ObjectMeta,
+    V1ObjectReference,
+    V1PersistentVolumeClaim,
+    V1PersistentVolumeClaimStatus,
+    V1Pod,
+    V1Secret,
+)
+from kubernetes_asyncio.client.rest import ApiException
+
+from unctl.constants import CheckProviders
+from unctl.lib.display.display import Displays
+from unctl.scanrkube import KubernetesDataCollector, ResourceChecker
+
+
+def _requests_to(harness, resource):
+    return harness.k8s_cluster.interceptor.history.filter(
+        lambda request: request.url.split("?")[0].endswith(f"/{resource}")
+    )
+
+
+@pytest.mark.parametrize(
+    ["pods_count", "page_size", "expected_requests"],
+    [
+        (5, 2, 3),
+        (4, 2, 2),
+        (0, 2, 1),
+        # chunking disabled
+        (5, None, 1),
+    ],
+)
+@pytest.mark.asyncio
+async def test_collector_paginates_list_calls(
+    harness, pods_count, page_size, expected_requests
+):
+    pods = [
+        V1Pod(metadata=V1ObjectMeta(name=f"pod-{i}", namespace="test_ns"))
+        for i in range(pods_count)
+    ]
+    harness.k8s_cluster.add_pods(*pods)
+
+    collector = KubernetesDataCollector(
+        page_sizes={"pods": page_size}, raw_json=harness.k8s_cluster.raw_json
+    )
+    data = await collector.fetch_data()
+
+    assert [pod.metadata.name for pod in data.get_pods()] == [
+        pod.metadata.name for pod in pods
+    ]
+    requests = _requests_to(harness, "pods")
+    assert len(requests) == expected_requests
+    if page_size:
+        assert all(f"limit={page_size}" in request.url for request in requests)
+
+
+@pytest.mark.asyncio
+async def test_collector_fetches_only_required_resources(harness):
+    await harness.k8s_cluster.run_check("k8s_pvc_pending")
+
+    history = harness.k8s_cluster.interceptor.history
+    assert history.length > 0
+    assert all(
+        "/persistentvolumeclaims" in request.url for request in history
+    ), "only resources declared by the check should be listed"
+
+
+@pytest.mark.asyncio
+async def test_collector_rejects_unknown_resources():
+    with pytest.raises(ValueError, match="unknown_kind"):
+        await KubernetesDataCollector().fetch_data({"pods", "unknown_kind"})
+
+
+@pytest.mark.asyncio
+async def test_not_collected_resources_are_loaded_on_demand(harness):
+    harness.k8s_cluster.add_pods(
+        V1Pod(metadata=V1ObjectMeta(name="test_pod", namespace="test_ns"))
+    )
+    collector = KubernetesDataCollector(raw_json=harness.k8s_cluster.raw_json)
+    data = await collector.fetch_data(set())
+    assert harness.k8s_cluster.interceptor.history.length == 0
+
+    # concurrent first calls share the same list call
+    pods, same_pods = await asyncio.gather(data.load("pods"), data.load("pods"))
+    assert pods is same_pods
+    assert [pod.metadata.name for pod in pods] == ["test_pod"]
+    assert len(_requests_to(harness, "pods")) == 1
+
+    # sync getters fetch from outside of the event loop and memoize the result
+    assert await asyncio.to_thread(data.get_secrets) == []
+    assert data.get_secrets() == []
+    assert data.get_pods() is pods
+    assert len(_requests_to(harness, "secrets")) == 1
+
+    # blocking on the event loop itself would deadlock
+    with pytest.raises(RuntimeError, match="nodes"):
+        data.get_nodes()
+
+
+@pytest.mark.asyncio
+async def test_undeclared_check_resources_are_loaded_on_demand(harness):
+    harness.k8s_cluster.add_pvcs(
+        V1PersistentVolumeClaim(
+            metadata=V1ObjectMeta(name="test_pvc", namespace="test_ns"),
+            status=V1PersistentVolumeClaimStatus(phase="Pending"),
+        )
+    )
+    check = harness.k8s_cluster.get_check("k8s_pvc_pending")
+    check.Resources = None
+
+    app = ResourceChecker(
+        Displays.get_display(CheckProviders.K8S),
+        KubernetesDataCollector(raw_json=harness.k8s_cluster.raw_json),
+        [check],
+        CheckProviders.K8S,
+    )
+    results = await app.execute()
+
+    assert [report.status for report in results["k8s_pvc_pending"]] == ["FAIL"]
+    history = harness.k8s_cluster.interceptor.history
+    assert all("/persistentvolumeclaims" in request.url for request in history)
+
+
+@pytest.mark.asyncio
+async def test_collector_lists_secrets_metadata_only(harness):
+    harness.k8s_cluster.add_secrets(
+        V1Secret(
+            metadata=V1ObjectMeta(name="test_secret", namespace="test_ns"),
+            data={"password": "c2VjcmV0"},
+        )
+    )
+    collector = KubernetesDataCollector(raw_json=harness.k8s_cluster.raw_json)
+    data = await collector.fetch_data({"secrets_metadata"})
+
+    (secret,) = data.get_secrets_metadata()
+    assert (secret.metadata.name, secret.metadata.namespace) == (
+        "test_secret",
+        "test_ns",
+    )
+    assert secret.data is None, "secret payload should not be downloaded"
+
+    (request,) = _requests_to(harness, "secrets")
+    assert "as=PartialObjectMetadataList" in request.kwargs["headers"]["Accept"]
+
+
+@pytest.mark.parametrize(
+    ["namespaces", "scope"], [(None, "pvcs"), (["test_ns"], ("pvcs", "test_ns"))]
+)
+@pytest.mark.asyncio
+async def test_watching_collector_reruns_checks_without_listing(
+    harness, namespaces, scope
+):
+    harness.k8s_cluster.add_pvcs(
+        V1PersistentVolumeClaim(
+            metadata=V1ObjectMeta(name="test_pvc", namespace="test_ns"),
+            status=V1PersistentVolumeClaimStatus(phase="Pending"),
+        )
+    )
+    harness.k8s_cluster.add_watch_event(
+        "persistentvolumeclaims",
+        "ADDED",
+        V1PersistentVolumeClaim(
+            metadata=V1ObjectMeta(
+                name="new_pvc", namespace="test_ns", resource_version="2"
+            ),
+            status=V1PersistentVolumeClaimStatus(phase="Pending"),
+        ),
+    )
+    collector = KubernetesDataCollector(
+        raw_json=harness.k8s_cluster.raw_json, watch=True, namespaces=namespaces
+    )
+    app = ResourceChecker(
+        Displays.get_display(CheckProviders.K8S),
+        collector,
+        [harness.k8s_cluster.get_check("k8s_pvc_pending")],
+        CheckProviders.K8S,
+    )
+
+    try:
+        await app.execute()
+        # let the watch deliver the event
+        for _ in range(100):
+            if collector._watch_cache.resource_version(scope) == "2":
+                break
+            await asyncio.sleep(0.01)
+        results = await app.execute()
+    finally:
+        await app.close()
+
+    assert sorted(report.object_name for report in results["k8s_pvc_pending"]) == [
+        "new_pvc",
+        "test_pvc",
+    ]
+    requests = _requests_to(harness, "persistentvolumeclaims")
+    watches = [request for request in requests if "watch=" in request.url]
+    assert len(requests) - len(watches) == 1, "resources should be listed once"
+    assert len(watches) == 1
+
+
+@pytest.mark.asyncio
+async def test_collector_lists_selected_namespaces_and_labels(harness):
+    harness.k8s_cluster.add_pods(
+        *(
+            V1Pod(
+                metadata=V1ObjectMeta(
+                    name=f"{app}-pod", namespace=namespace, labels={"app": app}
+                )
+            )
+            for namespace in ("ns_a", "ns_b", "ns_c")
+            for app in ("web", "db")
+        )
+    )
+    harness.k8s_cluster.add_nodes(V1Node(metadata=V1ObjectMeta(name="test_node")))
+    collector = KubernetesDataCollector(
+        raw_json=harness.k8s_cluster.raw_json,
+        namespaces=["ns_b", "ns_a", "ns_b"],
+        label_selector="app=web",
+    )
+    collector.reported_only = frozenset({"pods"})
+    data = await collector.fetch_data({"pods", "nodes"})
+
+    assert sorted(
+        (pod.metadata.namespace, pod.metadata.name) for pod in data.get_pods()
+    ) == [("ns_a", "web-pod"), ("ns_b", "web-pod")]
+    assert [node.metadata.name for node in data.get_nodes()] == ["test_node"]
+
+    pod_requests = _requests_to(harness, "pods")
+    assert sorted(
+        request.url.split("?")[0].split("/")[-2] for request in pod_requests
+    ) == [
+        "ns_a",
+        "ns_b",
+    ]
+    assert all("labelSelector=app%3Dweb" in request.url for request in pod_requests)
+    (node_request,) = _requests_to(harness, "nodes")
+    assert "labelSelector" not in node_request.url, "nodes are cluster-scoped"
+
+
+@pytest.mark.asyncio
+async def test_collector_keeps_looked_up_objects_whole(harness):
+    harness.k8s_cluster.add_pods(
+        *(
+            V1Pod(
+                metadata=V1ObjectMeta(
+                    name=f"{app}-pod", namespace="test_ns", labels={"app": app}
+                )
+            )
+            for app in ("web", "db")
+        )
+    )
+    collector = KubernetesDataCollector(
+        raw_json=harness.k8s_cluster.raw_json, label_selector="app=web"
+    )
+    data = await collector.fetch_data({"pods"})
+
+    # pods may be looked up by the checks, e.g. by services' selectors
+    assert sorted(pod.metadata.name for pod in data.get_pods()) == [
+        "db-pod",
+        "web-pod",
+    ]
+    assert [pod.metadata.name for pod in data.get_reported("pods")] == ["web-pod"]
+    assert all("labelSelector" not in r.url for r in _requests_to(harness, "pods"))
+
+
+def _event(name, kind, type="Warning", reason="BackOff", age=0, count=1):
+    return CoreV1Event(
+        metadata=V1ObjectMeta(name=f"{name}.{reason}", namespace="test_ns"),
+        involved_object=V1ObjectReference(kind=kind, name=name, namespace="test_ns"),
+        type=type,
+        reason=reason,
+        count=count,
+        last_timestamp=(
+            datetime.now(timezone.utc) - timedelta(minutes=age)
+        ).isoformat(),
+    )
+
+
+@pytest.mark.asyncio
+async def test_collector_summarizes_warning_events(harness):
+    harness.k8s_cluster.add_events(
+        _event("test_pod", "Pod", count=3),
+        _event("test_pod", "Pod", reason="Unhealthy"),
+        _event("test_pod", "Pod", reason="Pulled", type="Normal"),
+        _event("old_pod", "Pod", age=120),
+        _event("test_node", "Node"),
+    )
+    collector = KubernetesDataCollector(
+        page_sizes={"pod_warning_events": 1}, raw_json=harness.k8s_cluster.raw_json
+    )
+    data = await collector.fetch_data({"pod_warning_events"})
+
+    (summary,) = data.get_pod_warning_events()
+    assert (summary.kind, summary.namespace, summary.name) == (
+        "Pod",
+        "test_ns",
+        "test_pod",
+    )
+    assert summary.reasons == {"BackOff": 3, "Unhealthy": 1}
+    requests = _requests_to(harness, "events")
+    assert len(requests) == 3, "events should be filtered before paginating"
+    assert all(
+        "fieldSelector=type%3DWarning%2CinvolvedObject.kind%3DPod" in request.url
+        for request in requests
+    )
+
+
+@pytest.mark.asyncio
+async def test_collector_retries_throttled_requests(harness):
+    harness.k8s_cluster.add_pods(
+        V1Pod(metadata=V1ObjectMeta(name="test_pod", namespace="test_ns"))
+    )
+    harness.k8s_cluster.add_failure("pods", 429, {"Retry-After": "0"})
+    harness.k8s_cluster.add_failure("pods", 503, {"Retry-After": "0"})
+
+    collector = KubernetesDataCollector(raw_json=harness.k8s_cluster.raw_json)
+    data = await collector.fetch_data({"pods"})
+
+    assert [pod.metadata.name for pod in data.get_pods()] == ["test_pod"]
+    assert len(_requests_to(harness, "pods")) == 3
+
+
+@pytest.mark.parametrize("partial", [False, True])
+@pytest.mark.asyncio
+async def test_collector_failures(harness, partial):
+    harness.k8s_cluster.add_pods(
+        V1Pod(metadata=V1ObjectMeta(name="test_pod", namespace="test_ns"))
+    )
+    harness.k8s_cluster.add_failure("nodes", 403)
+
+    collector = KubernetesDataCollector(
+        raw_json=harness.k8s_cluster.raw_json, partial=partial
+    )
+    data = await collector.fetch_data({"pods", "nodes"})
+
+    if not partial:
+        assert data is None
+        return
+    assert [pod.metadata.name for pod in data.get_pods()] == ["test_pod"]
+    assert data.errors["nodes"].status == 403
+    with pytest.raises(ApiException):
+        await asyncio.to_thread(data.get_nodes)
@@ -0,0 +1,98 @@
+import pytest
+from kubernetes.client import (
+    V1Container,
+    V1ObjectMeta,
+    V1Pod,
+    V1PodSpec,
+    V1Secret,
+)
+
+from unctl.scanrkube import KubernetesDataCollector, KubernetesSnapshotCollector
+
+
+@pytest.mark.asyncio
+async def test_snapshot_round_trip(harness, tmp_path):
+    harness.k8s_cluster.add_pods(
+        V1Pod(
+            metadata=V1ObjectMeta(name="test_pod", namespace="test_ns"),
+            spec=V1PodSpec(
+                node_name="test_node", containers=[V1Container(name="test")]
+            ),
+        )
+    )
+    harness.k8s_cluster.add_secrets(
+        V1Secret(
+            metadata=V1ObjectMeta(name="test_secret", namespace="test_ns"),
+            data={"password": "c2VjcmV0"},
+        )
+    )
+    raw_json = harness.k8s_cluster.raw_json
+    snapshot_path = tmp_path / "cluster.ndjson.gz"
+
+    collector = KubernetesDataCollector(raw_json=raw_json, snapshot_path=snapshot_path)
+    # snapshot keeps everything, not only the requested resources
+    await collector.fetch_data({"pods"})
+    requests_count = harness.k8s_cluster.interceptor.history.length
+    assert requests_count > 1
+
+    data = await KubernetesSnapshotCollector(
+        snapshot_path, raw_json=raw_json
+    ).fetch_data({"nodes", "pods", "secrets_metadata", "warning_events"})
+    assert harness.k8s_cluster.interceptor.history.length == requests_count
+
+    (pod,) = data.get_pods()
+    assert (pod.metadata.name, pod.spec.node_name) == ("test_pod", "test_node")
+    assert pod.spec.containers[0].name == "test"
+    assert data.get_nodes() == []
+    (secret,) = data.get_secrets_metadata()
+    assert secret.metadata.name == "test_secret"
+    assert secret.data is None, "secret payload should not be saved"
+    # summaries are computed from the saved events
+    assert data.get_warning_events() == []
+
+
+@pytest.mark.asyncio
+async def test_snapshot_misses_secrets_with_data(harness, tmp_path):
+    snapshot_path = tmp_path / "cluster.ndjson.gz"
+    await KubernetesDataCollector(snapshot_path=snapshot_path).fetch_data()
+
+    collector = KubernetesSnapshotCollector(snapshot_path)
+    assert await collector.fetch_data({"secrets"}) is None
+    data = await collector.fetch_data(set())
+    with pytest.raises(LookupError, match="secrets"):
+        await data.load("secrets")
+
+
+@pytest.mark.asyncio
+async def test_snapshot_scoped_to_namespaces_and_selector(harness, tmp_path):
+    harness.k8s_cluster.add_pods(
+        *(
+            V1Pod(
+                metadata=V1ObjectMeta(
+                    name=f"{app}-pod", namespace=namespace, labels={"app": app}
+                ),
+                spec=V1PodSpec(containers=[V1Container(name="test")]),
+            )
+            for namespace in ("test_ns", "other_ns")
+            for app in ("web", "db")
+        )
+    )
+    raw_json = harness.k8s_cluster.raw_json
+    snapshot_path = tmp_path / "cluster.ndjson.gz"
+    await KubernetesDataCollector(
+        raw_json=raw_json, snapshot_path=snapshot_path
+    ).fetch_data()
+
+    collector = KubernetesSnapshotCollector(
+        snapshot_path,
+        raw_json=raw_json,
+        namespaces=["test_ns"],
+        label_selector="app=web",
+    )
+    # pods are not looked up by any check, the selector is applied on listing
+    collector.reported_only = frozenset({"pods"})
+    data = await collector.fetch_data({"pods"})
+
+    assert [(pod.metadata.namespace, pod.metadata.name) for pod in data.get_pods()] == [
+        ("test_ns", "web-pod")
+    ]
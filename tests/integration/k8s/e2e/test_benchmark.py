@@ -0,0 +1,19 @@
+from test_utils.benchmark import PHASES, growth, run_benchmark
+
+
+def test_benchmark_measures_each_size():
+    measurements = run_benchmark([50, 100], checks=["k8s_pods_pending"])
+
+    assert sorted(measurements) == [50, 100]
+    for results in measurements.values():
+        assert all(results[phase] > 0 for phase in PHASES)
+        assert list(results["checks"]) == ["k8s_pods_pending"]
+    assert growth(measurements, lambda results: results["collect"]) is not None
+
+
+def test_growth():
+    linear = {1000: {"t": 1.0}, 10000: {"t": 10.0}}
+    quadratic = {1000: {"t": 1.0}, 10000: {"t": 100.0}}
+
+    assert growth(linear, lambda results: results["t"]) == 1
+    assert growth(quadratic, lambda results: results["t"]) == 2
@@ -1,10 +1,16 @@
+import csv
+import io
 import json
 import os
+import pstats
 import pytest
 
 from unittest.mock import patch
 
-from unctl.__main__ import unctl_process_args
+from test_utils.generators import ClusterSpec, generate_cluster
+from unctl.__main__ import unctl, unctl_process_args
+from unctl.lib.checks.k8s import CheckReportK8s
+from unctl.version import DISABLE_ENV, parse
 
 
 def load_snapshot_data(filename):
@@ -29,6 +35,11 @@ def snapshot_data():
     [
         (["k8s"], 31, 57),  # full scan
         (["k8s", "-c", "k8s_pods_pending"], 1, 1),  # single check scan
+        (["k8s", "--raw-json"], 31, 57),  # full scan without models
+        (["k8s", "--compact-reports"], 31, 57),  # full scan, column-wise reports
+        (["k8s", "--parallel", "4"], 31, 57),  # full scan on worker processes
+        (["k8s", "-n", "temporal"], 31, None),  # single namespace scan
+        (["k8s", "--namespaces", "temporal", "dev-env"], 31, 57),
     ],
 )
 def test_scan(
@@ -51,6 +62,411 @@ def test_scan(
 
     assert len(results) == total_checks
 
-    assert len(failing_objects) == failed_items
+    if failed_items is None:
+        assert 0 < len(failing_objects) < 57
+    else:
+        assert len(failing_objects) == failed_items
 
     return
+
+
+def test_scan_timings(harness, snapshot_data, tmp_path):
+    harness.k8s_cluster.add_pods(*snapshot_data["pods"])
+    timings_path = tmp_path / "timings.json"
+
+    options = unctl_process_args(
+        ["k8s", "--timings", str(timings_path), "--trace-memory"]
+    )
+    with patch("builtins.input", return_value="n"):
+        results, _, _ = harness.run_unctl(options=options)
+
+    with open(timings_path) as file:
+        timings = json.load(file)
+    lists = {timing["kind"]: timing for timing in timings["lists"]}
+    checks = {timing["check"]: timing for timing in timings["checks"]}
+
+    assert lists["pods"]["objects"] == len(snapshot_data["pods"])
+    assert lists["pods"]["received"] > 0
+    assert len(checks) == len(results)
+    pods_pending = checks["k8s_pods_pending"]
+    assert pods_pending["objects"] == pods_pending["reports"]
+    assert pods_pending["reports"] == len(results["k8s_pods_pending"])
+    assert pods_pending["memory_peak"] > 0
+
+
+def _profiled_files(stats):
+    return {os.path.basename(filename) for filename, _, _ in stats.stats}
+
+
+@pytest.mark.parametrize(
+    ["phases", "profiled_check"],
+    [
+        (["load", "collect", "execute", "display"], True),
+        (["display"], False),
+    ],
+)
+def test_scan_profile(harness, snapshot_data, tmp_path, phases, profiled_check):
+    harness.k8s_cluster.add_pods(*snapshot_data["pods"])
+    profile_path = tmp_path / "unctl.prof"
+
+    options = unctl_process_args(
+        ["k8s", "--profile", str(profile_path), "--profile-phases", *phases]
+    )
+    with patch("builtins.input", return_value="n"):
+        harness.run_unctl(options=options)
+
+    files = _profiled_files(pstats.Stats(str(profile_path)))
+    assert "display.py" in files
+    assert ("k8s_pods_pending.py" in files) is profiled_check
+
+
+def test_scan_profile_collapsed(harness, snapshot_data, tmp_path):
+    harness.k8s_cluster.add_pods(*snapshot_data["pods"])
+    profile_path = tmp_path / "unctl.collapsed"
+
+    options = unctl_process_args(
+        ["k8s", "--profile", str(profile_path), "--profile-format", "collapsed"]
+    )
+    with patch("builtins.input", return_value="n"):
+        harness.run_unctl(options=options)
+
+    with open(profile_path) as file:
+        lines = file.read().splitlines()
+    assert lines
+    for line in lines:
+        stack, count = line.rsplit(" ", 1)
+        assert stack.split(";")[0]
+        assert int(count) > 0
+
+
+def test_scan_generated_cluster(harness):
+    cluster = generate_cluster(ClusterSpec(pods=300, namespaces=3, seed=1))
+    harness.k8s_cluster.add_generated(cluster)
+    crash_looping = [
+        pod
+        for pod in cluster["pods"]
+        if "waiting" in pod["status"]["containerStatuses"][0]["state"]
+    ]
+
+    options = unctl_process_args(["k8s"])
+    with patch("builtins.input", return_value="n"):
+        results, _, _ = harness.run_unctl(options=options)
+
+    assert len(results) == 31
+    assert len(results["k8s_pods_pending"]) == len(cluster["pods"])
+    failing = [r for r in results["k8s_pod_crashloopbackoff"] if not r.passed]
+    assert len(failing) == len(crash_looping) > 0
+
+
+@pytest.mark.parametrize("parallel", [[], ["--parallel", "4"]])
+def test_scan_partial_results(harness, snapshot_data, parallel):
+    harness.k8s_cluster.add_pods(*snapshot_data["pods"])
+    harness.k8s_cluster.add_failure("nodes", 403)
+    node_checks = {
+        check.__class__.__name__
+        for check in harness.k8s_cluster.get_checks()
+        if "nodes" in (check.Resources or ())
+    }
+
+    options = unctl_process_args(["k8s", "--partial-results", *parallel])
+    with patch("builtins.input", return_value="n"):
+        results, failing_reports, _ = harness.run_unctl(options=options)
+
+    assert len(results) == 31
+    errored = {
+        name
+        for name, reports in results.items()
+        if any(report.errored for report in reports)
+    }
+    assert errored == node_checks != set()
+    for name in errored:
+        (report,) = results[name]
+        assert report.status_extended == "nodes not collected: 403"
+    assert not any(report.errored for report in failing_reports)
+
+
+def _add_snapshot_data(harness, snapshot_data):
+    harness.k8s_cluster.add_pods(*snapshot_data["pods"])
+    harness.k8s_cluster.add_deployments(*snapshot_data["deployments"])
+    harness.k8s_cluster.add_services(*snapshot_data["services"])
+
+
+@pytest.mark.parametrize("parallel", [[], ["--parallel", "4"]])
+def test_scan_stream_ndjson(harness, snapshot_data, capsys, parallel):
+    _add_snapshot_data(harness, snapshot_data)
+
+    options = unctl_process_args(["k8s", "--stream", "ndjson", "-f", *parallel])
+    with patch("builtins.input", return_value="n"):
+        assert harness.run_unctl(options=options) == (None, None, None)
+
+    # nothing but the reports goes to stdout
+    reports = [json.loads(line) for line in capsys.readouterr().out.splitlines()]
+    assert len(reports) == 57
+    assert {report["status"] for report in reports} == {"FAIL"}
+    pending = [r for r in reports if r["check_id"] == "k8s_pods_pending"]
+    assert len(pending) == 1
+    assert pending[0]["check_title"] and pending[0]["resource_name"]
+
+
+def test_scan_stream_text(harness, snapshot_data, capsys):
+    _add_snapshot_data(harness, snapshot_data)
+
+    options = unctl_process_args(["k8s", "--stream"])
+    with patch("builtins.input", return_value="n"):
+        harness.run_unctl(options=options)
+
+    output = capsys.readouterr().out
+    assert output.index("Checks Scan Report") < output.index("End of Scan Report")
+    rows = [line for line in output.splitlines() if "FAIL" in line]
+    assert len(rows) == 57
+
+
+def _parse_json(output):
+    return json.loads(output)
+
+
+def _parse_csv(output):
+    return list(csv.DictReader(io.StringIO(output)))
+
+
+def _parse_sarif(output):
+    log = json.loads(output)
+    assert log["version"] == "2.1.0"
+    (run,) = log["runs"]
+    rules = {rule["id"] for rule in run["tool"]["driver"]["rules"]}
+    results = run["results"]
+    assert {result["ruleId"] for result in results} <= rules
+    assert {result["kind"] for result in results} == {"fail"}
+    return [result["properties"] for result in results]
+
+
+@pytest.mark.parametrize(
+    ["output_format", "parse"],
+    [("json", _parse_json), ("csv", _parse_csv), ("sarif", _parse_sarif)],
+)
+def test_scan_output(harness, snapshot_data, capsys, output_format, parse):
+    _add_snapshot_data(harness, snapshot_data)
+
+    options = unctl_process_args(["k8s", "--output", output_format, "-f"])
+    with patch("builtins.input", return_value="n"):
+        assert harness.run_unctl(options=options) == (None, None, None)
+
+    reports = parse(capsys.readouterr().out)
+    assert len(reports) == 57
+    assert {report["status"] for report in reports} == {"FAIL"}
+    assert list(reports[0]) == CheckReportK8s.columns()
+
+
+def test_scan_output_without_reports(harness, capsys):
+    options = unctl_process_args(
+        ["k8s", "--output", "sarif", "-f", "-c", "k8s_pods_pending"]
+    )
+    with patch("builtins.input", return_value="n"):
+        harness.run_unctl(options=options)
+
+    (run,) = json.loads(capsys.readouterr().out)["runs"]
+    assert run["results"] == []
+    assert [rule["id"] for rule in run["tool"]["driver"]["rules"]] == []
+
+
+@pytest.mark.parametrize("output", ["json", "sarif"])
+def test_scan_output_when_collection_fails(harness, capsys, output):
+    harness.k8s_cluster.add_failure("pods", 403)
+
+    options = unctl_process_args(["k8s", "--output", output, "-c", "k8s_pods_pending"])
+    with patch("builtins.input", return_value="n"), pytest.raises(SystemExit):
+        harness.run_unctl(options=options)
+
+    # no truncated document is left behind
+    captured = capsys.readouterr()
+    assert captured.out == ""
+    assert "Failed to collect inventory" in captured.err
+
+
+@pytest.mark.parametrize("output", ["json", "sarif", "csv"])
+@pytest.mark.parametrize("option", ["--output", "--stream"])
+def test_scan_repeatedly_needs_repeatable_output(capsys, option, output):
+    with pytest.raises(SystemExit):
+        unctl_process_args(["k8s", "--interval", "60", option, output])
+
+    assert "use ndjson for repeated scans" in capsys.readouterr().err
+
+
+def test_scan_from_snapshot_saves_no_snapshot(capsys):
+    argv = ["k8s", "--from-snapshot", "a.ndjson.gz", "--save-snapshot", "b.ndjson.gz"]
+    with pytest.raises(SystemExit):
+        unctl_process_args(argv)
+
+    assert "not allowed with argument" in capsys.readouterr().err
+
+
+def test_scan_output_only_reports_on_stdout(
+    harness, snapshot_data, capsys, tmp_path, monkeypatch
+):
+    _add_snapshot_data(harness, snapshot_data)
+    monkeypatch.delenv(DISABLE_ENV, raising=False)
+    profile_path = tmp_path / "unctl.prof"
+
+    argv = ["k8s", "--output", "json", "-f", "--profile", str(profile_path)]
+    # the check answers at once, it's done long before the scan
+    with patch("builtins.input", return_value="n"), patch(
+        "unctl.version.latest", return_value=parse("99.0.0")
+    ):
+        unctl(argv)
+
+    captured = capsys.readouterr()
+    assert len(json.loads(captured.out)) == 57
+    assert "Profile saved" in captured.err
+    assert "99.0.0" in captured.err
+
+
+def test_scan_selector_finds_unlabeled_references(harness, capsys):
+    container = {
+        "name": "app",
+        "env": [
+            {
+                "name": "PASSWORD",
+                "valueFrom": {"secretKeyRef": {"name": "creds", "key": "password"}},
+            }
+        ],
+    }
+    harness.k8s_cluster.add_pods(
+        *(
+            {
+                "metadata": {
+                    "name": f"{app}-pod",
+                    "namespace": "test_ns",
+                    "labels": {"app": app},
+                },
+                "spec": {"containers": [container]},
+            }
+            for app in ("web", "db")
+        )
+    )
+    harness.k8s_cluster.add_secrets(
+        {"metadata": {"name": "creds", "namespace": "test_ns"}}
+    )
+
+    options = unctl_process_args(
+        ["k8s", "--selector", "app=web", "-c", "k8s_pod_secret_existence"]
+    )
+    with patch("builtins.input", return_value="n"):
+        results, _, _ = harness.run_unctl(options=options)
+
+    (report,) = results["k8s_pod_secret_existence"]
+    assert report.resource_name == "web-pod"
+    assert report.status == "PASS", report.status_extended
+
+
+def _labeled_workload(kind, app, status=None, **spec):
+    return {
+        "metadata": {
+            "name": f"{app}-{kind}",
+            "namespace": "test_ns",
+            "uid": f"{app}-{kind}",
+            "resourceVersion": "1",
+            "creationTimestamp": "2024-01-01T00:00:00Z",
+            "labels": {"app": app},
+        },
+        "spec": spec,
+        "status": status or {"replicas": 0, "availableReplicas": 0},
+    }
+
+
+def test_scan_selector_narrows_reported_objects(harness):
+    template = {
+        "metadata": {"labels": {"app": "web"}},
+        "spec": {"containers": [{"name": "app"}]},
+    }
+    for app in ("web", "db"):
+        selector = {"matchLabels": {"app": app}}
+        harness.k8s_cluster.add_pods(
+            _labeled_workload(
+                "pod",
+                app,
+                status={"phase": "Running", "containerStatuses": []},
+                containers=[{"name": "app"}],
+                volumes=[],
+            )
+        )
+        harness.k8s_cluster.add_deployments(
+            _labeled_workload(
+                "deployment", app, replicas=0, selector=selector, template=template
+            )
+        )
+        harness.k8s_cluster.add_statefulsets(
+            _labeled_workload(
+                "statefulset",
+                app,
+                replicas=0,
+                serviceName=f"{app}-service",
+                selector=selector,
+                template=template,
+            )
+        )
+        harness.k8s_cluster.add_daemonsets(
+            _labeled_workload(
+                "daemonset",
+                app,
+                status={
+                    "currentNumberScheduled": 0,
+                    "desiredNumberScheduled": 0,
+                    "numberMisscheduled": 0,
+                    "numberReady": 0,
+                },
+                selector=selector,
+                template=template,
+            )
+        )
+        harness.k8s_cluster.add_services(
+            _labeled_workload("service", app, selector={"app": app})
+        )
+
+    # every kind is looked up by some check of the full scan too
+    options = unctl_process_args(["k8s", "--selector", "app=web"])
+    with patch("builtins.input", return_value="n"):
+        results, _, _ = harness.run_unctl(options=options)
+
+    reported = {
+        report.resource_name
+        for reports in results.values()
+        for report in reports
+        if report.resource_namespace
+    }
+    assert reported == {
+        "web-pod",
+        "web-deployment",
+        "web-statefulset",
+        "web-daemonset",
+        "web-service",
+    }
+
+
+def test_incremental_scan_with_another_selector(harness, tmp_path):
+    harness.k8s_cluster.add_pods(
+        *(
+            _labeled_workload("pod", app, status={"phase": "Running"}, containers=[])
+            for app in ("web", "db")
+        )
+    )
+    state_path = str(tmp_path / "state.json")
+
+    for app in ("web", "db"):
+        options = unctl_process_args(
+            [
+                "k8s",
+                "--incremental",
+                state_path,
+                "--selector",
+                f"app={app}",
+                "-c",
+                "k8s_pods_pending",
+                # looks pods up, so all of them are listed
+                "k8s_daemonset_unused",
+            ]
+        )
+        with patch("builtins.input", return_value="n"):
+            results, _, _ = harness.run_unctl(options=options)
+
+        reported = [report.resource_name for report in results["k8s_pods_pending"]]
+        assert reported == [f"{app}-pod"]
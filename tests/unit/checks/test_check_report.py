@@ -0,0 +1,25 @@
+import pytest
+from pydantic import ValidationError
+
+from unctl.checks.k8s.k8s_pods_pending.k8s_pods_pending import k8s_pods_pending
+from unctl.lib.checks.k8s import CheckReportK8s
+
+
+def test_reports_share_check_metadata():
+    check = k8s_pods_pending()
+
+    first = CheckReportK8s(check.report_metadata)
+    second = CheckReportK8s(check.report_metadata)
+
+    assert first.check_metadata is second.check_metadata
+    assert first.check_metadata.CheckID == "k8s_pods_pending"
+    with pytest.raises(ValidationError):
+        first.check_metadata.Severity = "Low"
+
+
+def test_report_accepts_metadata_json():
+    check = k8s_pods_pending()
+
+    report = CheckReportK8s(check.metadata())
+
+    assert report.check_metadata.model_dump() == check.report_metadata.model_dump()
@@ -0,0 +1,72 @@
+import json
+from unittest.mock import patch
+
+import pytest
+
+from unctl import list as checks_list
+from unctl.checks.k8s.k8s_pods_pending.k8s_pods_pending import k8s_pods_pending
+from unctl.list import MANIFEST_PATH, build_manifest, discover_checks, load_checks
+
+
+@pytest.fixture
+def uncached():
+    checks_list._all_checks.cache_clear()
+    checks_list._checks_by_module.cache_clear()
+    yield
+    checks_list._all_checks.cache_clear()
+    checks_list._checks_by_module.cache_clear()
+
+
+def _summary(checks):
+    return [(check.module, check.check_metadata.model_dump()) for check in checks]
+
+
+def test_manifest_is_up_to_date():
+    with open(MANIFEST_PATH) as manifest_file:
+        manifest = json.load(manifest_file)
+    assert manifest == build_manifest(), (
+        "checks changed, regenerate the manifest with "
+        "`python scripts/update_checks_list.py`"
+    )
+
+
+@pytest.mark.parametrize(
+    "filters",
+    [
+        {},
+        {"provider": "k8s"},
+        {"provider": "mysql"},
+        {"categories": ["Pod"]},
+        {"services": ["pod"], "checks": ["k8s_pods_pending"]},
+    ],
+)
+def test_manifest_checks_match_discovered_ones(filters):
+    def selected(metadata):
+        return (
+            metadata.Provider == filters.get("provider", metadata.Provider)
+            and (
+                "categories" not in filters
+                or set(filters["categories"]) & set(metadata.Categories)
+            )
+            and metadata.ServiceName in filters.get("services", [metadata.ServiceName])
+            and metadata.CheckID in filters.get("checks", [metadata.CheckID])
+        )
+
+    discovered = [
+        check for check in discover_checks() if selected(check.check_metadata)
+    ]
+    assert len(discovered) > 0
+    assert _summary(load_checks(**filters)) == _summary(discovered)
+
+
+def test_checks_are_discovered_without_manifest(uncached, tmp_path):
+    with patch.object(checks_list, "MANIFEST_PATH", str(tmp_path / "missing.json")):
+        assert _summary(load_checks()) == _summary(discover_checks())
+
+
+def test_check_metadata_is_read_from_manifest(uncached):
+    load_checks()
+    with patch("builtins.open", side_effect=AssertionError("file was read")):
+        check = k8s_pods_pending()
+    assert check.CheckID == "k8s_pods_pending"
+    assert check.Resources == ["pods"]
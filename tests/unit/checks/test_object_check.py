@@ -0,0 +1,41 @@
+from unittest.mock import MagicMock
+
+from kubernetes_asyncio.client import V1ObjectMeta, V1Pod, V1PodStatus
+
+from unctl.checks.k8s.k8s_pod_crashloopbackoff.k8s_pod_crashloopbackoff import (
+    k8s_pod_crashloopbackoff,
+)
+from unctl.checks.k8s.k8s_pod_high_restart_count.k8s_pod_high_restart_count import (
+    k8s_pod_high_restart_count,
+)
+from unctl.lib.checks.check import evaluate_objects
+from unctl.scanrkube import KubernetesData
+
+
+def _data():
+    return KubernetesData(
+        pods=[
+            V1Pod(
+                metadata=V1ObjectMeta(name=f"pod-{i}", namespace="test_ns"),
+                status=V1PodStatus(phase="Running"),
+            )
+            for i in range(3)
+        ]
+    )
+
+
+def _summary(reports):
+    return [(report.resource_name, report.status) for report in reports]
+
+
+def test_evaluate_objects_walks_objects_once():
+    checks = [k8s_pod_crashloopbackoff(), k8s_pod_high_restart_count()]
+    data = _data()
+    data.get_reported = MagicMock(wraps=data.get_reported)
+
+    findings = evaluate_objects(checks, data)
+
+    data.get_reported.assert_called_once_with("pods")
+    assert [_summary(reports) for reports in findings] == [
+        _summary(check.execute(_data())) for check in checks
+    ]
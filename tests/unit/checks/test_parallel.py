@@ -0,0 +1,151 @@
+import asyncio
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes_asyncio.client import (
+    V1Deployment,
+    V1DeploymentSpec,
+    V1LabelSelector,
+    V1ObjectMeta,
+    V1Pod,
+    V1PodCondition,
+    V1PodStatus,
+    V1PodTemplateSpec,
+)
+
+from unctl.checks.k8s.k8s_deployment_zero_scale.k8s_deployment_zero_scale import (
+    k8s_deployment_zero_scale,
+)
+from unctl.checks.k8s.k8s_pod_crashloopbackoff.k8s_pod_crashloopbackoff import (
+    k8s_pod_crashloopbackoff,
+)
+from unctl.checks.k8s.k8s_pods_pending.k8s_pods_pending import k8s_pods_pending
+from unctl.scanrkube import DataCollector, KubernetesData, ResourceChecker
+
+
+class StaticCollector(DataCollector):
+    def __init__(self, data):
+        self._data = data
+
+    async def fetch_data(self, resources=None):
+        return self._data
+
+
+def _data(loader=None):
+    return KubernetesData(
+        loader=loader,
+        pods=[
+            V1Pod(
+                metadata=V1ObjectMeta(name=f"pod-{i}", namespace="test_ns"),
+                status=V1PodStatus(
+                    phase="Pending" if i % 2 else "Running",
+                    conditions=[
+                        V1PodCondition(
+                            type="PodScheduled", status="False", reason="Unschedulable"
+                        )
+                    ],
+                ),
+            )
+            for i in range(10)
+        ],
+        deployments=[
+            V1Deployment(
+                metadata=V1ObjectMeta(name=f"deployment-{i}", namespace="test_ns"),
+                spec=V1DeploymentSpec(
+                    replicas=i,
+                    selector=V1LabelSelector(),
+                    template=V1PodTemplateSpec(),
+                ),
+            )
+            for i in range(3)
+        ],
+    )
+
+
+async def _scan(parallel):
+    checks = [
+        k8s_pods_pending(),
+        k8s_deployment_zero_scale(),
+        k8s_pod_crashloopbackoff(),
+    ]
+    display = MagicMock()
+    app = ResourceChecker(
+        display, StaticCollector(_data()), checks, "k8s", parallel=parallel
+    )
+    reports = await app.execute()
+    return checks, display, reports
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parallel", [1, 4])
+async def test_parallel_scan_matches_sequential(parallel):
+    _, _, expected = await _scan(None)
+    checks, display, reports = await _scan(parallel)
+
+    assert list(reports) == [
+        "k8s_pods_pending",
+        "k8s_deployment_zero_scale",
+        "k8s_pod_crashloopbackoff",
+    ]
+    for name, check in zip(reports, checks):
+        assert [(report.resource_name, report.status) for report in reports[name]] == [
+            (report.resource_name, report.status) for report in expected[name]
+        ]
+        assert all(
+            report.check_metadata is check.report_metadata for report in reports[name]
+        )
+    assert display.display_progress_bar.call_count == len(checks)
+    assert display.display_progress_bar.call_args.args[0] == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("parallel", [None, 4])
+async def test_partial_scan_reports_failing_checks_as_errored(parallel):
+    checks = [k8s_pods_pending(), k8s_pod_crashloopbackoff()]
+    app = ResourceChecker(
+        MagicMock(),
+        StaticCollector(_data()),
+        checks,
+        "k8s",
+        parallel=parallel,
+        partial=True,
+    )
+    with patch.object(
+        k8s_pod_crashloopbackoff, "evaluate", side_effect=KeyError("status")
+    ):
+        reports = await app.execute()
+
+    assert len(reports["k8s_pods_pending"]) == 10
+    assert not any(report.errored for report in reports["k8s_pods_pending"])
+    (report,) = reports["k8s_pod_crashloopbackoff"]
+    assert (report.status, report.status_extended) == (
+        "ERROR",
+        "Failed to run: 'status'",
+    )
+    assert app.errored_reports == [report]
+
+
+@pytest.mark.asyncio
+async def test_parallel_scan_reports_undeclared_resources_as_errored():
+    async def loader(kind):
+        return []
+
+    def prepare(data):
+        return data.get("nodes")
+
+    app = ResourceChecker(
+        MagicMock(),
+        StaticCollector(_data(loader)),
+        [k8s_pods_pending(), k8s_pod_crashloopbackoff()],
+        "k8s",
+        parallel=4,
+        partial=True,
+    )
+    with patch.object(k8s_pod_crashloopbackoff, "prepare", side_effect=prepare):
+        # the worker must not wait for the parent's event loop forever
+        reports = await asyncio.wait_for(app.execute(), 30)
+
+    assert len(reports["k8s_pods_pending"]) == 10
+    (report,) = reports["k8s_pod_crashloopbackoff"]
+    assert report.errored
+    assert "nodes were not collected" in report.status_extended
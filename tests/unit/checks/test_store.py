@@ -0,0 +1,40 @@
+import pytest
+
+from unctl.checks.k8s.k8s_pods_pending.k8s_pods_pending import k8s_pods_pending
+from unctl.lib.checks.k8s import CheckReportK8s
+from unctl.lib.checks.store import ReportColumns, ReportStore
+
+
+def _report(check, name, status):
+    report = CheckReportK8s(check.report_metadata)
+    report.resource_name = name
+    report.resource_namespace = "".join(["test", "_ns"])
+    report.status = status
+    return report
+
+
+def test_report_columns_rebuild_reports():
+    check = k8s_pods_pending()
+    reports = [_report(check, "a", "PASS"), _report(check, "b", "FAIL")]
+
+    columns = ReportColumns(reports)
+
+    assert len(columns) == 2
+    assert list(columns) == reports
+    assert columns[-1] == reports[1]
+    assert columns[:1] == reports[:1]
+    assert columns[0].check_metadata is check.report_metadata
+    assert columns[0].resource_namespace is columns[1].resource_namespace
+    with pytest.raises(IndexError):
+        columns[2]
+
+
+def test_report_store():
+    check = k8s_pods_pending()
+    store = ReportStore()
+
+    store["k8s_pods_pending"] = [_report(check, "a", "FAIL")]
+
+    assert list(store) == ["k8s_pods_pending"]
+    assert isinstance(store["k8s_pods_pending"], ReportColumns)
+    assert [report.resource_name for report in store["k8s_pods_pending"]] == ["a"]
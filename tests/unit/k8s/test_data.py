@@ -0,0 +1,74 @@
+from kubernetes_asyncio.client import (
+    V1ObjectMeta,
+    V1OwnerReference,
+    V1Pod,
+    V1PodSpec,
+    V1Service,
+)
+
+from unctl.scanrkube import KubernetesData
+
+
+def _pod(name, namespace="test_ns", labels=None, node=None, owner=None):
+    owners = None
+    if owner:
+        owners = [
+            V1OwnerReference(api_version="v1", kind="DaemonSet", name=owner, uid=owner)
+        ]
+    return V1Pod(
+        metadata=V1ObjectMeta(
+            name=name, namespace=namespace, labels=labels, owner_references=owners
+        ),
+        spec=V1PodSpec(containers=[], node_name=node),
+    )
+
+
+def _names(items):
+    return sorted(item.metadata.name for item in items)
+
+
+def test_get_by_name():
+    service = V1Service(metadata=V1ObjectMeta(name="test", namespace="test_ns"))
+    data = KubernetesData(services=[service])
+
+    assert data.get_by_name("services", "test_ns", "test") is service
+    assert data.get_by_name("services", "other_ns", "test") is None
+
+
+def test_get_by_owner_and_node():
+    data = KubernetesData(
+        pods=[
+            _pod("a", node="node1", owner="ds1"),
+            _pod("b", node="node1", owner="ds2"),
+            _pod("c", node="node2"),
+        ]
+    )
+
+    assert _names(data.get_by_owner("pods", "ds1")) == ["a"]
+    assert data.get_by_owner("pods", "unknown") == []
+    assert _names(data.get_by_node("pods", "node1")) == ["a", "b"]
+    assert data.get_by_node("pods", "node3") == []
+
+
+def test_get_by_selector():
+    data = KubernetesData(
+        pods=[
+            _pod("a", labels={"app": "web"}),
+            _pod("b", namespace="other_ns", labels={"app": "web"}),
+        ]
+    )
+
+    assert _names(data.get_by_selector("pods", {"app": "web"})) == ["a", "b"]
+    assert _names(
+        data.get_by_selector("pods", {"app": "web"}, namespace="other_ns")
+    ) == ["b"]
+
+
+def test_replaced_data_has_own_indexes():
+    data = KubernetesData(pods=[_pod("a", node="node1")])
+    assert _names(data.get_by_node("pods", "node1")) == ["a"]
+
+    replaced = data.replace(pods=[_pod("b", node="node1")])
+
+    assert _names(replaced.get_by_node("pods", "node1")) == ["b"]
+    assert _names(data.get_by_node("pods", "node1")) == ["a"]
@@ -0,0 +1,67 @@
+from datetime import datetime, timedelta, timezone
+
+from unctl.lib.k8s.events import EventAggregator, matches_field_selector
+
+NOW = datetime(2024, 1, 1, 12, tzinfo=timezone.utc)
+
+
+def _event(name, reason="BackOff", kind="Pod", age=0, count=1, type="Warning"):
+    return {
+        "metadata": {"name": f"{name}.{reason}", "namespace": "test_ns"},
+        "involvedObject": {
+            "kind": kind,
+            "name": name,
+            "namespace": "test_ns",
+            "uid": f"{name}-uid",
+        },
+        "type": type,
+        "reason": reason,
+        "count": count,
+        "lastTimestamp": (NOW - timedelta(minutes=age)).isoformat(),
+    }
+
+
+def test_field_selector_matching():
+    event = _event("pod")
+    assert matches_field_selector(event, None)
+    assert matches_field_selector(event, "type=Warning,involvedObject.kind=Pod")
+    assert matches_field_selector(event, "type==Warning")
+    assert not matches_field_selector(event, "type!=Warning")
+    assert not matches_field_selector(event, "involvedObject.kind=Node")
+    assert not matches_field_selector(event, "series.count=1")
+
+
+def test_events_are_summarized_per_object():
+    aggregator = EventAggregator(now=NOW)
+    aggregator.add([_event("pod-a", count=3, age=10), _event("pod-b")])
+    aggregator.add(
+        [
+            _event("pod-a", reason="Unhealthy", age=5),
+            {**_event("pod-a", age=20), "count": None, "series": {"count": 4}},
+        ]
+    )
+
+    summaries = {summary.name: summary for summary in aggregator.summaries()}
+    assert summaries.keys() == {"pod-a", "pod-b"}
+    pod_a = summaries["pod-a"]
+    assert pod_a.reasons == {"BackOff": 7, "Unhealthy": 1}
+    assert pod_a.count == 8
+    assert pod_a.last_timestamp == NOW - timedelta(minutes=5)
+    assert pod_a.metadata.name == "Pod/pod-a"
+    assert pod_a.metadata.uid == "pod-a-uid"
+
+
+def test_events_are_filtered_by_selector_and_window():
+    aggregator = EventAggregator(
+        "type=Warning,involvedObject.kind=Pod", window=timedelta(hours=1), now=NOW
+    )
+    aggregator.add(
+        [
+            _event("recent", age=59),
+            _event("old", age=61),
+            _event("normal", type="Normal"),
+            _event("node", kind="Node"),
+        ]
+    )
+
+    assert [summary.name for summary in aggregator.summaries()] == ["recent"]
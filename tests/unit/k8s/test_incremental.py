@@ -0,0 +1,205 @@
+import json
+from datetime import datetime, timedelta, timezone
+from unittest.mock import patch
+
+import pytest
+from kubernetes_asyncio.client import (
+    V1ConfigMap,
+    V1ConfigMapVolumeSource,
+    V1DaemonSet,
+    V1ObjectMeta,
+    V1Pod,
+    V1PodCondition,
+    V1PodSpec,
+    V1PodStatus,
+    V1Volume,
+)
+
+from unctl.checks.k8s.k8s_pod_configmap_existence.k8s_pod_configmap_existence import (
+    k8s_pod_configmap_existence,
+)
+from unctl.checks.k8s.k8s_daemonset_unused.k8s_daemonset_unused import (
+    k8s_daemonset_unused,
+)
+from unctl.checks.k8s.k8s_pods_pending.k8s_pods_pending import k8s_pods_pending
+from unctl.lib.k8s.incremental import IncrementalScan
+from unctl.scanrkube import KubernetesData
+
+
+def _pod(name, namespace="test_ns", version="1", phase="Running", configmap=None):
+    volumes = []
+    if configmap:
+        volumes.append(
+            V1Volume(name="config", config_map=V1ConfigMapVolumeSource(name=configmap))
+        )
+    return V1Pod(
+        metadata=V1ObjectMeta(
+            name=name, namespace=namespace, resource_version=version, uid=name
+        ),
+        spec=V1PodSpec(containers=[], volumes=volumes),
+        status=V1PodStatus(
+            phase=phase,
+            conditions=[
+                V1PodCondition(type="PodScheduled", status="False", reason="Test")
+            ],
+        ),
+    )
+
+
+def _configmap(name, namespace="test_ns", version="1"):
+    return V1ConfigMap(
+        metadata=V1ObjectMeta(name=name, namespace=namespace, resource_version=version)
+    )
+
+
+class CheckRunner:
+    def __init__(self):
+        self.evaluated = []
+
+    async def __call__(self, check, data):
+        self.evaluated.extend(pod.metadata.name for pod in data.get_pods())
+        return check.execute(data)
+
+
+async def _scan(state_path, check, source=None, **resources):
+    incremental = IncrementalScan(state_path)
+    data = KubernetesData(**resources)
+    incremental.track(data, source=source or {"cluster": "https://test"})
+    runner = CheckRunner()
+    reports = await incremental.run(check, data, runner)
+    incremental.save()
+    statuses = {report.resource_name: report.status for report in reports}
+    return statuses, runner.evaluated
+
+
+@pytest.mark.asyncio
+async def test_incremental_scan_reevaluates_changed_objects_only(tmp_path):
+    state_path = tmp_path / "state.json"
+    check = k8s_pods_pending()
+
+    statuses, evaluated = await _scan(
+        state_path, check, pods=[_pod("a"), _pod("b"), _pod("c")]
+    )
+    assert statuses == {"a": "PASS", "b": "PASS", "c": "PASS"}
+    assert evaluated == ["a", "b", "c"]
+
+    # nothing changed
+    statuses, evaluated = await _scan(
+        state_path, check, pods=[_pod("a"), _pod("b"), _pod("c")]
+    )
+    assert statuses == {"a": "PASS", "b": "PASS", "c": "PASS"}
+    assert evaluated == []
+
+    # `b` changed, `c` deleted, `d` added
+    statuses, evaluated = await _scan(
+        state_path,
+        check,
+        pods=[_pod("a"), _pod("b", version="2", phase="Pending"), _pod("d")],
+    )
+    assert statuses == {"a": "PASS", "b": "FAIL", "d": "PASS"}
+    assert sorted(evaluated) == ["b", "d"]
+
+
+@pytest.mark.asyncio
+async def test_incremental_scan_reevaluates_dependents(tmp_path):
+    state_path = tmp_path / "state.json"
+    check = k8s_pod_configmap_existence()
+    pods = [
+        _pod("a", configmap="config"),
+        _pod("b", namespace="other_ns", configmap="config"),
+    ]
+    configmaps = [_configmap("config"), _configmap("config", namespace="other_ns")]
+
+    await _scan(state_path, check, pods=pods, configmaps_metadata=configmaps)
+
+    # configmap of `a` is gone, `b` is not affected
+    statuses, evaluated = await _scan(
+        state_path, check, pods=pods, configmaps_metadata=configmaps[1:]
+    )
+    assert statuses == {"a": "FAIL", "b": "PASS"}
+    assert evaluated == ["a"]
+
+
+@pytest.mark.asyncio
+async def test_incremental_scan_ignores_state_of_other_checks(tmp_path):
+    state_path = tmp_path / "state.json"
+    pods = [_pod("a"), _pod("b", configmap="config")]
+
+    await _scan(state_path, k8s_pods_pending(), pods=pods)
+    statuses, evaluated = await _scan(
+        state_path, k8s_pod_configmap_existence(), pods=pods, configmaps_metadata=[]
+    )
+
+    assert statuses == {"a": "PASS", "b": "FAIL"}
+    assert evaluated == ["a", "b"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    "source",
+    [
+        {"cluster": "https://other"},
+        {"cluster": "https://test", "namespaces": ["test_ns"], "selector": None},
+        {"cluster": "https://test", "namespaces": [], "selector": "app=web"},
+    ],
+    ids=["cluster", "namespaces", "selector"],
+)
+async def test_incremental_scan_ignores_state_of_other_sources(tmp_path, source):
+    state_path = tmp_path / "state.json"
+    check = k8s_pods_pending()
+
+    await _scan(state_path, check, pods=[_pod("a", phase="Pending")])
+    # same object, but scanned from another cluster or its other slice
+    statuses, evaluated = await _scan(state_path, check, source, pods=[_pod("a")])
+
+    assert statuses == {"a": "PASS"}
+    assert evaluated == ["a"]
+    with open(state_path) as state_file:
+        assert json.load(state_file)["source"] == source
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("content", ["", '{"version": 1, "unc', "[]"])
+async def test_incremental_scan_ignores_unreadable_state(tmp_path, content):
+    state_path = tmp_path / "state.json"
+    state_path.write_text(content)
+
+    statuses, evaluated = await _scan(state_path, k8s_pods_pending(), pods=[_pod("a")])
+
+    assert statuses == {"a": "PASS"}
+    assert evaluated == ["a"]
+    assert list(tmp_path.iterdir()) == [state_path]
+    with open(state_path) as state_file:
+        assert json.load(state_file)["resources"]
+
+
+class _TwoDaysLater(datetime):
+    @classmethod
+    def now(cls, tz=None):
+        return datetime.now(tz) + timedelta(days=2)
+
+
+@pytest.mark.asyncio
+async def test_incremental_scan_reruns_time_dependent_checks(tmp_path):
+    state_path = tmp_path / "state.json"
+    check = k8s_daemonset_unused()
+    created = datetime.now(timezone.utc) - timedelta(days=30)
+    daemonsets = [
+        V1DaemonSet(
+            metadata=V1ObjectMeta(
+                name="ds",
+                namespace="test_ns",
+                uid="ds",
+                resource_version="1",
+                creation_timestamp=created,
+            )
+        )
+    ]
+
+    statuses, _ = await _scan(state_path, check, daemonsets=daemonsets, pods=[])
+    assert statuses == {"ds": "PASS"}
+
+    # nothing changed but the age of the daemonset
+    with patch(f"{k8s_daemonset_unused.__module__}.datetime", _TwoDaysLater):
+        statuses, _ = await _scan(state_path, check, daemonsets=daemonsets, pods=[])
+    assert statuses == {"ds": "FAIL"}
@@ -0,0 +1,83 @@
+from datetime import datetime, timezone
+
+import pytest
+from kubernetes_asyncio.client import V1ObjectMeta, V1Pod, V1PodSpec
+
+from unctl.lib.k8s.objects import K8sObject, to_json
+
+RAW_POD = {
+    "apiVersion": "v1",
+    "kind": "Pod",
+    "metadata": {
+        "name": "test_pod",
+        "namespace": "test_ns",
+        "labels": {"app": "test"},
+        "creationTimestamp": "2024-01-02T03:04:05Z",
+        "ownerReferences": [{"kind": "DaemonSet", "name": "test_ds", "uid": "1"}],
+    },
+    "spec": {
+        "nodeName": "test_node",
+        "containers": [
+            {
+                "name": "test_container",
+                "resources": {"limits": {"cpu": "100m"}},
+                "ports": [{"containerPort": 8080}],
+            }
+        ],
+    },
+}
+
+
+def test_k8s_object_mirrors_openapi_model_attributes():
+    pod = K8sObject(RAW_POD, V1Pod)
+
+    assert pod.metadata.name == "test_pod"
+    assert pod.metadata.labels == {"app": "test"}
+    assert pod.metadata.creation_timestamp == datetime(
+        2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc
+    )
+    assert pod.metadata.owner_references[0].kind == "DaemonSet"
+    assert pod.spec.node_name == "test_node"
+
+    (container,) = pod.spec.containers
+    assert container.resources.limits["cpu"] == "100m"
+    assert container.ports[0].container_port == 8080
+
+    # fields missing from JSON are None, same as for models
+    assert pod.status is None
+    assert container.env is None
+
+
+def test_k8s_object_unknown_attribute():
+    pod = K8sObject(RAW_POD, V1Pod)
+
+    assert not hasattr(pod, "unknown")
+    with pytest.raises(AttributeError, match="V1Pod"):
+        pod.unknown
+
+
+def test_k8s_object_memoizes_converted_values():
+    pod = K8sObject(RAW_POD, V1Pod)
+
+    assert pod.metadata is pod.metadata
+    assert pod.spec.containers is pod.spec.containers
+    assert pod.to_dict() is RAW_POD
+
+
+def test_to_json_restores_api_json():
+    pod = V1Pod(
+        metadata=V1ObjectMeta(
+            name="test_pod",
+            creation_timestamp=datetime(2024, 1, 2, 3, 4, 5, tzinfo=timezone.utc),
+        ),
+        spec=V1PodSpec(node_name="test_node", containers=[]),
+    )
+
+    assert to_json(pod) == {
+        "metadata": {
+            "name": "test_pod",
+            "creationTimestamp": "2024-01-02T03:04:05+00:00",
+        },
+        "spec": {"nodeName": "test_node", "containers": []},
+    }
+    assert to_json(K8sObject(RAW_POD, V1Pod)) is RAW_POD
@@ -0,0 +1,108 @@
+import asyncio
+from unittest.mock import patch
+
+import pytest
+from kubernetes_asyncio.client.rest import ApiException
+
+from unctl.lib.k8s.scheduler import RequestScheduler
+
+
+def _throttled(retry_after=None):
+    error = ApiException(status=429, reason="Too Many Requests")
+    error.headers = {"Retry-After": retry_after} if retry_after else {}
+    return error
+
+
+class FlakyRequest:
+    def __init__(self, *failures):
+        self.failures = list(failures)
+        self.calls = 0
+
+    async def __call__(self):
+        self.calls += 1
+        if self.failures:
+            failure = self.failures.pop(0)
+            if failure is None:
+                # never responds
+                await asyncio.Event().wait()
+            raise failure
+        return "done"
+
+
+@pytest.fixture
+def sleeps():
+    delays = []
+    sleep = asyncio.sleep
+
+    async def record(delay):
+        delays.append(delay)
+        await sleep(0)
+
+    with patch("unctl.lib.k8s.scheduler.asyncio.sleep", record):
+        yield delays
+
+
+@pytest.mark.asyncio
+async def test_throttled_requests_are_retried_after_requested_delay(sleeps):
+    request = FlakyRequest(_throttled("7"), _throttled())
+    result = await RequestScheduler(retries=2).run(request)
+
+    assert result == "done"
+    assert request.calls == 3
+    assert sleeps[0] == 7
+    # without Retry-After the second retry backs off for 0.5-1s
+    assert 0.5 <= sleeps[1] <= 1
+
+
+@pytest.mark.asyncio
+async def test_backoff_grows_exponentially(sleeps):
+    request = FlakyRequest(*(_throttled() for _ in range(4)))
+    await RequestScheduler(retries=4).run(request)
+
+    assert len(sleeps) == 4
+    assert all(
+        RequestScheduler.BACKOFF_BASE * 2**attempt / 2
+        <= delay
+        <= RequestScheduler.BACKOFF_BASE * 2**attempt
+        for attempt, delay in enumerate(sleeps)
+    )
+
+
+@pytest.mark.asyncio
+async def test_retries_give_up_eventually(sleeps):
+    request = FlakyRequest(*(_throttled() for _ in range(3)))
+    with pytest.raises(ApiException):
+        await RequestScheduler(retries=2).run(request)
+    assert request.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_client_errors_are_not_retried(sleeps):
+    request = FlakyRequest(ApiException(status=403, reason="Forbidden"))
+    with pytest.raises(ApiException):
+        await RequestScheduler(retries=5).run(request)
+    assert request.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_timed_out_requests_are_retried(sleeps):
+    request = FlakyRequest(None)
+    assert await RequestScheduler(timeout=0.01, retries=1).run(request) == "done"
+    assert request.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_concurrency_is_limited():
+    running = 0
+    most_running = 0
+
+    async def request():
+        nonlocal running, most_running
+        running += 1
+        most_running = max(most_running, running)
+        await asyncio.sleep(0.01)
+        running -= 1
+
+    scheduler = RequestScheduler(concurrency=3)
+    await asyncio.gather(*(scheduler.run(request) for _ in range(10)))
+    assert most_running == 3
@@ -0,0 +1,109 @@
+import pytest
+from kubernetes_asyncio.client import (
+    V1LabelSelector,
+    V1LabelSelectorRequirement,
+    V1ObjectMeta,
+    V1Pod,
+)
+
+from unctl.lib.k8s.selectors import LabelSelectorIndex, matches_label_selector
+
+PODS = [
+    V1Pod(metadata=V1ObjectMeta(name=name, namespace=namespace, labels=labels))
+    for name, namespace, labels in (
+        ("web", "test_ns", {"app": "web", "tier": "frontend"}),
+        ("api", "test_ns", {"app": "api", "tier": "backend"}),
+        ("db", "test_ns", {"app": "db"}),
+        ("other_web", "other_ns", {"app": "web", "tier": "frontend"}),
+        ("unlabeled", "test_ns", None),
+    )
+]
+
+
+def _select(selector, namespace=None):
+    index = LabelSelectorIndex(PODS)
+    return [pod.metadata.name for pod in index.select(selector, namespace)]
+
+
+def _expression(key, operator, values=None):
+    return V1LabelSelectorRequirement(key=key, operator=operator, values=values)
+
+
+@pytest.mark.parametrize(
+    ["selector", "namespace", "expected"],
+    [
+        ({"app": "web"}, None, ["web", "other_web"]),
+        ({"app": "web"}, "test_ns", ["web"]),
+        ({"app": "web", "tier": "backend"}, None, []),
+        ({"app": "unknown"}, None, []),
+        ({}, "other_ns", ["other_web"]),
+        (V1LabelSelector(), "test_ns", ["web", "api", "db", "unlabeled"]),
+        (
+            V1LabelSelector(match_labels={"tier": "frontend"}),
+            "test_ns",
+            ["web"],
+        ),
+        (
+            V1LabelSelector(
+                match_expressions=[_expression("app", "In", ["api", "db"])]
+            ),
+            None,
+            ["api", "db"],
+        ),
+        (
+            V1LabelSelector(
+                match_expressions=[_expression("app", "NotIn", ["web", "api"])]
+            ),
+            "test_ns",
+            ["db", "unlabeled"],
+        ),
+        (
+            V1LabelSelector(match_expressions=[_expression("tier", "Exists")]),
+            "test_ns",
+            ["web", "api"],
+        ),
+        (
+            V1LabelSelector(
+                match_labels={"app": "web"},
+                match_expressions=[_expression("tier", "DoesNotExist")],
+            ),
+            None,
+            [],
+        ),
+        (
+            V1LabelSelector(match_expressions=[_expression("tier", "DoesNotExist")]),
+            None,
+            ["db", "unlabeled"],
+        ),
+    ],
+)
+def test_label_selector_index(selector, namespace, expected):
+    assert _select(selector, namespace) == expected
+
+
+def test_label_selector_index_unknown_operator():
+    selector = V1LabelSelector(match_expressions=[_expression("app", "Unknown")])
+
+    with pytest.raises(ValueError, match="Unknown"):
+        _select(selector)
+
+
+@pytest.mark.parametrize(
+    ["selector", "expected"],
+    [
+        ("", ["web", "api", "db", "other_web", "unlabeled"]),
+        ("app=web", ["web", "other_web"]),
+        ("app==web,tier=frontend", ["web", "other_web"]),
+        ("app!=web", ["api", "db", "unlabeled"]),
+        ("tier", ["web", "api", "other_web"]),
+        ("!tier", ["db", "unlabeled"]),
+        ("app in (api, db)", ["api", "db"]),
+        ("app notin (api,db),tier", ["web", "other_web"]),
+    ],
+)
+def test_matches_label_selector(selector, expected):
+    assert [
+        pod.metadata.name
+        for pod in PODS
+        if matches_label_selector(pod.metadata.labels, selector)
+    ] == expected
@@ -0,0 +1,133 @@
+import asyncio
+from types import SimpleNamespace
+
+import pytest
+from kubernetes_asyncio.client.rest import ApiException
+
+from unctl.lib.k8s.watch import WatchCache
+
+
+def _pod(name, version="1"):
+    return SimpleNamespace(
+        metadata=SimpleNamespace(namespace="test_ns", name=name, version=version)
+    )
+
+
+class FakeApiServer:
+    def __init__(self, items, resource_version="1"):
+        self.items = items
+        self.resource_version = resource_version
+        self.lists = 0
+        self.watches = []
+        self.events = asyncio.Queue()
+
+    async def list(self, kind):
+        self.lists += 1
+        return list(self.items), self.resource_version
+
+    async def watch(self, kind, resource_version):
+        self.watches.append(resource_version)
+        while True:
+            event = await self.events.get()
+            if event is None:
+                # server closed the watch
+                return
+            if isinstance(event, Exception):
+                raise event
+            yield event
+
+    async def drain(self):
+        while not self.events.empty():
+            await asyncio.sleep(0)
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_watch_cache_lists_kind_once():
+    server = FakeApiServer([_pod("a"), _pod("b")])
+    cache = WatchCache(server.list, server.watch)
+
+    first = await cache.get("pods")
+    second = await cache.get("pods")
+    await cache.close()
+
+    assert [pod.metadata.name for pod in first] == ["a", "b"]
+    assert [pod.metadata.name for pod in second] == ["a", "b"]
+    assert server.lists == 1
+
+
+@pytest.mark.asyncio
+async def test_watch_cache_applies_events():
+    server = FakeApiServer([_pod("a"), _pod("b")])
+    cache = WatchCache(server.list, server.watch)
+    await cache.get("pods")
+
+    server.events.put_nowait(("ADDED", _pod("c"), "2"))
+    server.events.put_nowait(("MODIFIED", _pod("a", version="3"), "3"))
+    server.events.put_nowait(("DELETED", _pod("b"), "4"))
+    server.events.put_nowait(("BOOKMARK", None, "5"))
+    await server.drain()
+    pods = await cache.get("pods")
+    await cache.close()
+
+    assert {pod.metadata.name: pod.metadata.version for pod in pods} == {
+        "a": "3",
+        "c": "1",
+    }
+    assert cache.resource_version("pods") == "5"
+    assert server.lists == 1
+
+
+@pytest.mark.asyncio
+async def test_watch_cache_resumes_closed_watch_from_last_version():
+    server = FakeApiServer([_pod("a")])
+    cache = WatchCache(server.list, server.watch)
+    await cache.get("pods")
+
+    server.events.put_nowait(("BOOKMARK", None, "7"))
+    server.events.put_nowait(None)
+    await server.drain()
+    await cache.close()
+
+    assert server.watches == ["1", "7"]
+    assert server.lists == 1
+
+
+@pytest.mark.asyncio
+async def test_watch_cache_relists_on_gone():
+    server = FakeApiServer([_pod("a")])
+    cache = WatchCache(server.list, server.watch)
+    await cache.get("pods")
+
+    server.items = [_pod("b")]
+    server.resource_version = "10"
+    server.events.put_nowait(ApiException(status=410, reason="Gone"))
+    await server.drain()
+    pods = await cache.get("pods")
+    await cache.close()
+
+    assert [pod.metadata.name for pod in pods] == ["b"]
+    assert server.lists == 2
+    assert server.watches == ["1", "10"]
+
+
+@pytest.mark.asyncio
+async def test_watch_cache_retries_failed_initial_list():
+    calls = []
+
+    async def flaky_list(kind):
+        calls.append(kind)
+        if len(calls) == 1:
+            raise ApiException(status=500, reason="Internal Server Error")
+        return [_pod("a")], "1"
+
+    server = FakeApiServer([])
+    cache = WatchCache(flaky_list, server.watch)
+
+    with pytest.raises(ApiException):
+        await cache.get("pods")
+    pods = await cache.get("pods")
+    await cache.close()
+
+    assert [pod.metadata.name for pod in pods] == ["a"]
+    assert calls == ["pods", "pods"]
@@ -0,0 +1,53 @@
+import os
+import subprocess
+import sys
+
+import pytest
+
+import unctl
+
+# provider SDKs are loaded by the collectors, never by the CLI startup
+PROVIDER_SDKS = ("kubernetes_asyncio", "kubernetes", "aiomysql", "pymysql")
+# other heavy dependencies needed only once something is requested
+LAZY_DEPENDENCIES = ("aiohttp", "requests", "toml", "dateutil")
+
+
+def _import_times(module):
+    """Returns `{module: cumulative microseconds}` of `python -X importtime`."""
+    root = os.path.dirname(os.path.dirname(unctl.__file__))
+    env = {**os.environ, "PYTHONPATH": root}
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    times = {}
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        _, cumulative, name = line.removeprefix("import time:").split("|")
+        times[name.strip()] = int(cumulative)
+    return times
+
+
+@pytest.fixture(scope="module")
+def cli_import_times():
+    return _import_times("unctl.__main__")
+
+
+@pytest.mark.parametrize("package", PROVIDER_SDKS + LAZY_DEPENDENCIES)
+def test_cli_does_not_import_on_startup(cli_import_times, package):
+    imported = [
+        name
+        for name in cli_import_times
+        if name == package or name.startswith(f"{package}.")
+    ]
+    assert imported == []
+
+
+def test_cli_import_time(cli_import_times, record_property):
+    # wall-clock time depends on the runner's load, it's recorded for
+    # comparison between runs, e.g. in the JUnit XML report, not asserted
+    record_property("import_time_us", cli_import_times["unctl.__main__"])
@@ -0,0 +1,82 @@
+import json
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from unctl import version
+from unctl.__main__ import unctl
+from unctl.version import ReleaseCheck, current, latest, parse
+
+
+@pytest.fixture
+def cache_dir(tmp_path):
+    with patch("unctl.version.user_cache_dir", return_value=str(tmp_path)):
+        yield tmp_path
+
+
+def _cache(cache_dir, checked_at, latest):
+    with open(cache_dir / version.CACHE_FILE, "w") as cache_file:
+        json.dump({"checked_at": checked_at, "latest": latest}, cache_file)
+
+
+def test_current_version_does_not_depend_on_working_directory(tmp_path, monkeypatch):
+    expected = current()
+    current.cache_clear()
+    monkeypatch.chdir(tmp_path)
+    assert current() == expected != "0"
+
+
+def test_fresh_release_check_is_not_repeated(cache_dir):
+    _cache(cache_dir, time.time() - 60, "99.0.0")
+    with patch("unctl.version.last") as last:
+        assert latest() == parse("99.0.0")
+    last.assert_not_called()
+
+
+def test_stale_release_check_is_repeated(cache_dir):
+    _cache(cache_dir, time.time() - version.CHECK_INTERVAL - 1, "1.0.0")
+    with patch("unctl.version.last", return_value=parse("2.0.0")):
+        assert latest() == parse("2.0.0")
+
+    with open(cache_dir / version.CACHE_FILE) as cache_file:
+        assert json.load(cache_file)["latest"] == "2.0.0"
+
+
+def test_failed_release_check_is_remembered(cache_dir):
+    with patch("unctl.version.last", side_effect=requests.ConnectionError) as last:
+        assert latest() is None
+        assert latest() is None
+    last.assert_called_once()
+
+
+def test_release_check_does_not_wait_for_pypi(cache_dir, capsys):
+    with patch("unctl.version.latest", side_effect=lambda: time.sleep(1)):
+        started = time.perf_counter()
+        ReleaseCheck().start().notify()
+        assert time.perf_counter() - started < 0.5
+    assert capsys.readouterr() == ("", "")
+
+
+def test_release_check_notifies_about_new_release(cache_dir, capsys):
+    with patch("unctl.version.latest", return_value=parse("99.0.0")):
+        ReleaseCheck().start().notify(timeout=5)
+    assert "99.0.0" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize(
+    ["argv", "env"],
+    [
+        (["k8s", "-l", "--no-update-check"], {}),
+        (["k8s", "-l"], {"UNCTL_NO_UPDATE_CHECK": "1"}),
+    ],
+)
+def test_release_check_can_be_disabled(monkeypatch, argv, env):
+    for name, value in env.items():
+        monkeypatch.setenv(name, value)
+    with patch("unctl.__main__.ReleaseCheck") as release_check, pytest.raises(
+        SystemExit
+    ):
+        unctl(argv)
+    release_check.assert_not_called()
@@ -1,14 +1,26 @@
 import asyncio
+import contextlib
+import os
 import sys
 import textwrap
 from argparse import ArgumentParser, RawTextHelpFormatter, BooleanOptionalAction
 
 from unctl.constants import CheckProviders
+from unctl.lib.cache import user_cache_dir
 from unctl.lib.checks.loader import ChecksLoader
 from unctl.lib.display.display import Displays
+from unctl.lib.display.writers import ReportWriter
+from unctl.lib.k8s.incremental import IncrementalScan
+from unctl.lib.profiling import FORMATS, PHASES, Profiler, profiled
+from unctl.lib.timings import Timings
 from unctl.list import load_checks, get_categories, get_services
-from unctl.scanrkube import JobDefinition, ResourceChecker, DataCollector
-from unctl.version import check, current
+from unctl.scanrkube import (
+    JobDefinition,
+    ResourceChecker,
+    DataCollector,
+    KubernetesDataCollector,
+)
+from unctl.version import DISABLE_ENV, ReleaseCheck, check_disabled, current
 
 
 class PrivateFeatureAction(BooleanOptionalAction):
@@ -42,6 +54,96 @@ def add_demo_cli_flags(parser):
     )
 
 
+def add_k8s_cli_flags(parser):
+    group = parser.add_argument_group("Kubernetes")
+    group.add_argument(
+        "--raw-json",
+        help="Skip deserialization of API responses into models, "
+        "faster on large clusters",
+        action="store_true",
+    )
+    group.add_argument(
+        "-n",
+        "--namespace",
+        help="Scan resources of the NAMESPACE only, can be repeated",
+        action="append",
+        dest="namespaces",
+        metavar="NAMESPACE",
+    )
+    group.add_argument(
+        "--namespaces",
+        help="Scan resources of the NAMESPACES only",
+        action="extend",
+        nargs="+",
+        dest="namespaces",
+        metavar="NAMESPACE",
+    )
+    group.add_argument(
+        "--selector",
+        help="Scan namespaced resources matching the label SELECTOR only, "
+        "e.g. app=web,tier!=cache",
+        metavar="SELECTOR",
+    )
+    group.add_argument(
+        "--max-concurrency",
+        help="List at most N resources at once (default: %(default)s)",
+        type=int,
+        default=KubernetesDataCollector.DEFAULT_CONCURRENCY,
+        metavar="N",
+    )
+    group.add_argument(
+        "--request-timeout",
+        help="Give up on API requests taking longer than SECONDS "
+        "(default: %(default)s)",
+        type=float,
+        default=KubernetesDataCollector.DEFAULT_REQUEST_TIMEOUT,
+        metavar="SECONDS",
+    )
+    group.add_argument(
+        "--retries",
+        help="Retry throttled, failed and timed out API requests up to N times "
+        "with exponential backoff (default: %(default)s)",
+        type=int,
+        default=KubernetesDataCollector.DEFAULT_RETRIES,
+        metavar="N",
+    )
+    group.add_argument(
+        "--interval",
+        help="Repeat the scan every INTERVAL seconds, resources are listed "
+        "once and then kept up to date with watches",
+        type=float,
+        metavar="INTERVAL",
+    )
+    # a snapshot is saved from the cluster only
+    snapshot_group = group.add_mutually_exclusive_group()
+    snapshot_group.add_argument(
+        "--save-snapshot",
+        help="Save all collected resources to FILE to scan them offline later",
+        metavar="FILE",
+    )
+    snapshot_group.add_argument(
+        "--from-snapshot",
+        help="Scan resources saved with --save-snapshot instead of the cluster",
+        metavar="FILE",
+    )
+    group.add_argument(
+        "--events-window",
+        help="Count only Warning events seen within the last MINUTES "
+        "(60 by default)",
+        type=float,
+        metavar="MINUTES",
+    )
+    group.add_argument(
+        "--incremental",
+        help="Re-evaluate only objects changed since the previous incremental "
+        "scan, its results are kept in STATE_FILE (user cache directory "
+        "by default)",
+        nargs="?",
+        const=os.path.join(user_cache_dir(), "k8s_incremental_state.json"),
+        metavar="STATE_FILE",
+    )
+
+
 def unctl_process_args(argv=None):
     parser = ArgumentParser(
         prog="unctl",
@@ -65,6 +167,11 @@ def unctl_process_args(argv=None):
         action="version",
         version=current(),
     )
+    common_parent_parser.add_argument(
+        "--no-update-check",
+        help=f"Don't check for new unctl releases, same as setting {DISABLE_ENV}",
+        action="store_true",
+    )
     common_parent_parser.add_argument(
         "-f",
         "--failing-only",
@@ -111,18 +218,105 @@ def unctl_process_args(argv=None):
         help="List available services",
         action="store_true",
     )
+    output_group = common_parent_parser.add_mutually_exclusive_group()
+    output_group.add_argument(
+        "--stream",
+        help="Write out reports as the checks complete instead of a table at "
+        "the end, as rows of plain text (default) or in any of the --output "
+        "formats",
+        nargs="?",
+        const="text",
+        choices=sorted(ReportWriter.WRITERS),
+        metavar="FORMAT",
+    )
+    output_group.add_argument(
+        "--output",
+        help="Write out reports in the machine-readable format instead of a "
+        "table, everything else goes to stderr",
+        choices=sorted(
+            name
+            for name, writer in ReportWriter.WRITERS.items()
+            if writer.MACHINE_READABLE
+        ),
+    )
+    common_parent_parser.add_argument(
+        "--compact-reports",
+        help="Keep reports column-wise, cuts memory used by very large scans",
+        action="store_true",
+    )
+    common_parent_parser.add_argument(
+        "--partial-results",
+        help="Report checks whose resources could not be collected, or which "
+        "failed, as errored instead of ending the scan",
+        action="store_true",
+    )
+    common_parent_parser.add_argument(
+        "--parallel",
+        help="Run checks concurrently, synchronous ones on N worker processes",
+        type=int,
+        metavar="N",
+    )
+    common_parent_parser.add_argument(
+        "--timings",
+        help="Show time spent on each resource listing and check, and save "
+        "the measurements as JSON to FILE (default: %(const)s)",
+        nargs="?",
+        const="unctl_timings.json",
+        metavar="FILE",
+    )
+    common_parent_parser.add_argument(
+        "--trace-memory",
+        help="Also measure peak memory of each check with --timings, "
+        "slows the checks down",
+        action="store_true",
+    )
+    common_parent_parser.add_argument(
+        "--profile",
+        help="Profile the run and save the profile to OUTPUT",
+        metavar="OUTPUT",
+    )
+    common_parent_parser.add_argument(
+        "--profile-phases",
+        help="Phases of the run to profile (default: all)",
+        nargs="+",
+        choices=PHASES,
+        default=PHASES,
+        metavar="PHASE",
+    )
+    common_parent_parser.add_argument(
+        "--profile-format",
+        help="Profile format, 'pstats' (default) for cProfile statistics or "
+        "'collapsed' for sampled stacks flamegraph tools take",
+        choices=FORMATS,
+        default="pstats",
+    )
     add_demo_cli_flags(common_parent_parser)
 
-    subparsers.add_parser(name=CheckProviders.K8S.value, parents=[common_parent_parser])
+    k8s_parser = subparsers.add_parser(
+        name=CheckProviders.K8S.value, parents=[common_parent_parser]
+    )
+    add_k8s_cli_flags(k8s_parser)
     subparsers.add_parser(
         name=CheckProviders.MySQL.value, parents=[common_parent_parser]
     )
     args = parser.parse_args(args=argv)
 
+    output_format = args.output or args.stream
+    if (
+        args.interval is not None
+        and output_format is not None
+        and not ReportWriter.get_writer(output_format).REPEATABLE
+    ):
+        # a document per scan would not parse as a whole
+        parser.error(
+            f"argument --interval: not allowed with {output_format} output, "
+            "use ndjson for repeated scans"
+        )
+
     return args
 
 
-def _get_app(options, display=None):
+def _get_app(options, display=None, profiler=None):
     display = display or Displays.get_display(options.provider)
     loader = ChecksLoader()
     check_modules = loader.load_all(
@@ -136,14 +330,83 @@ def _get_app(options, display=None):
     jobs = job_definer.generate_jobs()
     print("✅ Created jobs")
 
+    timings = None
+    if options.timings is not None:
+        timings = Timings(trace_memory=options.trace_memory)
+
     # collect inventory
-    collector = DataCollector.make_collector(options.provider)
+    collector = DataCollector.configure_collector(options)
+    collector.timings = timings
     print("✅ Collected Kubernetes data")
 
-    app = ResourceChecker(display, collector, jobs, options.provider)
+    incremental = getattr(options, "incremental", None)
+    if incremental is not None:
+        incremental = IncrementalScan(incremental)
+
+    app = ResourceChecker(
+        display,
+        collector,
+        jobs,
+        options.provider,
+        incremental=incremental,
+        compact_reports=options.compact_reports,
+        parallel=options.parallel,
+        timings=timings,
+        profiler=profiler,
+        partial=options.partial_results,
+    )
     return app
 
 
+def _report_errors(errored):
+    if errored:
+        print(f"⚠️  {errored} checks could not be evaluated, see ERROR reports")
+
+
+def _report_timings(app, display, options):
+    if app.timings is None:
+        return
+    display.display_timings(app.timings)
+    app.timings.save(options.timings)
+    print(f"Timings saved to {options.timings}")
+    app.timings.clear()
+
+
+async def _stream(app, writer):
+    """Writes reports out as the checks complete, returns how many errored."""
+    # nothing is written until the data is collected, a failed collection
+    # must not leave a truncated document behind
+    async for _, reports in app.stream(collected=writer.start):
+        writer.write(reports)
+    writer.finish()
+    return writer.errored
+
+
+async def _scan_once(app, display, options, profiler=None, writer=None):
+    if writer is not None:
+        results = None
+        errored = await _stream(app, writer)
+    else:
+        results = await app.execute()
+        # explanations not needed: print and exit
+        with profiled(profiler, "display"):
+            display.display_results_table(results, sort_by=options.sort_by)
+        errored = len(app.errored_reports)
+    with profiled(profiler, "display"):
+        _report_errors(errored)
+        _report_timings(app, display, options)
+    return results
+
+
+async def _scan_repeatedly(app, display, options, profiler=None, writer=None):
+    try:
+        while True:
+            await _scan_once(app, display, options, profiler, writer)
+            await asyncio.sleep(options.interval)
+    finally:
+        await app.close()
+
+
 def process(options):
     display = Displays.get_display(options.provider)
     display.init(options)
@@ -168,19 +431,61 @@ def process(options):
         display.display_grouped_data("Service", services)
         sys.exit()
 
-    app = _get_app(options, display=display)
-    results = asyncio.run(app.execute())
+    writer = None
+    # reports in machine-readable formats are streamed too
+    output_format = options.output or options.stream
+    if output_format is not None:
+        writer = ReportWriter.get_writer(output_format)(
+            display, failing_only=options.failing_only
+        )
+    # nothing but the reports may end up in parsed output
+    if writer is not None and writer.MACHINE_READABLE:
+        output = contextlib.redirect_stdout(sys.stderr)
+    else:
+        output = contextlib.nullcontext()
+
+    with output:
+        profiler = None
+        if options.profile is not None:
+            profiler = Profiler(
+                options.profile, options.profile_phases, options.profile_format
+            )
 
-    # explanations not needed: print and exit
-    display.display_results_table(results, sort_by=options.sort_by)
+        try:
+            return _scan(options, display, profiler, writer)
+        finally:
+            if profiler is not None:
+                profiler.save()
+                print(f"Profile saved to {options.profile}")
+
+
+def _scan(options, display, profiler, writer=None):
+    with profiled(profiler, "load"):
+        app = _get_app(options, display=display, profiler=profiler)
+    if getattr(options, "interval", None) is not None:
+        # scans until interrupted
+        asyncio.run(_scan_repeatedly(app, display, options, profiler, writer=writer))
+        return None, None, None
+
+    results = asyncio.run(_scan_once(app, display, options, profiler, writer))
+    if writer is not None:
+        # reports were written out as they came, none were kept
+        return None, None, None
     return results, app.failing_reports, None
 
 
 def unctl(argv=None):
-    # check version and notify if new version released
-    check()
     options = unctl_process_args(argv)
-    process(options)
+    if options.no_update_check or check_disabled():
+        process(options)
+        return
+
+    # look for a new release while scanning, notify if it's found by then
+    release_check = ReleaseCheck().start()
+    try:
+        process(options)
+    finally:
+        release_check.notify()
 
 
 if __name__ == "__main__":
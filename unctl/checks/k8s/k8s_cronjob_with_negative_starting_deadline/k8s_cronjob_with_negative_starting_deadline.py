@@ -18,8 +18,8 @@ class k8s_cronjob_with_negative_starting_deadline(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        for cron in data.get_cronjobs():
-            report = CheckReportK8s(self.metadata())
+        for cron in data.get_reported("cronjobs"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = cron.metadata.uid
             report.resource_name = cron.metadata.name
             report.resource_namespace = cron.metadata.namespace
@@ -32,8 +32,8 @@ class k8s_cronjobs_suspended_or_invalid_schedule(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        for cron in data.get_cronjobs():
-            report = CheckReportK8s(self.metadata())
+        for cron in data.get_reported("cronjobs"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = cron.metadata.uid
             report.resource_name = cron.metadata.name
             report.resource_namespace = cron.metadata.namespace
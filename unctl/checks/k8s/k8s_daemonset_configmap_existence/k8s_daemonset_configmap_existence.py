@@ -35,10 +35,10 @@ class k8s_daemonset_configmap_existence(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        configmaps = data.get_configmaps()
+        configmaps = data.get_configmaps_metadata()
 
-        for daemonset in data.get_daemonsets():
-            report = CheckReportK8s(self.metadata())
+        for daemonset in data.get_reported("daemonsets"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = daemonset.metadata.uid
             report.resource_name = daemonset.metadata.name
             report.resource_namespace = daemonset.metadata.namespace
@@ -13,9 +13,9 @@ class k8s_daemonset_pod_template_validation(Check):
         minimum requirements (`100m` for CPU and `100Mi` for memory).
         """
         findings = []
-        daemonsets = data.get_daemonsets()
+        daemonsets = data.get_reported("daemonsets")
         for ds in daemonsets:
-            report = CheckReportK8s(self.metadata())
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = ds.metadata.uid
             report.resource_name = ds.metadata.name
             report.resource_namespace = ds.metadata.namespace
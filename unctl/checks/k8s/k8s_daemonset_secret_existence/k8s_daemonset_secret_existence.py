@@ -34,9 +34,9 @@ class k8s_daemonset_secret_existence(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        secrets = data.get_secrets()
-        for daemonset in data.get_daemonsets():
-            report = CheckReportK8s(self.metadata())
+        secrets = data.get_secrets_metadata()
+        for daemonset in data.get_reported("daemonsets"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = daemonset.metadata.uid
             report.resource_name = daemonset.metadata.name
             report.resource_namespace = daemonset.metadata.namespace
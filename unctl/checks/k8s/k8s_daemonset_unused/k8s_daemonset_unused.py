@@ -10,26 +10,16 @@ class k8s_daemonset_unused(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        daemonsets = data.get_daemonsets()
-        pods = data.get_pods()
-
-        # Get DaemonSet names which have pods associated with them.
-        associated_daemonsets = set()
-        for pod in pods:
-            owner_references = pod.metadata.owner_references
-            if owner_references:
-                for owner in owner_references:
-                    if owner.kind == "DaemonSet":
-                        associated_daemonsets.add(owner.name)
-
-        # Now, check all DaemonSets if they are not in associated_daemonsets.
+        daemonsets = data.get_reported("daemonsets")
+
+        # Check all DaemonSets if they have pods associated with them.
         for ds in daemonsets:
-            report = CheckReportK8s(self.metadata())
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = ds.metadata.uid
             report.resource_name = ds.metadata.name
             report.resource_namespace = ds.metadata.namespace
 
-            if ds.metadata.name not in associated_daemonsets:
+            if not data.get_by_owner("pods", ds.metadata.uid):
                 # Check if the DaemonSet was created at least 30 days ago
                 creation_time = ds.metadata.creation_timestamp
                 time_delta = datetime.now(creation_time.tzinfo) - creation_time
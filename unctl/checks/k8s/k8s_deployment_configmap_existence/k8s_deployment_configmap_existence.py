@@ -37,9 +37,9 @@ class k8s_deployment_configmap_existence(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        configmaps = data.get_configmaps()
-        for deployment in data.get_deployments():
-            report = CheckReportK8s(self.metadata())
+        configmaps = data.get_configmaps_metadata()
+        for deployment in data.get_reported("deployments"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = deployment.metadata.uid
             report.resource_name = deployment.metadata.name
             report.resource_namespace = deployment.metadata.namespace
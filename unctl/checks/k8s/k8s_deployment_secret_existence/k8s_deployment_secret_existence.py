@@ -34,9 +34,9 @@ class k8s_deployment_secret_existence(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        secrets = data.get_secrets()
-        for deployment in data.get_deployments():
-            report = CheckReportK8s(self.metadata())
+        secrets = data.get_secrets_metadata()
+        for deployment in data.get_reported("deployments"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = deployment.metadata.uid
             report.resource_name = deployment.metadata.name
             report.resource_namespace = deployment.metadata.namespace
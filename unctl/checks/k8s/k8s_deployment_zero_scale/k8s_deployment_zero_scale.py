@@ -9,8 +9,8 @@ class k8s_deployment_zero_scale(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        for deployment in data.get_deployments():
-            report = CheckReportK8s(self.metadata())
+        for deployment in data.get_reported("deployments"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = deployment.metadata.uid
             report.resource_name = deployment.metadata.name
             report.resource_namespace = deployment.metadata.namespace
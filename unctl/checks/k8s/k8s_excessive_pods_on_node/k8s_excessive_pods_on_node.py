@@ -48,21 +48,15 @@ class k8s_excessive_pods_on_node(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        node_pod_count = {}
-        for pod in data.get_pods():
-            node_name = pod.spec.node_name
-            if node_name not in node_pod_count:
-                node_pod_count[node_name] = 0
-            node_pod_count[node_name] += 1
-
         for node in data.get_nodes():
-            report = CheckReportK8s(self.metadata())
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = node.metadata.uid
             report.resource_name = node.metadata.name
             report.resource_node = node.metadata.name
             report.status = "PASS"
 
-            if self._execute(node, node_pod_count[node.metadata.name], report) is False:
+            pod_count = len(data.get_by_node("pods", node.metadata.name))
+            if self._execute(node, pod_count, report) is False:
                 report.status = "FAIL"
 
             findings.append(report)
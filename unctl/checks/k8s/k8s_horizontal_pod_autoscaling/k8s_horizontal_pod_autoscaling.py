@@ -1,37 +1,29 @@
+from typing import ClassVar
+
 from unctl.lib.checks.k8s import CheckReportK8s
 from unctl.lib.checks.check import Check
 
 
 class k8s_horizontal_pod_autoscaling(Check):
-    def _execute(
-        self,
-        hpa,
-        deployments,
-        replication_controllers,
-        replicasets,
-        statefulsets,
-        report,
-    ) -> bool:
+    # scale target kinds mapped to the collected resources
+    SCALE_TARGETS: ClassVar[dict[str, str]] = {
+        "Deployment": "deployments",
+        "ReplicationController": "replication_controllers",
+        "ReplicaSet": "replica_sets",
+        "StatefulSet": "statefulsets",
+    }
+
+    def _execute(self, hpa, data, report) -> bool:
         scale_target_ref_name = hpa.spec.scale_target_ref.name
         hpa_namespace = hpa.metadata.namespace
         scale_target_kind = hpa.spec.scale_target_ref.kind
 
-        resource_lookup = {
-            "Deployment": deployments,
-            "ReplicationController": replication_controllers,
-            "ReplicaSet": replicasets,
-            "StatefulSet": statefulsets,
-        }
-
-        matched_resource = None
-
-        if scale_target_kind in resource_lookup:
-            for resource in resource_lookup[scale_target_kind]:
-                if (resource.metadata.name == scale_target_ref_name) and (
-                    resource.metadata.namespace == hpa_namespace
-                ):
-                    matched_resource = resource
-                    break
+        if scale_target_kind in self.SCALE_TARGETS:
+            matched_resource = data.get_by_name(
+                self.SCALE_TARGETS[scale_target_kind],
+                hpa_namespace,
+                scale_target_ref_name,
+            )
         else:
             report.status_extended = (
                 f"HorizontalPodAutoscaler uses {scale_target_kind} as "
@@ -70,26 +62,14 @@ class k8s_horizontal_pod_autoscaling(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        deployments = data.get_deployments()
-        replication_controllers = data.get_replication_controllers()
-        replicasets = data.get_replica_sets()
-        statefulsets = data.get_statefulsets()
-
-        for hpa in data.get_hpas():
-            report = CheckReportK8s(self.metadata())
+        for hpa in data.get_reported("hpas"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = hpa.metadata.uid
             report.resource_name = hpa.metadata.name
             report.resource_namespace = hpa.metadata.namespace
             report.status = "PASS"
 
-            if not self._execute(
-                hpa,
-                deployments,
-                replication_controllers,
-                replicasets,
-                statefulsets,
-                report,
-            ):
+            if not self._execute(hpa, data, report):
                 report.status = "FAIL"
 
             findings.append(report)
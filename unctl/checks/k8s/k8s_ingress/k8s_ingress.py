@@ -85,11 +85,11 @@ class k8s_ingress(Check):
         findings = []
 
         services = data.get_services()
-        secrets = data.get_secrets()
+        secrets = data.get_secrets_metadata()
         ingress_classes = data.get_ingress_classes()
 
-        for ingress in data.get_ingresses():
-            report = CheckReportK8s(self.metadata())
+        for ingress in data.get_reported("ingresses"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = ingress.metadata.uid
             report.resource_name = ingress.metadata.name
             report.resource_namespace = ingress.metadata.namespace
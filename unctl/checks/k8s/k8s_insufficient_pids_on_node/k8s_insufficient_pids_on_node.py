@@ -10,8 +10,8 @@ class k8s_insufficient_pids_on_node(Check):
         findings = []
         pid_threshold = 100  # Define a threshold for PIDs
 
-        for node in data.get_nodes():
-            report = CheckReportK8s(self.metadata())
+        for node in data.get_reported("nodes"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = node.metadata.uid
             report.resource_name = node.metadata.name
             report.resource_node = node.metadata.name
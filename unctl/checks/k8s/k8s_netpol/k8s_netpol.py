@@ -3,8 +3,9 @@ from unctl.lib.checks.check import Check
 
 
 class k8s_netpol(Check):
-    def _execute(self, network_policy, pods, report) -> bool:
-        if not network_policy.spec.pod_selector.match_labels:
+    def _execute(self, network_policy, data, report) -> bool:
+        pod_selector = network_policy.spec.pod_selector
+        if not (pod_selector.match_labels or pod_selector.match_expressions):
             report.status_extended = (
                 f"Network policy {network_policy.metadata.name} "
                 "allows traffic to all pods"
@@ -12,15 +13,10 @@ class k8s_netpol(Check):
             return False
 
         else:
-            filtered_pods = [
-                pod
-                for pod in pods
-                if pod.metadata.labels
-                if all(
-                    label in pod.metadata.labels.items()
-                    for label in network_policy.spec.pod_selector.match_labels.items()
-                )
-            ]
+            # policy applies to the pods from its own namespace only
+            filtered_pods = data.get_by_selector(
+                "pods", pod_selector, namespace=network_policy.metadata.namespace
+            )
             if len(filtered_pods) == 0:
                 report.status_extended = (
                     f"Network policy {network_policy.metadata.name} "
@@ -33,16 +29,15 @@ class k8s_netpol(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        pods = data.get_pods()
-        for network_policy in data.get_network_policies():
-            report = CheckReportK8s(self.metadata())
+        for network_policy in data.get_reported("network_policies"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = network_policy.metadata.uid
             report.resource_name = network_policy.metadata.name
             report.resource_namespace = network_policy.metadata.namespace
 
             report.status = "PASS"
 
-            if not self._execute(network_policy, pods, report):
+            if not self._execute(network_policy, data, report):
                 report.status = "FAIL"
 
             findings.append(report)
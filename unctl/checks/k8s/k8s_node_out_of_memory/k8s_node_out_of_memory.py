@@ -8,8 +8,8 @@ class k8s_node_out_of_memory(Check):
 
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
-        for node in data.get_nodes():
-            report = CheckReportK8s(self.metadata())
+        for node in data.get_reported("nodes"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = node.metadata.name
             report.resource_name = node.metadata.name
             report.resource_node = node.metadata.name
@@ -1,13 +1,9 @@
 from unctl.lib.checks.k8s import CheckReportK8s
-from unctl.lib.checks.check import Check
+from unctl.lib.checks.check import ObjectCheck
 
 
-class k8s_pod_configmap_existence(Check):
-    def _execute(self, pod, configmaps, report) -> bool:
-        configmap_names = {
-            (configmap.metadata.name, configmap.metadata.namespace)
-            for configmap in configmaps
-        }
+class k8s_pod_configmap_existence(ObjectCheck):
+    def _execute(self, pod, configmap_names, report) -> bool:
         pod_namespace = pod.metadata.namespace
 
         for container in pod.spec.containers:
@@ -51,20 +47,20 @@ class k8s_pod_configmap_existence(Check):
 
         return True
 
-    def execute(self, data) -> list[CheckReportK8s]:
-        findings = []
-
-        configmaps = data.get_configmaps()
-        for pod in data.get_pods():
-            report = CheckReportK8s(self.metadata())
-            report.resource_id = pod.metadata.uid
-            report.resource_name = pod.metadata.name
-            report.resource_namespace = pod.metadata.namespace
-            report.status = "PASS"
+    def prepare(self, data):
+        return {
+            (configmap.metadata.name, configmap.metadata.namespace)
+            for configmap in data.get_configmaps_metadata()
+        }
 
-            if not self._execute(pod, configmaps, report):
-                report.status = "FAIL"
+    def evaluate(self, pod, ctx) -> CheckReportK8s:
+        report = CheckReportK8s(self.report_metadata)
+        report.resource_id = pod.metadata.uid
+        report.resource_name = pod.metadata.name
+        report.resource_namespace = pod.metadata.namespace
+        report.status = "PASS"
 
-            findings.append(report)
+        if not self._execute(pod, ctx, report):
+            report.status = "FAIL"
 
-        return findings
+        return report
@@ -1,8 +1,8 @@
 from unctl.lib.checks.k8s import CheckReportK8s
-from unctl.lib.checks.check import Check
+from unctl.lib.checks.check import ObjectCheck
 
 
-class k8s_pod_crashloopbackoff(Check):
+class k8s_pod_crashloopbackoff(ObjectCheck):
     def __init__(self, **data):
         super().__init__(**data)
         # load the schema for the check's metadata
@@ -33,25 +33,19 @@ class k8s_pod_crashloopbackoff(Check):
 
         return True
 
-    def execute(self, data) -> list[CheckReportK8s]:
-        findings = []
-
-        # Iterate over each pod
-        for pod in data.get_pods():
-            report = CheckReportK8s(self.metadata())
-            report.resource_id = pod.metadata.uid
-            report.resource_name = pod.metadata.name
-            report.resource_pod = pod.metadata.name
-            report.resource_namespace = pod.metadata.namespace
-            report.status = "PASS"
-
-            if not self._execute(pod, report):
-                report.status = "FAIL"
-                report.status_extended = (
-                    f"Pod {pod.metadata.name} in namespace {pod.metadata.namespace} "
-                    f"has a container in CrashLoopBackOff state."
-                )
-
-            findings.append(report)
-
-        return findings
+    def evaluate(self, pod, ctx) -> CheckReportK8s:
+        report = CheckReportK8s(self.report_metadata)
+        report.resource_id = pod.metadata.uid
+        report.resource_name = pod.metadata.name
+        report.resource_pod = pod.metadata.name
+        report.resource_namespace = pod.metadata.namespace
+        report.status = "PASS"
+
+        if not self._execute(pod, report):
+            report.status = "FAIL"
+            report.status_extended = (
+                f"Pod {pod.metadata.name} in namespace {pod.metadata.namespace} "
+                f"has a container in CrashLoopBackOff state."
+            )
+
+        return report
@@ -1,8 +1,8 @@
 from unctl.lib.checks.k8s import CheckReportK8s
-from unctl.lib.checks.check import Check
+from unctl.lib.checks.check import ObjectCheck
 
 
-class k8s_pod_high_restart_count(Check):
+class k8s_pod_high_restart_count(ObjectCheck):
     # def _execute(self, pod, report) -> bool:
     #     # Get the current time
     #     now = datetime.now()
@@ -31,42 +31,37 @@ class k8s_pod_high_restart_count(Check):
     #                   f"more than 10 times in the last 30 minutes!"
     #                   )
 
-    def execute(self, data) -> list[CheckReportK8s]:
-        findings = []
+    def evaluate(self, pod, ctx) -> CheckReportK8s:
+        report = CheckReportK8s(self.report_metadata)
+        report.resource_id = pod.metadata.uid
+        report.resource_name = pod.metadata.name
+        report.resource_pod = pod.metadata.name
+        report.resource_namespace = pod.metadata.namespace
 
-        for pod in data.get_pods():
-            report = CheckReportK8s(self.metadata())
-            report.resource_id = pod.metadata.uid
-            report.resource_name = pod.metadata.name
-            report.resource_pod = pod.metadata.name
-            report.resource_namespace = pod.metadata.namespace
+        container_statuses = (
+            pod.status.container_statuses if pod.status.container_statuses else []
+        )
 
-            container_statuses = (
-                pod.status.container_statuses if pod.status.container_statuses else []
-            )
-
-            # Identify containers with high restart counts
-            high_restart_containers = [
-                container_status.name
-                for container_status in container_statuses
-                if container_status and container_status.restart_count > 10
-            ]
-
-            if high_restart_containers:
-                report.status = "FAIL"
-                report.status_extended = (
-                    f"Containers {', '.join(high_restart_containers)} "
-                    "in the pod have restarted more than 10 times."
-                )
-                # Assuming multiple containers can have high restarts,
-                # store them all.
-                report.resource_container = ", ".join(high_restart_containers)
-            else:
-                report.status = "PASS"
-                report.status_extended = (
-                    "Pod's containers are within acceptable restart limits."
-                )
+        # Identify containers with high restart counts
+        high_restart_containers = [
+            container_status.name
+            for container_status in container_statuses
+            if container_status and container_status.restart_count > 10
+        ]
 
-            findings.append(report)
+        if high_restart_containers:
+            report.status = "FAIL"
+            report.status_extended = (
+                f"Containers {', '.join(high_restart_containers)} "
+                "in the pod have restarted more than 10 times."
+            )
+            # Assuming multiple containers can have high restarts,
+            # store them all.
+            report.resource_container = ", ".join(high_restart_containers)
+        else:
+            report.status = "PASS"
+            report.status_extended = (
+                "Pod's containers are within acceptable restart limits."
+            )
 
-        return findings
+        return report
@@ -1,12 +1,9 @@
 from unctl.lib.checks.k8s import CheckReportK8s
-from unctl.lib.checks.check import Check
+from unctl.lib.checks.check import ObjectCheck
 
 
-class k8s_pod_secret_existence(Check):
-    def _execute(self, pod, secrets, report) -> bool:
-        secrets_info = {
-            (secret.metadata.name, secret.metadata.namespace) for secret in secrets
-        }
+class k8s_pod_secret_existence(ObjectCheck):
+    def _execute(self, pod, secrets_info, report) -> bool:
         pod_namespace = pod.metadata.namespace
         pod_name = pod.metadata.name
 
@@ -34,20 +31,20 @@ class k8s_pod_secret_existence(Check):
                             return False
         return True
 
-    def execute(self, data) -> list[CheckReportK8s]:
-        findings = []
-
-        secrets = data.get_secrets()
-        for pod in data.get_pods():
-            report = CheckReportK8s(self.metadata())
-            report.resource_id = pod.metadata.uid
-            report.resource_name = pod.metadata.name
-            report.resource_namespace = pod.metadata.namespace
-            report.status = "PASS"
+    def prepare(self, data):
+        return {
+            (secret.metadata.name, secret.metadata.namespace)
+            for secret in data.get_secrets_metadata()
+        }
 
-            if not self._execute(pod, secrets, report):
-                report.status = "FAIL"
+    def evaluate(self, pod, ctx) -> CheckReportK8s:
+        report = CheckReportK8s(self.report_metadata)
+        report.resource_id = pod.metadata.uid
+        report.resource_name = pod.metadata.name
+        report.resource_namespace = pod.metadata.namespace
+        report.status = "PASS"
 
-            findings.append(report)
+        if not self._execute(pod, ctx, report):
+            report.status = "FAIL"
 
-        return findings
+        return report
@@ -1,8 +1,8 @@
 from unctl.lib.checks.k8s import CheckReportK8s
-from unctl.lib.checks.check import Check
+from unctl.lib.checks.check import ObjectCheck
 
 
-class k8s_pods_pending(Check):
+class k8s_pods_pending(ObjectCheck):
     def _execute(self, pod, report):
         if pod.status.phase != "Pending":
             return True
@@ -14,20 +14,15 @@ class k8s_pods_pending(Check):
                 )
                 return False
 
-    def execute(self, data) -> list[CheckReportK8s]:
-        findings = []
+    def evaluate(self, pod, ctx) -> CheckReportK8s:
+        report = CheckReportK8s(self.report_metadata)
+        report.resource_id = pod.metadata.uid
+        report.resource_name = pod.metadata.name
+        report.resource_pod = pod.metadata.name
+        report.resource_namespace = pod.metadata.namespace
+        report.status = "PASS"
 
-        for pod in data.get_pods():
-            report = CheckReportK8s(self.metadata())
-            report.resource_id = pod.metadata.uid
-            report.resource_name = pod.metadata.name
-            report.resource_pod = pod.metadata.name
-            report.resource_namespace = pod.metadata.namespace
-            report.status = "PASS"
+        if not self._execute(pod, report):
+            report.status = "FAIL"
 
-            if not self._execute(pod, report):
-                report.status = "FAIL"
-
-            findings.append(report)
-
-        return findings
+        return report
@@ -25,8 +25,8 @@ class k8s_pvc_pending(Check):
         findings = []
 
         # Iterate over each PVC
-        for pvc in data.get_pvcs():
-            report = CheckReportK8s(self.metadata())
+        for pvc in data.get_reported("pvcs"):
+            report = CheckReportK8s(self.report_metadata)
 
             # Populate report details
             report.resource_id = pvc.metadata.uid
@@ -7,8 +7,8 @@ class k8s_service_empty(Check):
         findings = []
 
         endpoints = data.get_endpoints()
-        for service in data.get_services():
-            report = CheckReportK8s(self.metadata())
+        for service in data.get_reported("services"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = service.metadata.uid
             report.resource_name = service.metadata.name
             report.resource_service = service.metadata.name
@@ -10,11 +10,10 @@ class k8s_service_pod_label_match(Check):
         findings = []
 
         # Assuming services and pods have been collected from the cluster
-        services = data.get_services()
-        pods = data.get_pods()
+        services = data.get_reported("services")
 
         for service in services:
-            report = CheckReportK8s(self.metadata())
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = service.metadata.uid
             report.resource_name = service.metadata.name
             report.resource_service = service.metadata.name
@@ -33,12 +32,10 @@ class k8s_service_pod_label_match(Check):
                 findings.append(report)
                 continue
 
-            # Check if any pod matches the service selectors
-            matching_pods = [
-                pod
-                for pod in pods
-                if self.matches_service_selectors(pod, service_selectors)
-            ]
+            # Check if any pod from the service's namespace matches its selectors
+            matching_pods = data.get_by_selector(
+                "pods", service_selectors, namespace=service.metadata.namespace
+            )
 
             if matching_pods:
                 report.status = "PASS"
@@ -56,10 +53,3 @@ class k8s_service_pod_label_match(Check):
             findings.append(report)
 
         return findings
-
-    def matches_service_selectors(self, pod, service_selectors):
-        if not pod.metadata.labels:
-            return False
-        return all(
-            label in pod.metadata.labels.items() for label in service_selectors.items()
-        )
@@ -9,8 +9,8 @@ class k8s_service_target_port_match(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        for svc in data.get_services():
-            report = CheckReportK8s(self.metadata())
+        for svc in data.get_reported("services"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = svc.metadata.uid
             report.resource_name = svc.metadata.name
             report.resource_service = svc.metadata.name
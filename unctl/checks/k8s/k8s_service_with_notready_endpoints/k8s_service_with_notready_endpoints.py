@@ -6,33 +6,33 @@ class k8s_service_with_notready_endpoints(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        endpoints = data.get_endpoints()
-        for service in data.get_services():
-            report = CheckReportK8s(self.metadata())
+        for service in data.get_reported("services"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = service.metadata.uid
             report.resource_name = service.metadata.name
             report.resource_service = service.metadata.name
             report.resource_namespace = service.metadata.namespace
             report.status = "PASS"
 
-            for endpoint in endpoints:
-                if endpoint.metadata.name == service.metadata.name and endpoint.subsets:
-                    not_ready = 0
-                    for subset in endpoint.subsets:
-                        if subset.not_ready_addresses:
-                            not_ready += len(subset.not_ready_addresses)
-
-                    if not_ready > 0:
-                        report.status = "FAIL"
-                        report.status_extended = "Service has NotReady endpoints"
-
-                        # populate the selector for diagnostics
-                        s = []
-                        for k, v in service.spec.selector.items():
-                            s.append(f"{k}={v}")
-                        report.resource_selector = ",".join(s)
-
-                    break
+            # endpoints share the name and namespace with their service
+            endpoint = data.get_by_name(
+                "endpoints", service.metadata.namespace, service.metadata.name
+            )
+            if endpoint is not None and endpoint.subsets:
+                not_ready = 0
+                for subset in endpoint.subsets:
+                    if subset.not_ready_addresses:
+                        not_ready += len(subset.not_ready_addresses)
+
+                if not_ready > 0:
+                    report.status = "FAIL"
+                    report.status_extended = "Service has NotReady endpoints"
+
+                    # populate the selector for diagnostics
+                    s = []
+                    for k, v in service.spec.selector.items():
+                        s.append(f"{k}={v}")
+                    report.resource_selector = ",".join(s)
 
             findings.append(report)
 
@@ -51,9 +51,9 @@ class k8s_statefulset_configmap_existence(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        configmaps = data.get_configmaps()
-        for statefulset in data.get_statefulsets():
-            report = CheckReportK8s(self.metadata())
+        configmaps = data.get_configmaps_metadata()
+        for statefulset in data.get_reported("statefulsets"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = statefulset.metadata.uid
             report.resource_name = statefulset.metadata.name
             report.resource_namespace = statefulset.metadata.namespace
@@ -3,21 +3,16 @@ from unctl.lib.checks.check import Check
 
 
 class k8s_statefulset_service_validation(Check):
-    def _execute(self, statefulset, services, report) -> bool:
+    def _execute(self, statefulset, data, report) -> bool:
         statefulset_service_name = statefulset.spec.service_name
         statefulset_namespace = statefulset.metadata.namespace
         statefulset_name = statefulset.metadata.name
 
-        service_info = [(s.metadata.name, s.metadata.namespace) for s in services]
-        match_found = False
-
-        for name, namespace in service_info:
-            # Check whether the name and namespace from service_info matches
-            # name and namespace from the statefulset
-            if name == statefulset_service_name and namespace == statefulset_namespace:
-                match_found = True
-                break
-        if match_found is False:
+        # the service has to be in the same namespace as the statefulset
+        service = data.get_by_name(
+            "services", statefulset_namespace, statefulset_service_name
+        )
+        if service is None:
             report.status_extended = (
                 f"StatefulSet {statefulset_name} uses non-existent service "
                 f"{statefulset_service_name} in namespace {statefulset_namespace}"
@@ -29,15 +24,14 @@ class k8s_statefulset_service_validation(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        services = data.get_services()
-        for statefulset in data.get_statefulsets():
-            report = CheckReportK8s(self.metadata())
+        for statefulset in data.get_reported("statefulsets"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = statefulset.metadata.uid
             report.resource_name = statefulset.metadata.name
             report.resource_namespace = statefulset.metadata.namespace
             report.status = "PASS"
 
-            if not self._execute(statefulset, services, report):
+            if not self._execute(statefulset, data, report):
                 report.status = "FAIL"
 
             findings.append(report)
@@ -33,8 +33,8 @@ class k8s_statefulset_storage_class_validation(Check):
         findings = []
 
         storageClasses = data.get_storage_classes()
-        for statefulset in data.get_statefulsets():
-            report = CheckReportK8s(self.metadata())
+        for statefulset in data.get_reported("statefulsets"):
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = statefulset.metadata.uid
             report.resource_name = statefulset.metadata.name
             report.resource_namespace = statefulset.metadata.namespace
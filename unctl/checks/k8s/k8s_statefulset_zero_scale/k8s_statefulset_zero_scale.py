@@ -9,10 +9,10 @@ class k8s_statefulset_zero_scale(Check):
     def execute(self, data) -> list[CheckReportK8s]:
         findings = []
 
-        statefulsets = data.get_statefulsets()
+        statefulsets = data.get_reported("statefulsets")
 
         for ss in statefulsets:
-            report = CheckReportK8s(self.metadata())
+            report = CheckReportK8s(self.report_metadata)
             report.resource_id = ss.metadata.uid
             report.resource_namespace = ss.metadata.namespace
             report.resource_name = ss.metadata.name
@@ -21,7 +21,7 @@ class mysql_max_used_connections(Check):
     async def execute(self, data) -> list[CheckReport]:
         max_connections = await data.get_max_connections()
         connections_used = await data.get_connections_used()
-        report = CheckReportMySQL(self.metadata())
+        report = CheckReportMySQL(self.report_metadata)
         report.resource_id = "Max_used_connections"
         report.resource_name = "MySQL"
         report.status = "PASS"
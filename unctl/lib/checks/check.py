@@ -1,25 +1,27 @@
-import json
 import os
 import sys
 from abc import ABC, abstractmethod
+from functools import cached_property
 
-from unctl.lib.models.checks import CheckMetadataModel
+from unctl.lib.models.checks import CheckMetadataModel, FrozenCheckMetadataModel
 from unctl.lib.checks.check_report import CheckReport
+from unctl.list import check_metadata
 
 
 class Check(ABC, CheckMetadataModel):
     def __init__(self, **data):
         """Check's init function. Calls the CheckMetadataModel init."""
-        # Parse the Check's metadata file
         metadata_file = (
             os.path.abspath(sys.modules[self.__module__].__file__)[:-3] + ".json"
         )
 
-        with open(metadata_file, "r") as md_file:
-            metadata = json.load(md_file)
-
-        # Store it to validate them with Pydantic
-        data = CheckMetadataModel.model_validate_json(json.dumps(metadata)).model_dump()
+        # shipped checks' metadata comes from the manifest, already parsed
+        metadata = check_metadata(self.__module__)
+        if metadata is None:
+            # Parse the Check's metadata file
+            with open(metadata_file, "r") as md_file:
+                metadata = CheckMetadataModel.model_validate_json(md_file.read())
+        data = metadata.model_dump()
 
         # Calls parents init function
         super().__init__(**data)
@@ -30,6 +32,49 @@ class Check(ABC, CheckMetadataModel):
         """Return the JSON representation of the check's metadata"""
         return self.model_dump_json()
 
+    @cached_property
+    def report_metadata(self) -> FrozenCheckMetadataModel:
+        """Check's metadata validated once and shared by all of its reports"""
+        return FrozenCheckMetadataModel(**self.model_dump())
+
     @abstractmethod
     def execute(self, data) -> list[CheckReport]:
         """Execute the check's logic"""
+
+
+class ObjectCheck(Check):
+    """
+    Check reporting on each object of its `ReportedResource` on its own.
+
+    Instead of walking the objects itself, the check evaluates a single
+    object at a time, which lets all object checks of the same kind share
+    one pass over the objects, see `evaluate_objects`.
+    """
+
+    def prepare(self, data):
+        """Returns the context passed to each evaluation, once per scan"""
+        return None
+
+    @abstractmethod
+    def evaluate(self, obj, ctx) -> CheckReport | None:
+        """Evaluate the check against a single object, `None` skips it"""
+
+    def execute(self, data) -> list[CheckReport]:
+        return evaluate_objects([self], data)[0]
+
+
+def evaluate_objects(checks: list[ObjectCheck], data) -> list[list[CheckReport]]:
+    """
+    Evaluates object checks of the same `ReportedResource` in a single pass
+    over its objects. Returns reports of each of the checks, in order.
+    """
+    evaluations = [(check.evaluate, check.prepare(data)) for check in checks]
+    findings = [[] for _ in checks]
+
+    for obj in data.get_reported(checks[0].ReportedResource):
+        for (evaluate, ctx), reports in zip(evaluations, findings):
+            report = evaluate(obj, ctx)
+            if report is not None:
+                reports.append(report)
+
+    return findings
@@ -1,29 +1,58 @@
 import abc
-from dataclasses import dataclass, field, InitVar
+from dataclasses import dataclass, field, fields, InitVar
 from typing import Literal
 
 from unctl.lib.models.checks import CheckMetadataModel
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckReport:
     """Contains the Check's finding information."""
 
-    raw_metadata: InitVar[str | bytes]
+    # JSON of the metadata or the check's shared `report_metadata`
+    raw_metadata: InitVar[str | bytes | CheckMetadataModel]
 
     check_metadata: CheckMetadataModel = field(init=False)
 
-    status: Literal["PASS", "FAIL"] | None = None
+    # ERROR stands for a check which could not be evaluated
+    status: Literal["PASS", "FAIL", "ERROR"] | None = None
     status_extended: str = ""
     module: str = ""
 
     def __post_init__(self, raw_metadata):
-        self.check_metadata = CheckMetadataModel.model_validate_json(raw_metadata)
+        if isinstance(raw_metadata, CheckMetadataModel):
+            self.check_metadata = raw_metadata
+        else:
+            self.check_metadata = CheckMetadataModel.model_validate_json(raw_metadata)
 
     @property
     def passed(self):
         return self.status == "PASS"
 
+    @property
+    def errored(self):
+        return self.status == "ERROR"
+
+    @classmethod
+    def _report_fields(cls):
+        return [f.name for f in fields(cls) if f.name != "check_metadata"]
+
+    @classmethod
+    def columns(cls) -> list[str]:
+        """Returns keys of `to_dict()`, in the order they come in."""
+        return ["check_id", "check_title", "severity", *cls._report_fields()]
+
+    def to_dict(self) -> dict:
+        """Returns the finding as plain data, identifying the check by its ID."""
+        report = {
+            "check_id": self.check_metadata.CheckID,
+            "check_title": self.check_metadata.CheckTitle,
+            "severity": self.check_metadata.Severity,
+        }
+        for name in self._report_fields():
+            report[name] = getattr(self, name)
+        return report
+
     @property
     @abc.abstractmethod
     def display_object(self) -> str:
@@ -1,9 +1,9 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 
 from unctl.lib.checks.check_report import CheckReport
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckReportK8s(CheckReport):
     """Contains the AWS Check's finding information."""
 
@@ -12,7 +12,8 @@ class CheckReportK8s(CheckReport):
     resource_namespace: str = ""
     resource_storageclass: str = ""
     resource_details: str = ""
-    resource_tags: list = field(default_factory=list)
+    # shared empty default, assign a new sequence to set tags
+    resource_tags: tuple = ()
     resource_pod: str = ""
     resource_node: str = ""
     resource_cluster: str = ""
@@ -3,7 +3,7 @@ from dataclasses import dataclass
 from unctl.lib.checks.check_report import CheckReport
 
 
-@dataclass
+@dataclass(slots=True)
 class CheckReportMySQL(CheckReport):
     resource_name: str = "global"
     resource_id: str = ""
@@ -0,0 +1,75 @@
+import dataclasses
+import sys
+from collections.abc import MutableMapping, Sequence
+
+from unctl.lib.checks.check_report import CheckReport
+
+
+class ReportColumns(Sequence):
+    """
+    Reports of a single check kept column-wise: a list per report field
+    instead of an object per report, with strings interned so repeated
+    namespaces, statuses and messages are stored once. Reports are rebuilt
+    on access, sharing the check's metadata.
+    """
+
+    def __init__(self, reports=()):
+        self._report_type = None
+        self._check_metadata = None
+        self._columns = {}
+        self._length = 0
+        for report in reports:
+            self.append(report)
+
+    def append(self, report: CheckReport):
+        if self._report_type is None:
+            self._report_type = type(report)
+            self._check_metadata = report.check_metadata
+            self._columns = {
+                field.name: []
+                for field in dataclasses.fields(report)
+                if field.name != "check_metadata"
+            }
+
+        for name, column in self._columns.items():
+            value = getattr(report, name)
+            column.append(sys.intern(value) if type(value) is str else value)
+        self._length += 1
+
+    def __len__(self):
+        return self._length
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[position] for position in range(*index.indices(len(self)))]
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("report index out of range")
+
+        report = self._report_type(self._check_metadata)
+        for name, column in self._columns.items():
+            setattr(report, name, column[index])
+        return report
+
+
+class ReportStore(MutableMapping):
+    """Check reports by check name, each check's kept as `ReportColumns`."""
+
+    def __init__(self):
+        self._reports = {}
+
+    def __getitem__(self, check_name):
+        return self._reports[check_name]
+
+    def __setitem__(self, check_name, reports):
+        self._reports[check_name] = ReportColumns(reports)
+
+    def __delitem__(self, check_name):
+        del self._reports[check_name]
+
+    def __iter__(self):
+        return iter(self._reports)
+
+    def __len__(self):
+        return len(self._reports)
@@ -1,6 +1,7 @@
 import os
 import re
 from collections import defaultdict
+from itertools import chain
 from typing import List, Dict
 
 from colorama import init, Fore, Style
@@ -8,11 +9,16 @@ from prettytable import PrettyTable
 
 from unctl.constants import CheckProviders
 from unctl.lib.checks.check_report import CheckReport
+from unctl.lib.checks.k8s import CheckReportK8s
+from unctl.lib.checks.mysql import CheckReportMySQL
 from unctl.lib.display.tables.base import BaseTable
 from unctl.lib.display.tables.constants import TableNames
+from unctl.lib.display.tables.utils import get_severity
 
 init(autoreset=True)
 
+STATUS_COLORS = {"PASS": Fore.GREEN, "FAIL": Fore.RED, "ERROR": Fore.YELLOW}
+
 
 class Displays:
     DISPLAYS = {}
@@ -33,6 +39,8 @@ class Display(Displays):
 
     PROVIDER = None
     DISPLAY_NAME = None
+    # type of the displayed reports
+    REPORT = CheckReport
 
     term_width = 80
     options = None
@@ -215,7 +223,7 @@ class Display(Displays):
         table.junction_char = "─"
         table.border = True
         table.frame = True
-        check_details = [detail for detail in check_details if detail.status == "FAIL"]
+        check_details = [detail for detail in check_details if not detail.passed]
         table = cls._get_sorted_table(TableNames.SORTED_BY_CHECKS, table, check_details)
         print(table)
 
@@ -274,7 +282,7 @@ class Display(Displays):
 
     @classmethod
     def display_sortby_object(cls, results):
-        results = sum(results.values(), [])
+        results = list(chain.from_iterable(results.values()))
         table = PrettyTable()
         # Set the table appearance to use solid lines for borders
         table.horizontal_char = "─"
@@ -284,7 +292,7 @@ class Display(Displays):
         table.frame = True
 
         if cls.options.failing_only:
-            results = [result for result in results if result.status == "FAIL"]
+            results = [result for result in results if not result.passed]
 
         table_string = cls._get_sorted_table(
             TableNames.SORTED_BY_OBJECT, table, results
@@ -294,6 +302,7 @@ class Display(Displays):
                 "FAIL", Fore.RED + Style.BRIGHT + "FAIL" + Style.RESET_ALL
             )
             .replace("PASS", Fore.GREEN + Style.BRIGHT + "PASS" + Style.RESET_ALL)
+            .replace("ERROR", Fore.YELLOW + Style.BRIGHT + "ERROR" + Style.RESET_ALL)
             .replace(
                 "Critical",
                 Fore.LIGHTRED_EX + Style.BRIGHT + "Critical" + Style.RESET_ALL,
@@ -331,32 +340,87 @@ class Display(Displays):
                 print()
 
     @classmethod
-    def display_results_table(cls, results, sort_by="object"):
-        """Displays the results of the checks in a formatted table."""
+    def display_report_banner(cls, title):
         term_width = cls.term_width
 
         print("\n" + Fore.YELLOW + Style.BRIGHT + "─" * term_width + Style.RESET_ALL)
         print(
             f"{Fore.YELLOW}"
             f"{Style.BRIGHT}"
-            f"{'Checks Scan Report'.center(term_width)}"
+            f"{title.center(term_width)}"
             f"{Style.RESET_ALL}"
         )
         print(Fore.YELLOW + Style.BRIGHT + "─" * term_width + Style.RESET_ALL + "\n")
         print()
+
+    @classmethod
+    def display_results_table(cls, results, sort_by="object"):
+        """Displays the results of the checks in a formatted table."""
+        cls.display_report_banner("Checks Scan Report")
         if sort_by == "object":
             cls.display_sortby_object(results)
         elif sort_by == "check":
             cls.display_sortby_check(results)
-        print("\n" + Fore.YELLOW + Style.BRIGHT + "─" * term_width + Style.RESET_ALL)
-        print(
-            f"{Fore.YELLOW}"
-            f"{Style.BRIGHT}"
-            f"{'End of Scan Report'.center(term_width)}"
-            f"{Style.RESET_ALL}"
+        cls.display_report_banner("End of Scan Report")
+
+    @staticmethod
+    def report_object(report):
+        """Returns name of the object the report is about, as shown in rows."""
+        return report.object_name
+
+    @classmethod
+    def display_report_row(cls, report):
+        """Displays a single report on a line of its own, as soon as it's known."""
+        status = STATUS_COLORS.get(report.status, "") + Style.BRIGHT
+        # colors are not counted by ljust, pad by the plain text
+        padding = " " * (len("Critical") - len(report.check_metadata.Severity))
+        row = (
+            f"{status}{str(report.status).ljust(5)}{Style.RESET_ALL} "
+            f"{get_severity(report)}{padding} "
+            f"{Fore.LIGHTBLUE_EX}{cls.report_object(report)}{Style.RESET_ALL} "
+            f"{report.check_metadata.CheckTitle}"
         )
-        print(Fore.YELLOW + Style.BRIGHT + "─" * term_width + Style.RESET_ALL + "\n")
-        print()
+        if report.status_extended:
+            row += f": {report.status_extended}"
+        print(row)
+
+    @classmethod
+    def display_timings(cls, timings):
+        """Displays where the scan spent its time, slowest first."""
+        if timings.lists:
+            table = cls.create_default_table(
+                ["Resource", "Wall (s)", "Received (KiB)", "Objects"], "l"
+            )
+            for timing in sorted(timings.lists, key=lambda t: t.wall, reverse=True):
+                table.add_row(
+                    [
+                        timing.kind,
+                        f"{timing.wall:.3f}",
+                        f"{timing.received / 1024:.1f}",
+                        timing.objects,
+                    ]
+                )
+            print(table.get_string())
+
+        table = cls.create_default_table(
+            ["Check", "Wall (s)", "CPU (s)", "Objects", "Reports", "Memory (KiB)"], "l"
+        )
+        for timing in sorted(timings.checks, key=lambda t: t.wall, reverse=True):
+            table.add_row(
+                [
+                    timing.check,
+                    f"{timing.wall:.3f}",
+                    f"{timing.cpu:.3f}",
+                    "-" if timing.objects is None else timing.objects,
+                    timing.reports,
+                    (
+                        "-"
+                        if timing.memory_peak is None
+                        else f"{timing.memory_peak / 1024:.1f}"
+                    ),
+                ]
+            )
+        print(table.get_string())
 
     @staticmethod
     def debug_results_structure(results):
@@ -375,8 +439,14 @@ class Display(Displays):
 class K8SDisplay(Display, name=CheckProviders.K8S):
     PROVIDER = CheckProviders.K8S
     DISPLAY_NAME = "Kubernetes"
+    REPORT = CheckReportK8s
+
+    @staticmethod
+    def report_object(report):
+        return report.unique_name
 
 
 class MySQLDisplay(Display, name=CheckProviders.MySQL):
     PROVIDER = CheckProviders.MySQL
     DISPLAY_NAME = "MySQL"
+    REPORT = CheckReportMySQL
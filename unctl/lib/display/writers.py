@@ -0,0 +1,218 @@
+import csv
+import json
+import sys
+
+from unctl.version import current
+
+__all__ = ["ReportWriter"]
+
+
+class ReportWriter:
+    """
+    Writes reports out as the checks complete, so the first findings show up
+    as soon as the first check finishes and nothing is kept afterwards.
+    """
+
+    WRITERS = {}
+    # output is parsed by other tools, everything else the scan prints
+    # is sent to stderr
+    MACHINE_READABLE = False
+    # output of repeated scans can be written one after another
+    REPEATABLE = True
+
+    def __init_subclass__(cls, **kwargs):
+        try:
+            cls.WRITERS[kwargs["name"]] = cls
+        except KeyError:
+            pass
+
+    @classmethod
+    def get_writer(cls, name):
+        return cls.WRITERS[name]
+
+    def __init__(self, display, failing_only=False, file=None):
+        self.display = display
+        self.failing_only = failing_only
+        self.file = file if file is not None else sys.stdout
+        # errored reports of the current scan
+        self.errored = 0
+
+    def start(self):
+        self.errored = 0
+
+    def write(self, reports):
+        """Writes out reports of a single check."""
+        for report in reports:
+            if report.errored:
+                self.errored += 1
+            if self.failing_only and report.passed:
+                continue
+            self.write_report(report)
+        self.file.flush()
+
+    def write_report(self, report):
+        raise NotImplementedError
+
+    def finish(self):
+        pass
+
+
+class TextReportWriter(ReportWriter, name="text"):
+    """Writes a row of plain text per report."""
+
+    def start(self):
+        super().start()
+        self.display.display_report_banner("Checks Scan Report")
+
+    def write_report(self, report):
+        self.display.display_report_row(report)
+
+    def finish(self):
+        self.display.display_report_banner("End of Scan Report")
+
+
+class NDJSONReportWriter(ReportWriter, name="ndjson"):
+    """Writes a JSON object per report, one per line."""
+
+    MACHINE_READABLE = True
+
+    def write_report(self, report):
+        self.file.write(json.dumps(report.to_dict()))
+        self.file.write("\n")
+
+
+class JSONReportWriter(ReportWriter, name="json"):
+    """Writes a JSON array of reports, an item at a time."""
+
+    MACHINE_READABLE = True
+    REPEATABLE = False
+
+    def start(self):
+        super().start()
+        self._separator = "\n"
+        self.file.write(self.prefix())
+
+    def prefix(self):
+        return "["
+
+    def suffix(self):
+        return "\n]\n"
+
+    def item(self, report):
+        return report.to_dict()
+
+    def write_report(self, report):
+        self.file.write(self._separator)
+        self.file.write(json.dumps(self.item(report)))
+        self._separator = ",\n"
+
+    def finish(self):
+        self.file.write(self.suffix())
+
+
+class CSVReportWriter(ReportWriter, name="csv"):
+    """Writes a row per report, columns are the keys of `CheckReport.to_dict()`."""
+
+    MACHINE_READABLE = True
+    REPEATABLE = False
+
+    def start(self):
+        super().start()
+        self._writer = csv.writer(self.file)
+        self._writer.writerow(self.display.REPORT.columns())
+
+    @staticmethod
+    def _cell(value):
+        # tags and the like are kept as JSON arrays
+        if isinstance(value, (list, tuple)):
+            return json.dumps(list(value))
+        return value
+
+    def write_report(self, report):
+        self._writer.writerow(
+            [self._cell(value) for value in report.to_dict().values()]
+        )
+
+
+class SARIFReportWriter(JSONReportWriter, name="sarif"):
+    """
+    Writes a SARIF 2.1.0 log with a single run, a result per report and
+    a rule per check. Results come first, rules are only known at the end.
+    """
+
+    SCHEMA = "https://json.schemastore.org/sarif-2.1.0.json"
+    INFORMATION_URI = "https://github.com/unctl-sh/unctl"
+    LEVELS = {
+        "Critical": "error",
+        "Severe": "error",
+        "High": "error",
+        "Medium": "warning",
+        "Low": "note",
+    }
+    # errored checks could not tell whether there's a problem
+    KINDS = {"PASS": "pass", "FAIL": "fail", "ERROR": "open"}
+
+    def start(self):
+        self._rules = {}
+        super().start()
+
+    def prefix(self):
+        schema = json.dumps(self.SCHEMA)
+        return f'{{"version": "2.1.0", "$schema": {schema}, "runs": [{{"results": ['
+
+    def suffix(self):
+        tool = {
+            "driver": {
+                "name": "unctl",
+                "version": current(),
+                "informationUri": self.INFORMATION_URI,
+                "rules": list(self._rules.values()),
+            }
+        }
+        return f'\n], "tool": {json.dumps(tool)}}}]}}\n'
+
+    def _level(self, metadata):
+        return self.LEVELS.get(metadata.Severity, "warning")
+
+    def _rule(self, metadata):
+        rule = {
+            "id": metadata.CheckID,
+            "shortDescription": {"text": metadata.CheckTitle},
+            "fullDescription": {"text": metadata.Description or metadata.CheckTitle},
+            "defaultConfiguration": {"level": self._level(metadata)},
+            "properties": {
+                "severity": metadata.Severity,
+                "service": metadata.ServiceName,
+                "tags": metadata.Categories,
+            },
+        }
+        if metadata.Risk:
+            rule["help"] = {"text": metadata.Risk}
+        if metadata.RelatedUrl:
+            rule["helpUri"] = metadata.RelatedUrl
+        return rule
+
+    def write(self, reports):
+        for report in reports:
+            metadata = report.check_metadata
+            if metadata.CheckID not in self._rules:
+                self._rules[metadata.CheckID] = self._rule(metadata)
+        super().write(reports)
+
+    def item(self, report):
+        metadata = report.check_metadata
+        kind = self.KINDS.get(report.status, "open")
+        location = {
+            "name": report.object_name,
+            "fullyQualifiedName": self.display.report_object(report),
+            "kind": "resource",
+        }
+        return {
+            "ruleId": metadata.CheckID,
+            "kind": kind,
+            # anything but a failure must have no level
+            "level": self._level(metadata) if kind == "fail" else "none",
+            "message": {"text": report.status_extended or metadata.CheckTitle},
+            "locations": [{"logicalLocations": [location]}],
+            "properties": report.to_dict(),
+        }
@@ -0,0 +1,122 @@
+import sys
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+__all__ = ["EventSummary", "EventAggregator", "matches_field_selector"]
+
+
+@dataclass(slots=True)
+class EventSummary:
+    """Events of a single involved object, aggregated."""
+
+    kind: str
+    namespace: str | None
+    name: str
+    uid: str | None
+    # occurrences of the events, by reason and in total
+    reasons: dict[str, int] = field(default_factory=dict)
+    count: int = 0
+    last_timestamp: datetime | None = None
+
+    @property
+    def metadata(self):
+        # lets summaries be indexed and tracked the way API objects are,
+        # the version changes with every occurrence
+        return SimpleNamespace(
+            namespace=self.namespace,
+            name=f"{self.kind}/{self.name}",
+            uid=self.uid,
+            resource_version=f"{self.count}:{self.last_timestamp}",
+        )
+
+
+def _get_path(obj, path):
+    for key in path.split("."):
+        if not isinstance(obj, dict):
+            return None
+        obj = obj.get(key)
+    return obj
+
+
+def matches_field_selector(obj, field_selector):
+    """
+    Tells whether API JSON object matches the field selector, e.g.
+    `type=Warning,involvedObject.kind=Pod`, the way apiserver does.
+    """
+    for term in filter(None, (field_selector or "").split(",")):
+        if "!=" in term:
+            path, value = term.split("!=", 1)
+            if str(_get_path(obj, path)) == value:
+                return False
+        else:
+            path, value = term.replace("==", "=").split("=", 1)
+            if str(_get_path(obj, path)) != value:
+                return False
+    return True
+
+
+def _parse_time(value):
+    if not value:
+        return None
+    # Python 3.10 does not accept the `Z` suffix
+    return datetime.fromisoformat(value.replace("Z", "+00:00"))
+
+
+def _last_seen(event):
+    series = event.get("series") or {}
+    return _parse_time(
+        series.get("lastObservedTime")
+        or event.get("lastTimestamp")
+        or event.get("eventTime")
+        or (event.get("metadata") or {}).get("creationTimestamp")
+    )
+
+
+class EventAggregator:
+    """
+    Folds Events, as API JSON, into compact per object summaries.
+
+    Only events matching `field_selector` and last seen within `window`
+    are counted, so pages can be dropped as soon as they are added.
+    """
+
+    def __init__(self, field_selector=None, window=None, now=None):
+        self._field_selector = field_selector
+        now = now or datetime.now(timezone.utc)
+        self._since = now - window if window is not None else None
+        self._summaries = {}
+
+    def add(self, events):
+        for event in events:
+            if not matches_field_selector(event, self._field_selector):
+                continue
+            last_seen = _last_seen(event)
+            if self._since is not None and last_seen and last_seen < self._since:
+                continue
+            self._add(event, last_seen)
+
+    def _add(self, event, last_seen):
+        involved = event.get("involvedObject") or {}
+        key = (involved.get("kind"), involved.get("namespace"), involved.get("name"))
+        summary = self._summaries.get(key)
+        if summary is None:
+            summary = self._summaries[key] = EventSummary(
+                kind=sys.intern(involved.get("kind") or ""),
+                namespace=involved.get("namespace"),
+                name=involved.get("name") or "",
+                uid=involved.get("uid"),
+            )
+
+        series = event.get("series") or {}
+        count = series.get("count") or event.get("count") or 1
+        reason = sys.intern(event.get("reason") or "")
+        summary.reasons[reason] = summary.reasons.get(reason, 0) + count
+        summary.count += count
+        if last_seen and (
+            summary.last_timestamp is None or last_seen > summary.last_timestamp
+        ):
+            summary.last_timestamp = last_seen
+
+    def summaries(self) -> list[EventSummary]:
+        return list(self._summaries.values())
@@ -0,0 +1,202 @@
+import dataclasses
+import json
+import os
+import tempfile
+
+from unctl.lib.checks.k8s import CheckReportK8s
+from unctl.version import current
+
+__all__ = ["IncrementalScan"]
+
+STATE_VERSION = 1
+
+
+def _object_key(obj):
+    return obj.metadata.namespace or "", obj.metadata.name
+
+
+def _report_key(report):
+    return report.resource_namespace or "", report.resource_name
+
+
+class IncrementalScan:
+    """
+    Carries check reports forward between scans of the same cluster.
+
+    Objects are compared by `resourceVersion` with the previous scan kept
+    in the state file. Checks none of whose resources changed reuse their
+    previous reports. Checks declaring `ReportedResource` re-evaluate its
+    changed objects only, together with the objects sharing a namespace with
+    changed objects of the check's other resources. Anything else, including
+    `TimeDependent` checks, runs in full.
+
+    The state records the scanned source, e.g. the cluster together with the
+    namespaces and the label selector, scans of another source start over.
+    Unreadable state is treated as missing.
+    """
+
+    def __init__(self, path):
+        self._path = path
+        self._versions = {}
+        self._changes = {}
+        self._reports = {}
+        self._source = None
+        self._previous_versions = {}
+        self._previous_reports = {}
+        self._previous_source = None
+        self._set_previous(self._load_state())
+
+    def _load_state(self):
+        try:
+            with open(self._path) as state_file:
+                state = json.load(state_file)
+        except (OSError, ValueError):
+            # missing, or left truncated by an interrupted scan
+            return {}
+        if not isinstance(state, dict):
+            return {}
+        # reports of other versions may come from a different checks logic
+        if state.get("version") != STATE_VERSION or state.get("unctl") != current():
+            return {}
+        return state
+
+    def _set_previous(self, state):
+        self._previous_versions = {
+            kind: {(namespace, name): version for namespace, name, version in items}
+            for kind, items in state.get("resources", {}).items()
+        }
+        self._previous_reports = state.get("reports", {})
+        self._previous_source = state.get("source")
+
+    def track(self, data, source=None):
+        """
+        Records versions of the loaded resources of the `source`, see
+        `DataCollector.source`, and what changed since its previous scan.
+        """
+        if source != self._previous_source:
+            # reports of another cluster or its other slice must never
+            # be carried forward
+            self._set_previous({})
+        self._source = source
+        for kind, items in data.loaded().items():
+            versions = {
+                _object_key(item): item.metadata.resource_version for item in items
+            }
+            self._versions[kind] = versions
+
+            previous = self._previous_versions.get(kind)
+            if previous is None:
+                # nothing to compare with, every object is new
+                self._changes[kind] = None
+                continue
+            self._changes[kind] = {
+                key
+                for key, version in versions.items()
+                if version is None or previous.get(key) != version
+            } | (previous.keys() - versions.keys())
+
+    async def run(self, check, data, run_check):
+        """Returns the check's reports running `run_check` only if needed."""
+        reports = await self._run(check, data, run_check)
+        self._reports[check.CheckID] = reports
+        return reports
+
+    async def _run(self, check, data, run_check):
+        previous = self._previous_reports.get(check.CheckID)
+        changes = [self._changes.get(kind) for kind in check.Resources or ()]
+        if (
+            previous is None
+            or check.Resources is None
+            or check.TimeDependent
+            or None in changes
+        ):
+            return await run_check(check, data)
+
+        previous = [self._restore_report(check, fields) for fields in previous]
+        if not any(changes):
+            return previous
+
+        namespaces = self._affected_namespaces(check)
+        if namespaces is None:
+            return await run_check(check, data)
+
+        kind = check.ReportedResource
+        changed = self._changes[kind]
+        selected = [
+            item
+            for item in data.loaded()[kind]
+            if _object_key(item) in changed or item.metadata.namespace in namespaces
+        ]
+        reports = await run_check(check, data.replace(**{kind: selected}))
+        kept = [
+            report
+            for report in previous
+            if _report_key(report) not in changed
+            and report.resource_namespace not in namespaces
+        ]
+        return kept + reports
+
+    def _affected_namespaces(self, check):
+        """
+        Returns namespaces with changes in the check's other resources,
+        `None` when the check has to be run in full.
+        """
+        if check.ReportedResource is None:
+            return None
+
+        namespaces = set()
+        for kind in check.Resources:
+            if kind == check.ReportedResource:
+                continue
+            for namespace, _ in self._changes[kind]:
+                if not namespace:
+                    # cluster scoped objects may affect any object
+                    return None
+                namespaces.add(namespace)
+        return namespaces
+
+    @staticmethod
+    def _restore_report(check, fields):
+        report = CheckReportK8s(check.report_metadata)
+        for name, value in fields.items():
+            setattr(report, name, value)
+        return report
+
+    @staticmethod
+    def _dump_report(report):
+        return {
+            field.name: getattr(report, field.name)
+            for field in dataclasses.fields(report)
+            if field.name != "check_metadata"
+        }
+
+    def save(self):
+        """Saves the scan as the previous one for the next incremental scan."""
+        state = {
+            "version": STATE_VERSION,
+            "unctl": current(),
+            "source": self._source,
+            "resources": {
+                kind: [[*key, version] for key, version in versions.items()]
+                for kind, versions in self._versions.items()
+            },
+            "reports": {
+                check_id: [self._dump_report(report) for report in reports]
+                for check_id, reports in self._reports.items()
+            },
+        }
+        directory = os.path.dirname(self._path) or "."
+        os.makedirs(directory, exist_ok=True)
+        # written aside and swapped in, interrupted scans keep the old state
+        fd, temp_path = tempfile.mkstemp(dir=directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "w") as state_file:
+                json.dump(state, state_file)
+            os.replace(temp_path, self._path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
+
+        # repeated scans of the same process compare with this one
+        self._set_previous(state)
+        self._versions, self._changes, self._reports = {}, {}, {}
@@ -0,0 +1,120 @@
+import re
+from datetime import date
+from functools import lru_cache
+
+try:
+    from orjson import loads as json_loads
+except ImportError:
+    from json import loads as json_loads
+
+__all__ = ["K8sObject", "json_loads", "openapi_model", "to_json", "wrap_items"]
+
+PRIMITIVE_TYPES = frozenset(("str", "int", "float", "bool", "object"))
+LIST_TYPE = re.compile(r"^list\[(.*)\]$")
+DICT_TYPE = re.compile(r"^dict\(([^,]*), (.*)\)$")
+
+
+class K8sObject:
+    """
+    Read-only view over the raw API JSON shaped like the OpenAPI model.
+
+    Attributes are resolved with the model's `attribute_map` and
+    `openapi_types` on first access only, so `pod.metadata.name` or
+    `pod.spec.containers` work the same as for `V1Pod` without paying
+    for deserialization of the fields nobody reads.
+    """
+
+    def __init__(self, data, model):
+        self._data = data
+        self._model = model
+
+    def __getattr__(self, name):
+        if name.startswith("__"):
+            raise AttributeError(name)
+        try:
+            json_key = self._model.attribute_map[name]
+        except KeyError:
+            raise AttributeError(
+                f"'{self._model.__name__}' object has no attribute '{name}'"
+            ) from None
+
+        value = self._data.get(json_key)
+        if value is not None:
+            value = _get_converter(self._model.openapi_types[name])(value)
+
+        # memoize converted value as a regular attribute
+        setattr(self, name, value)
+        return value
+
+    def __repr__(self):
+        return f"{type(self).__name__}({self._model.__name__}, {self._data!r})"
+
+    def to_dict(self):
+        """Returns the raw API JSON of the object."""
+        return self._data
+
+
+def wrap_items(items, model):
+    return [K8sObject(item, model) for item in items]
+
+
+def to_json(value):
+    """Converts OpenAPI models and K8sObject views back to the API JSON."""
+    if isinstance(value, K8sObject):
+        return value.to_dict()
+    if hasattr(value, "openapi_types"):
+        return {
+            value.attribute_map[name]: to_json(item)
+            for name in value.openapi_types
+            if (item := getattr(value, name)) is not None
+        }
+    if isinstance(value, list):
+        return [to_json(item) for item in value]
+    if isinstance(value, dict):
+        return {key: to_json(item) for key, item in value.items()}
+    if isinstance(value, date):
+        return value.isoformat()
+    return value
+
+
+@lru_cache(maxsize=None)
+def _get_converter(openapi_type):
+    if openapi_type in PRIMITIVE_TYPES:
+        return _identity
+    if openapi_type == "datetime":
+        from dateutil.parser import isoparse
+
+        return isoparse
+
+    if match := LIST_TYPE.match(openapi_type):
+        item_converter = _get_converter(match.group(1))
+        if item_converter is _identity:
+            return _identity
+        return lambda value: [_convert(item_converter, item) for item in value]
+
+    if match := DICT_TYPE.match(openapi_type):
+        item_converter = _get_converter(match.group(2))
+        if item_converter is _identity:
+            return _identity
+        return lambda value: {
+            key: _convert(item_converter, item) for key, item in value.items()
+        }
+
+    model = openapi_model(openapi_type)
+    return lambda value: K8sObject(value, model)
+
+
+def openapi_model(name):
+    """Returns the `kubernetes_asyncio` model class, e.g. `V1Pod`."""
+    # the SDK takes most of the startup time, it's loaded on first use
+    from kubernetes_asyncio.client import models
+
+    return getattr(models, name)
+
+
+def _convert(converter, value):
+    return None if value is None else converter(value)
+
+
+def _identity(value):
+    return value
@@ -0,0 +1,93 @@
+import asyncio
+import logging
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from http import HTTPStatus
+
+__all__ = ["RequestScheduler"]
+
+logger = logging.getLogger(__name__)
+
+# throttled by API Priority and Fairness or apiserver being unavailable
+RETRIED_STATUSES = frozenset(
+    (
+        HTTPStatus.TOO_MANY_REQUESTS,
+        HTTPStatus.INTERNAL_SERVER_ERROR,
+        HTTPStatus.BAD_GATEWAY,
+        HTTPStatus.SERVICE_UNAVAILABLE,
+        HTTPStatus.GATEWAY_TIMEOUT,
+    )
+)
+
+
+def _retry_after(error):
+    """Returns delay in seconds the server asked for, if any."""
+    headers = getattr(error, "headers", None) or {}
+    value = headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(float(value), 0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0)
+
+
+def _is_retried(error):
+    # imported here, the SDKs are only loaded once something is requested
+    import aiohttp
+    from kubernetes_asyncio.client.rest import ApiException
+
+    if isinstance(error, ApiException):
+        return error.status in RETRIED_STATUSES
+    return isinstance(error, (asyncio.TimeoutError, aiohttp.ClientError))
+
+
+class RequestScheduler:
+    """
+    Runs apiserver requests with at most `concurrency` of them in flight.
+
+    Each attempt is limited to `timeout` seconds. Throttled (429), failed
+    (5xx), timed out and dropped requests are retried up to `retries` times
+    with exponential backoff, or after the delay asked for with Retry-After.
+    """
+
+    BACKOFF_BASE = 0.5
+    BACKOFF_MAX = 30
+
+    def __init__(self, concurrency=None, timeout=None, retries=0):
+        self._semaphore = asyncio.Semaphore(concurrency) if concurrency else None
+        self._timeout = timeout
+        self._retries = retries
+
+    def _backoff(self, attempt):
+        delay = min(self.BACKOFF_BASE * 2**attempt, self.BACKOFF_MAX)
+        # jitter keeps the retried requests from arriving all at once
+        return delay * random.uniform(0.5, 1)
+
+    async def _attempt(self, request):
+        if self._semaphore is None:
+            return await asyncio.wait_for(request(), self._timeout)
+        async with self._semaphore:
+            return await asyncio.wait_for(request(), self._timeout)
+
+    async def run(self, request):
+        """Returns result of `request()`, a coroutine function."""
+        attempt = 0
+        while True:
+            try:
+                return await self._attempt(request)
+            except Exception as error:
+                if attempt >= self._retries or not _is_retried(error):
+                    raise
+                delay = _retry_after(error)
+                if delay is None:
+                    delay = self._backoff(attempt)
+                logger.debug("Retrying request in %.1fs after: %r", delay, error)
+            attempt += 1
+            await asyncio.sleep(delay)
@@ -0,0 +1,111 @@
+import re
+
+__all__ = ["LabelSelectorIndex", "matches_label_selector"]
+
+# commas within the value sets of `in`/`notin` don't separate requirements
+_REQUIREMENTS = re.compile(r",(?![^(]*\))")
+_SET_REQUIREMENT = re.compile(r"^(\S+)\s+(in|notin)\s*\((.*)\)$")
+
+
+def _matches_requirement(labels, requirement):
+    if match := _SET_REQUIREMENT.match(requirement):
+        key, operator, values = match.groups()
+        values = {value.strip() for value in values.split(",")}
+        if operator == "in":
+            return labels.get(key) in values
+        return labels.get(key) not in values
+    if "!=" in requirement:
+        key, value = requirement.split("!=", 1)
+        return labels.get(key.strip()) != value.strip()
+    if "=" in requirement:
+        key, value = requirement.replace("==", "=").split("=", 1)
+        return labels.get(key.strip()) == value.strip()
+    if requirement.startswith("!"):
+        return requirement[1:].strip() not in labels
+    return requirement in labels
+
+
+def matches_label_selector(labels, selector):
+    """
+    Tells whether the labels match the label selector given as a string,
+    e.g. `app=web,tier!=cache,env in (dev,qa)`, the way apiserver does.
+    """
+    return all(
+        _matches_requirement(labels or {}, requirement.strip())
+        for requirement in _REQUIREMENTS.split(selector)
+        if requirement.strip()
+    )
+
+
+class LabelSelectorIndex:
+    """
+    Inverted index of objects' labels resolving label selectors.
+
+    Posting lists map `(namespace, key, value)` to the positions of objects
+    having the label, `None` namespace standing for all of them. Selectors
+    are resolved by intersecting the posting lists of their requirements,
+    so the cost depends on the number of matches instead of the objects.
+    """
+
+    def __init__(self, items):
+        self._items = list(items)
+        self._postings = {}
+        self._keys = {}
+        self._namespaces = {}
+
+        for position, item in enumerate(self._items):
+            namespace = item.metadata.namespace
+            for scope in (None, namespace):
+                self._namespaces.setdefault(scope, set()).add(position)
+                for key, value in (item.metadata.labels or {}).items():
+                    self._postings.setdefault((scope, key, value), set()).add(position)
+                    self._keys.setdefault((scope, key), set()).add(position)
+
+    def _with_label(self, namespace, key, values):
+        found = set()
+        for value in values:
+            found |= self._postings.get((namespace, key, value), set())
+        return found
+
+    def _requirement(self, namespace, expression):
+        """Returns positions matching (or excluded by) the expression."""
+        key, operator = expression.key, expression.operator
+        if operator == "In":
+            return True, self._with_label(namespace, key, expression.values or ())
+        if operator == "NotIn":
+            return False, self._with_label(namespace, key, expression.values or ())
+        if operator == "Exists":
+            return True, self._keys.get((namespace, key), set())
+        if operator == "DoesNotExist":
+            return False, self._keys.get((namespace, key), set())
+        raise ValueError(f"Unknown label selector operator: {operator}")
+
+    def select(self, selector, namespace=None):
+        """
+        Returns objects matching the selector, either labels mapping like
+        Service's `spec.selector` or a LabelSelector with `match_labels`
+        and `match_expressions`. `namespace` limits the objects to the ones
+        from the namespace. Empty selector matches everything.
+        """
+        if isinstance(selector, dict):
+            match_labels, match_expressions = selector, ()
+        else:
+            match_labels = selector.match_labels or {}
+            match_expressions = selector.match_expressions or ()
+
+        included = [
+            self._postings.get((namespace, key, value), set())
+            for key, value in match_labels.items()
+        ]
+        excluded = []
+        for expression in match_expressions:
+            matching, positions = self._requirement(namespace, expression)
+            (included if matching else excluded).append(positions)
+
+        if included:
+            included.sort(key=len)
+            found = included[0].intersection(*included[1:])
+        else:
+            found = self._namespaces.get(namespace, set())
+        found = found.difference(*excluded)
+        return [self._items[position] for position in sorted(found)]
@@ -0,0 +1,35 @@
+import gzip
+import json
+
+from unctl.lib.k8s.objects import json_loads
+
+__all__ = ["load_snapshot", "save_snapshot"]
+
+# Snapshot is a gzip compressed NDJSON: a header line listing the saved
+# kinds, followed by a `{"kind": ..., "object": ...}` line per object
+SNAPSHOT_VERSION = 1
+
+
+def save_snapshot(path, resources):
+    """Saves resources given as kinds mapped to lists of objects' API JSON."""
+    with gzip.open(path, "wt", encoding="utf-8") as snapshot:
+        header = {"version": SNAPSHOT_VERSION, "kinds": sorted(resources)}
+        snapshot.write(json.dumps(header) + "\n")
+        for kind in sorted(resources):
+            for obj in resources[kind]:
+                line = json.dumps({"kind": kind, "object": obj}, separators=(",", ":"))
+                snapshot.write(line + "\n")
+
+
+def load_snapshot(path):
+    """Returns kinds saved in the snapshot mapped to lists of objects' API JSON."""
+    with gzip.open(path, "rb") as snapshot:
+        header = json_loads(snapshot.readline())
+        if header.get("version") != SNAPSHOT_VERSION:
+            raise ValueError(f"Unsupported snapshot version: {header.get('version')}")
+
+        resources = {kind: [] for kind in header["kinds"]}
+        for line in snapshot:
+            entry = json_loads(line)
+            resources[entry["kind"]].append(entry["object"])
+    return resources
@@ -0,0 +1,98 @@
+import asyncio
+import logging
+from http import HTTPStatus
+
+__all__ = ["WatchCache"]
+
+logger = logging.getLogger(__name__)
+
+
+class WatchCache:
+    """
+    Informer-like in-memory cache of Kubernetes resources.
+
+    Each kind is listed once on first request, then kept current in the
+    background by following the watch from the listed `resourceVersion`
+    (bookmarks included). When apiserver no longer has that version
+    (410 Gone) the kind is relisted.
+
+    `list_fn(kind)` returns `(items, resource_version)`, `watch_fn(kind,
+    resource_version)` is an async iterator of `(event_type, object,
+    resource_version)` ending when the server closes the watch.
+    """
+
+    # delay before re-establishing a watch that failed for other reasons
+    RETRY_DELAY = 5
+
+    def __init__(self, list_fn, watch_fn):
+        self._list_fn = list_fn
+        self._watch_fn = watch_fn
+        self._stores = {}
+        self._versions = {}
+        self._synced = {}
+        self._tasks = {}
+
+    async def get(self, kind):
+        """Returns a snapshot of resources of the given kind."""
+        if kind not in self._tasks:
+            self._synced[kind] = asyncio.get_running_loop().create_future()
+            self._tasks[kind] = asyncio.create_task(self._run(kind))
+        # waiters being cancelled must not cancel the sync of the kind
+        await asyncio.shield(self._synced[kind])
+        return list(self._stores[kind].values())
+
+    def resource_version(self, kind):
+        return self._versions.get(kind)
+
+    async def close(self):
+        """Stops all watches."""
+        for task in self._tasks.values():
+            task.cancel()
+        await asyncio.gather(*self._tasks.values(), return_exceptions=True)
+        self._tasks.clear()
+
+    @staticmethod
+    def _key(obj):
+        return obj.metadata.namespace, obj.metadata.name
+
+    async def _relist(self, kind):
+        items, resource_version = await self._list_fn(kind)
+        self._stores[kind] = {self._key(item): item for item in items}
+        self._versions[kind] = resource_version
+        if not self._synced[kind].done():
+            self._synced[kind].set_result(None)
+
+    def apply(self, kind, event_type, obj, resource_version):
+        """Applies a single watch event to the cached resources."""
+        if event_type in ("ADDED", "MODIFIED"):
+            self._stores[kind][self._key(obj)] = obj
+        elif event_type == "DELETED":
+            self._stores[kind].pop(self._key(obj), None)
+        # BOOKMARK events only move the version forward
+        self._versions[kind] = resource_version
+
+    async def _follow(self, kind):
+        while True:
+            # server closes the watch after a timeout, carry on from
+            # the last seen version without relisting
+            events = self._watch_fn(kind, self._versions[kind])
+            async for event_type, obj, resource_version in events:
+                self.apply(kind, event_type, obj, resource_version)
+
+    async def _run(self, kind):
+        while True:
+            try:
+                await self._relist(kind)
+                await self._follow(kind)
+            except Exception as error:
+                if not self._synced[kind].done():
+                    # failed initial listing is reported to the waiters,
+                    # next request of the kind starts over
+                    del self._tasks[kind]
+                    self._synced[kind].set_exception(error)
+                    return
+                # `ApiException` of the expired resourceVersion, relist
+                if getattr(error, "status", None) == HTTPStatus.GONE:
+                    continue
+                logger.warning("Watching Kubernetes %s failed: %s", kind, error)
+                await asyncio.sleep(self.RETRY_DELAY)
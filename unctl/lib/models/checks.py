@@ -1,6 +1,6 @@
 from dataclasses import field
 
-from pydantic import BaseModel
+from pydantic import BaseModel, ConfigDict
 
 
 class CheckMetadataModel(BaseModel):
@@ -23,7 +23,22 @@ class CheckMetadataModel(BaseModel):
     RelatedUrl: str
     Categories: list[str]
     DependsOn: list[str]
+    # data kinds the check reads, e.g. ["pods", "secrets"] for k8s checks
+    Resources: list[str] | None = None
+    # kind of objects the check reports on, one report per object; declared
+    # only when the report depends on nothing but the object itself and
+    # objects of the other Resources from the same namespace
+    ReportedResource: str | None = None
+    # reports may change with time alone, e.g. with an age threshold, so
+    # incremental scans never carry them forward
+    TimeDependent: bool = False
     RelatedTo: list[str]
     Notes: str
     PositiveMatch: str
     NegativeMatch: str
+
+
+class FrozenCheckMetadataModel(CheckMetadataModel):
+    """Read-only check metadata, safe to share between reports."""
+
+    model_config = ConfigDict(frozen=True)
@@ -0,0 +1,99 @@
+import cProfile
+import contextlib
+import os
+import sys
+import threading
+from collections import Counter
+
+__all__ = ["PHASES", "FORMATS", "Profiler", "profiled"]
+
+# parts of a run which can be profiled, in the order they run
+PHASES = ("load", "collect", "execute", "display")
+FORMATS = ("pstats", "collapsed")
+
+
+class StackSampler:
+    """
+    Samples stacks of all threads but its own every `interval` seconds,
+    counting how many times each of the stacks was seen. Follows the
+    interface of `cProfile.Profile` used by `Profiler`.
+    """
+
+    def __init__(self, interval=0.001):
+        self.interval = interval
+        self.stacks = Counter()
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def enable(self):
+        self._stopped.clear()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+        self._thread.start()
+
+    def disable(self):
+        self._stopped.set()
+        self._thread.join()
+
+    @staticmethod
+    def _frame_name(frame):
+        code = frame.f_code
+        filename = os.path.basename(code.co_filename)
+        return f"{code.co_name} ({filename}:{code.co_firstlineno})"
+
+    def _sample(self):
+        own_id = threading.get_ident()
+        while not self._stopped.wait(self.interval):
+            for thread_id, frame in sys._current_frames().items():
+                if thread_id == own_id:
+                    continue
+                stack = []
+                while frame is not None:
+                    stack.append(self._frame_name(frame))
+                    frame = frame.f_back
+                self.stacks[";".join(reversed(stack))] += 1
+
+    def dump_stats(self, path):
+        """Writes stacks collapsed the way flamegraph tools expect them."""
+        with open(path, "w") as file:
+            for stack, count in sorted(self.stacks.items()):
+                file.write(f"{stack} {count}\n")
+
+
+class Profiler:
+    """
+    Profiles the selected phases of a run into `output`.
+
+    `pstats` output is produced with cProfile from the main thread only,
+    `collapsed` stacks are sampled from all threads, including the ones
+    running blocking checks, and can be fed to flamegraph tools as is.
+    """
+
+    def __init__(self, output, phases=PHASES, output_format="pstats"):
+        self.output = output
+        self.phases = set(phases)
+        if output_format == "pstats":
+            self._profiler = cProfile.Profile()
+        else:
+            self._profiler = StackSampler()
+
+    @contextlib.contextmanager
+    def phase(self, name):
+        """Profiles everything run within, when the phase was selected."""
+        if name not in self.phases:
+            yield
+            return
+        self._profiler.enable()
+        try:
+            yield
+        finally:
+            self._profiler.disable()
+
+    def save(self):
+        self._profiler.dump_stats(self.output)
+
+
+def profiled(profiler, phase):
+    """Profiles the phase with `profiler`, if there's one."""
+    if profiler is None:
+        return contextlib.nullcontext()
+    return profiler.phase(phase)
@@ -0,0 +1,103 @@
+import contextlib
+import contextvars
+import json
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+
+__all__ = ["ListTiming", "CheckTiming", "Timings", "count_received"]
+
+
+@dataclass(slots=True)
+class ListTiming:
+    """Listing of a single resource kind."""
+
+    kind: str
+    wall: float = 0.0
+    received: int = 0
+    objects: int = 0
+
+
+@dataclass(slots=True)
+class CheckTiming:
+    """Execution of a single check."""
+
+    check: str
+    wall: float = 0.0
+    cpu: float = 0.0
+    objects: int | None = None
+    reports: int = 0
+    # peak of memory traced while the check ran, with `trace_memory` only
+    memory_peak: int | None = None
+
+
+# listing in progress within the current task, see `count_received`
+_current_list = contextvars.ContextVar("current_list", default=None)
+
+
+def count_received(size):
+    """Adds bytes received from apiserver to the listing in progress."""
+    timing = _current_list.get()
+    if timing is not None:
+        timing.received += size
+
+
+class Timings:
+    """
+    Wall/CPU time, sizes and counts recorded over a scan.
+
+    `trace_memory` records peak memory allocated by each check with
+    tracemalloc, which slows the checks down considerably.
+    """
+
+    def __init__(self, trace_memory=False):
+        self.trace_memory = trace_memory
+        self.lists: list[ListTiming] = []
+        self.checks: list[CheckTiming] = []
+
+    def clear(self):
+        self.lists.clear()
+        self.checks.clear()
+
+    @contextlib.contextmanager
+    def measure_list(self, kind):
+        timing = ListTiming(kind)
+        token = _current_list.set(timing)
+        start = time.perf_counter()
+        try:
+            yield timing
+        finally:
+            timing.wall = time.perf_counter() - start
+            _current_list.reset(token)
+        self.lists.append(timing)
+
+    @contextlib.contextmanager
+    def measure_check(self, check):
+        timing = CheckTiming(check)
+        tracing = self.trace_memory and not tracemalloc.is_tracing()
+        if tracing:
+            tracemalloc.start()
+        elif self.trace_memory:
+            tracemalloc.reset_peak()
+        traced = tracemalloc.get_traced_memory()[0] if self.trace_memory else 0
+        start, start_cpu = time.perf_counter(), time.process_time()
+        try:
+            yield timing
+        finally:
+            timing.wall = time.perf_counter() - start
+            timing.cpu = time.process_time() - start_cpu
+            if self.trace_memory:
+                timing.memory_peak = tracemalloc.get_traced_memory()[1] - traced
+            if tracing:
+                tracemalloc.stop()
+        self.checks.append(timing)
+
+    def to_dict(self):
+        return {
+            "lists": [asdict(timing) for timing in self.lists],
+            "checks": [asdict(timing) for timing in self.checks],
+        }
+
+    def save(self, path):
+        with open(path, "w") as file:
+            json.dump(self.to_dict(), file, indent=2)
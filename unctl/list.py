@@ -1,53 +1,129 @@
+import functools
 import os
 import json
 from typing import List, Dict
 from unctl.lib.checks.check_report import CheckReport
+from unctl.lib.models.checks import CheckMetadataModel
 
+DEFAULT_CHECKS_DIR = "checks"
+# validated metadata of the shipped checks, see `scripts/update_checks_list.py`
+MANIFEST_PATH = os.path.join(
+    os.path.dirname(__file__), DEFAULT_CHECKS_DIR, "manifest.json"
+)
+MANIFEST_VERSION = 1
 
-def load_checks(
-    provider=None, categories=None, services=None, checks=None, checks_dir="checks"
-) -> List[CheckReport]:
+
+def discover_checks(checks_dir=DEFAULT_CHECKS_DIR) -> List[CheckReport]:
+    """Walks the checks directory validating metadata of each of the checks."""
     checks_list = []
 
     check_root = os.path.join(os.path.dirname(__file__), checks_dir)
 
-    for provider_dir in os.listdir(check_root):
-        if provider and provider != provider_dir:
+    for provider_dir in sorted(os.listdir(check_root)):
+        provider_path = os.path.join(check_root, provider_dir)
+        if not os.path.isdir(provider_path):
             continue
 
-        for check_name in os.listdir(os.path.join(check_root, provider_dir)):
+        for check_name in sorted(os.listdir(provider_path)):
             check_md_path = os.path.join(
-                check_root, provider_dir, check_name, f"{check_name}.json"
+                provider_path, check_name, f"{check_name}.json"
             )
 
             if not os.path.isfile(check_md_path):
                 continue
 
-            module_name = (
+            with open(check_md_path, "r") as metadata_file:
+                check = CheckReport(metadata_file.read())
+            check.module = (
                 f"{__package__}.{checks_dir}.{provider_dir}.{check_name}.{check_name}"
             )
+            checks_list.append(check)
 
-            with open(check_md_path, "r") as metadata_file:
-                metadata = json.load(metadata_file)
-
-                # Check if the check matches the criteria
-                provider_match = not provider or provider == metadata["Provider"]
-                categories_match = not categories or any(
-                    cat in metadata["Categories"] for cat in categories
-                )
-                services_match = not services or metadata["ServiceName"] in services
-                checks_match = not checks or metadata["CheckID"] in checks
-
-                if all(
-                    [provider_match, categories_match, services_match, checks_match]
-                ):
-                    # Your code here
-
-                    # Extract the required information
-                    check = CheckReport(json.dumps(metadata))
-                    check.module = module_name
-
-                    checks_list.append(check)
+    return checks_list
+
+
+def build_manifest(checks_dir=DEFAULT_CHECKS_DIR):
+    return {
+        "version": MANIFEST_VERSION,
+        "checks": [
+            {"module": check.module, "metadata": check.check_metadata.model_dump()}
+            for check in discover_checks(checks_dir)
+        ],
+    }
+
+
+def save_manifest(path=MANIFEST_PATH):
+    with open(path, "w") as manifest_file:
+        json.dump(build_manifest(), manifest_file, indent=2)
+        manifest_file.write("\n")
+
+
+def _read_manifest():
+    try:
+        with open(MANIFEST_PATH, "r") as manifest_file:
+            manifest = json.load(manifest_file)
+    except FileNotFoundError:
+        return None
+    if manifest.get("version") != MANIFEST_VERSION:
+        return None
+
+    checks_list = []
+    for entry in manifest["checks"]:
+        # metadata was validated when the manifest was generated
+        check = CheckReport(CheckMetadataModel.model_construct(**entry["metadata"]))
+        check.module = entry["module"]
+        checks_list.append(check)
+    return checks_list
+
+
+@functools.cache
+def _all_checks(checks_dir=DEFAULT_CHECKS_DIR) -> tuple[CheckReport, ...]:
+    # user supplied checks are not in the manifest, these are discovered
+    checks_list = None
+    if checks_dir == DEFAULT_CHECKS_DIR:
+        checks_list = _read_manifest()
+    if checks_list is None:
+        checks_list = discover_checks(checks_dir)
+    return tuple(checks_list)
+
+
+@functools.cache
+def _checks_by_module(checks_dir):
+    return {check.module: check for check in _all_checks(checks_dir)}
+
+
+def check_metadata(module_name) -> CheckMetadataModel | None:
+    """Returns metadata of the check module, if it's a known check."""
+    # modules of checks are named `unctl.<checks_dir>.<provider>.<check>.<check>`
+    parts = module_name.split(".")
+    if len(parts) != 5 or parts[0] != __package__ or parts[3] != parts[4]:
+        return None
+    check = _checks_by_module(parts[1]).get(module_name)
+    return check.check_metadata if check is not None else None
+
+
+def load_checks(
+    provider=None,
+    categories=None,
+    services=None,
+    checks=None,
+    checks_dir=DEFAULT_CHECKS_DIR,
+) -> List[CheckReport]:
+    checks_list = []
+
+    for check in _all_checks(checks_dir):
+        metadata = check.check_metadata
+
+        # Check if the check matches the criteria
+        provider_match = not provider or provider == metadata.Provider
+        categories_match = not categories or any(
+            cat in metadata.Categories for cat in categories
+        )
+        services_match = not services or metadata.ServiceName in services
+        checks_match = not checks or metadata.CheckID in checks
+
+        if all([provider_match, categories_match, services_match, checks_match]):
+            checks_list.append(check)
 
     return checks_list
 
@@ -1,22 +1,40 @@
 import asyncio
 import contextlib
+import copy
+import functools
 import inspect
-
-import aiomysql
-from kubernetes_asyncio import client, config
-from kubernetes_asyncio.client import (
-    AppsV1Api,
-    AutoscalingV1Api,
-    NetworkingV1Api,
-    BatchV1Api,
-    StorageV1Api,
-)
-from kubernetes_asyncio.client.api_client import ApiClient
-from kubernetes_asyncio.client.rest import ApiException
+import json
+import multiprocessing
+import os
+from collections import namedtuple
+from itertools import chain
+from concurrent.futures import ProcessPoolExecutor
+from collections.abc import MutableMapping, Sequence
+from datetime import timedelta
+from http import HTTPStatus
+from types import SimpleNamespace
 
 from unctl.constants import CheckProviders
-from unctl.lib.checks.check import Check
+from unctl.lib.checks.check import Check, ObjectCheck, evaluate_objects
 from unctl.lib.checks.check_report import CheckReport
+from unctl.lib.checks.k8s import CheckReportK8s
+from unctl.lib.checks.mysql import CheckReportMySQL
+from unctl.lib.checks.store import ReportStore
+from unctl.lib.k8s.events import EventAggregator
+from unctl.lib.k8s.incremental import IncrementalScan
+from unctl.lib.k8s.objects import (
+    K8sObject,
+    json_loads,
+    openapi_model,
+    to_json,
+    wrap_items,
+)
+from unctl.lib.k8s.scheduler import RequestScheduler
+from unctl.lib.k8s.selectors import LabelSelectorIndex, matches_label_selector
+from unctl.lib.k8s.snapshot import load_snapshot, save_snapshot
+from unctl.lib.k8s.watch import WatchCache
+from unctl.lib.profiling import Profiler, profiled
+from unctl.lib.timings import Timings, count_received
 
 
 # Data Collection Module
@@ -24,118 +42,279 @@ from unctl.lib.checks.check_report import CheckReport
 
 class DataCollector:
     _COLLECTORS = {}
+    # records time spent listing resources when set
+    timings: Timings | None = None
+    # kinds the checks report on but never look objects up in, these can be
+    # narrowed down by the collector, see `ResourceChecker`
+    reported_only: frozenset = frozenset()
+    # identifies the scanned cluster once the session is open, if known
+    cluster: str | None = None
 
-    async def fetch_data(self):
+    @contextlib.asynccontextmanager
+    async def session(self):
+        """Keeps collector's connections open for everything run within."""
+        yield
+
+    async def close(self):
+        """Releases whatever the collector keeps open between runs."""
+
+    def source(self):
+        """
+        Describes what is scanned, scans of different sources never share
+        their results. JSON serializable.
+        """
+        return {"cluster": self.cluster}
+
+    async def fetch_data(self, resources=None):
+        """
+        Collects the data checks are executed against.
+        `resources` narrows the collection down to the given resource kinds,
+        `None` means everything the collector knows about.
+        """
         raise NotImplementedError
 
     def __init_subclass__(cls, **kwargs):
-        cls._COLLECTORS[kwargs["name"]] = cls
+        # unnamed subclasses are variations of the registered collectors
+        if "name" in kwargs:
+            cls._COLLECTORS[kwargs["name"]] = cls
 
     @classmethod
     def make_collector(cls, name, *args, **kwargs):
         return cls._COLLECTORS[name](*args, **kwargs)
 
+    @classmethod
+    def configure(cls, options):
+        """Creates the collector configured with the parsed CLI options."""
+        return cls()
+
+    @classmethod
+    def configure_collector(cls, options):
+        return cls._COLLECTORS[options.provider].configure(options)
+
 
 class KubernetesData:
-    # keep parameters sorted alphabetically to avoid merge conflicts
-    def __init__(
-        self,
-        configmaps,
-        cronjobs,
-        daemonsets,
-        deployments,
-        endpoints,
-        hpas,
-        ingress_classes,
-        ingresses,
-        nodes,
-        pods,
-        network_policies,
-        pvcs,
-        replicationControllers,
-        replicaSets,
-        secrets,
-        services,
-        statefulsets,
-        storageClasses,
-        events,
-    ):
-        self._configmaps = configmaps
-        self._cronjobs = cronjobs
-        self._daemonsets = daemonsets
-        self._deployments = deployments
-        self._endpoints = endpoints
-        self._hpas = hpas
-        self._ingress_classes = ingress_classes
-        self._ingresses = ingresses
-        self._nodes = nodes
-        self._pods = pods
-        self._network_policies = network_policies
-        self._pvcs = pvcs
-        self._replicationControllers = replicationControllers
-        self._replicaSets = replicaSets
-        self._secrets = secrets
-        self._services = services
-        self._statefulsets = statefulsets
-        self._storageClasses = storageClasses
-        self._events = events
+    """
+    Kubernetes resources grouped by kind, e.g. `pods` for `get_pods()`.
+
+    Kinds not collected upfront are fetched with `loader` the first time
+    they're requested and memoized for the rest of the run. Concurrent
+    first requests of the same kind share a single fetch.
+
+    `get_by_*` lookups are served from indexes built on first use per kind,
+    so checks joining resources don't have to scan all of them per object.
+    Kinds failed to be loaded are kept in `errors` with their exceptions.
+
+    Objects checks report on are taken with `get_reported`, which narrows
+    them down to the ones matching the scan's `label_selector`. Everything
+    else is kept whole, referenced objects are found whether labeled or not.
+    """
+
+    def __init__(self, loader=None, label_selector=None, **resources):
+        self._loader = loader
+        self.label_selector = label_selector
+        self._resources = resources
+        self._loading = {}
+        self.errors = {}
+        self._indexes = {}
+        # lazy fetches always run on the loop the data was created on
+        self._loop = asyncio.get_running_loop() if loader else None
+
+    async def load(self, kind):
+        """Returns resources of the given kind, fetching them on first use."""
+        if kind in self._resources:
+            return self._resources[kind]
+        if self._loader is None:
+            raise self._not_collected(kind)
+
+        if kind not in self._loading:
+            self._loading[kind] = asyncio.ensure_future(self._loader(kind))
+        try:
+            self._resources[kind] = await self._loading[kind]
+        except Exception as error:
+            self.errors[kind] = error
+            raise
+        return self._resources[kind]
+
+    def loaded(self):
+        """Returns resources loaded so far grouped by kind."""
+        return dict(self._resources)
+
+    def replace(self, **resources):
+        """Returns a copy of the data with the given kinds replaced."""
+        data = copy.copy(self)
+        data._resources = {**self._resources, **resources}
+        data._indexes = {}
+        return data
+
+    def _index(self, name, kind, keys):
+        """Returns objects of the kind grouped by each of their `keys`."""
+        index = self._indexes.get((name, kind))
+        if index is None:
+            index = {}
+            for item in self._get_resource(kind):
+                for key in keys(item):
+                    index.setdefault(key, []).append(item)
+            self._indexes[name, kind] = index
+        return index
+
+    def get_by_name(self, kind, namespace, name):
+        """Returns object of the kind with the namespace and name, if any."""
+        found = self._index("name", kind, _name_keys).get((namespace, name))
+        return found[0] if found else None
+
+    def get_by_owner(self, kind, owner_uid):
+        """Returns objects of the kind owned by the object with the UID."""
+        return self._index("owner", kind, _owner_keys).get(owner_uid, [])
+
+    def get_by_node(self, kind, node_name):
+        """Returns objects of the kind, e.g. pods, scheduled to the node."""
+        return self._index("node", kind, _node_keys).get(node_name, [])
+
+    def get_by_selector(self, kind, selector, namespace=None):
+        """
+        Returns objects of the kind matching the label selector, see
+        `LabelSelectorIndex.select`.
+        """
+        index = self._indexes.get(("selector", kind))
+        if index is None:
+            index = LabelSelectorIndex(self._get_resource(kind))
+            self._indexes["selector", kind] = index
+        return index.select(selector, namespace=namespace)
+
+    def _not_collected(self, kind):
+        return LookupError(
+            f"Kubernetes {kind} were not collected, "
+            "make sure they are listed in the check's Resources"
+        )
+
+    def _get_resource(self, kind):
+        if kind in self._resources:
+            return self._resources[kind]
+        if kind in self.errors:
+            raise self.errors[kind]
+        if self._loader is None or _in_worker:
+            # the loop of forked workers' data is left behind in the parent
+            raise self._not_collected(kind)
+
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self._loop:
+            # blocking here would deadlock the loop doing the fetch
+            raise RuntimeError(
+                f"Kubernetes {kind} are not loaded yet, "
+                f"use `await data.load({kind!r})` within the event loop"
+            )
+
+        return asyncio.run_coroutine_threadsafe(self.load(kind), self._loop).result()
+
+    def get(self, kind):
+        """Returns resources of the given kind, e.g. `pods`."""
+        return self._get_resource(kind)
+
+    def get_reported(self, kind):
+        """
+        Returns resources of the given kind the checks report on, the ones
+        matching the label selector. Cluster-scoped objects are not narrowed.
+        """
+        if self.label_selector is None:
+            return self._get_resource(kind)
+        selected = self._indexes.get(("reported", kind))
+        if selected is None:
+            selected = [
+                item
+                for item in self._get_resource(kind)
+                if item.metadata.namespace is None
+                or matches_label_selector(item.metadata.labels, self.label_selector)
+            ]
+            self._indexes["reported", kind] = selected
+        return selected
 
     def get_configmaps(self):
-        return self._configmaps
+        return self._get_resource("configmaps")
+
+    def get_configmaps_metadata(self):
+        """ConfigMaps with `metadata` only, without their data."""
+        return self._get_resource("configmaps_metadata")
 
     def get_cronjobs(self):
-        return self._cronjobs
+        return self._get_resource("cronjobs")
 
     def get_daemonsets(self):
-        return self._daemonsets
+        return self._get_resource("daemonsets")
 
     def get_deployments(self):
-        return self._deployments
+        return self._get_resource("deployments")
 
     def get_endpoints(self):
-        return self._endpoints
+        return self._get_resource("endpoints")
 
     def get_hpas(self):
-        return self._hpas
+        return self._get_resource("hpas")
 
     def get_ingress_classes(self):
-        return self._ingress_classes
+        return self._get_resource("ingress_classes")
 
     def get_ingresses(self):
-        return self._ingresses
+        return self._get_resource("ingresses")
 
     def get_nodes(self):
-        return self._nodes
+        return self._get_resource("nodes")
 
     def get_pods(self):
-        return self._pods
+        return self._get_resource("pods")
 
     def get_network_policies(self):
-        return self._network_policies
+        return self._get_resource("network_policies")
 
     def get_pvcs(self):
-        return self._pvcs
+        return self._get_resource("pvcs")
 
     def get_replication_controllers(self):
-        return self._replicationControllers
+        return self._get_resource("replication_controllers")
 
     def get_replica_sets(self):
-        return self._replicaSets
+        return self._get_resource("replica_sets")
 
     def get_secrets(self):
-        return self._secrets
+        return self._get_resource("secrets")
+
+    def get_secrets_metadata(self):
+        """Secrets with `metadata` only, without their data."""
+        return self._get_resource("secrets_metadata")
 
     def get_services(self):
-        return self._services
+        return self._get_resource("services")
 
     def get_statefulsets(self):
-        return self._statefulsets
+        return self._get_resource("statefulsets")
 
     def get_storage_classes(self):
-        return self._storageClasses
+        return self._get_resource("storage_classes")
 
     def get_events(self):
-        return self._events
+        return self._get_resource("events")
+
+    def get_warning_events(self):
+        """Warning events of the recent window, summarized per object."""
+        return self._get_resource("warning_events")
+
+    def get_pod_warning_events(self):
+        """Warning events of Pods of the recent window, summarized per Pod."""
+        return self._get_resource("pod_warning_events")
+
+
+def _name_keys(item):
+    return ((item.metadata.namespace, item.metadata.name),)
+
+
+def _owner_keys(item):
+    return (owner.uid for owner in item.metadata.owner_references or ())
+
+
+def _node_keys(item):
+    return (item.spec.node_name,)
 
 
 class MySQLData:
@@ -163,6 +342,8 @@ class MySQLData:
 
     async def _get_connection(self):
         if self._connection is None:
+            import aiomysql
+
             self._connection = await aiomysql.connect(
                 read_default_file=self.default_config_file
             )
@@ -178,73 +359,528 @@ class MySQLData:
 class MySQLDataCollector(DataCollector, name=CheckProviders.MySQL):
     DEFAULT_CONFIG_FILE = "~/.my.cnf"
 
-    async def fetch_data(self):
+    async def fetch_data(self, resources=None):
         return MySQLData(self.DEFAULT_CONFIG_FILE)
 
 
+# `api` is the name of the `kubernetes_asyncio.client` API class listing the
+# resource, `model` is the OpenAPI model name of the listed items, e.g. `V1Pod`,
+# `field_selector` filters them on the apiserver side, items of `summarize`
+# resources are Events folded into `EventSummary` per involved object
+K8S_RESOURCE_SPEC = namedtuple(
+    "K8sResourceSpec",
+    ("api", "method", "model", "metadata_only", "field_selector", "summarize"),
+    defaults=(False, None, False),
+)
+
+
+def describe_error(error):
+    """Returns a single line description of the error."""
+    from kubernetes_asyncio.client.rest import ApiException
+
+    if isinstance(error, ApiException):
+        return " ".join(str(part) for part in (error.status, error.reason) if part)
+    return str(error) or type(error).__name__
+
+
+ALL_NAMESPACES_SUFFIX = "_for_all_namespaces"
+
+
+def _namespaced_method(method):
+    """
+    Returns name of the API method listing a single namespace, e.g.
+    `list_namespaced_pod` for `list_pod_for_all_namespaces`, or `None`
+    for cluster-scoped resources.
+    """
+    if not method.endswith(ALL_NAMESPACES_SUFFIX):
+        return None
+    kind = method.removeprefix("list_").removesuffix(ALL_NAMESPACES_SUFFIX)
+    return f"list_namespaced_{kind}"
+
+
+def _split_scope(scope):
+    # watch cache tracks resources of each listed namespace separately
+    return scope if isinstance(scope, tuple) else (scope, None)
+
+
+# asks apiserver to strip everything but metadata from the listed (or
+# watched) objects, servers not supporting it will fall back to the full objects
+PARTIAL_METADATA_ACCEPT = (
+    "application/json;as=PartialObjectMetadataList;g=meta.k8s.io;v=v1,"
+    "application/json;as=PartialObjectMetadata;g=meta.k8s.io;v=v1,"
+    "application/json"
+)
+
+
 class KubernetesDataCollector(DataCollector, name=CheckProviders.K8S):
-    async def fetch_data(self):
-        async def _fetch_items(awaitable):
-            return (await awaitable).items
+    # chunk size used for `limit`/`continue` pagination of list calls,
+    # `None` disables chunking and lists everything in a single response
+    DEFAULT_PAGE_SIZE = 500
+    PAGE_SIZES = {}
+    # apiserver closes watches after this long, must stay below
+    # the client's request timeout (5 minutes)
+    WATCH_TIMEOUT = 240
+    # summarized events older than this are not counted
+    EVENTS_WINDOW = timedelta(hours=1)
+    # list requests in flight at once, seconds each of their attempts may
+    # take and how many times throttled or failed requests are retried
+    DEFAULT_CONCURRENCY = 8
+    DEFAULT_REQUEST_TIMEOUT = 60
+    DEFAULT_RETRIES = 5
+
+    # keep resources sorted alphabetically to avoid merge conflicts
+    RESOURCES = {
+        "configmaps": K8S_RESOURCE_SPEC(
+            "CoreV1Api", "list_config_map_for_all_namespaces", "V1ConfigMap"
+        ),
+        "configmaps_metadata": K8S_RESOURCE_SPEC(
+            "CoreV1Api",
+            "list_config_map_for_all_namespaces",
+            "V1ConfigMap",
+            metadata_only=True,
+        ),
+        "cronjobs": K8S_RESOURCE_SPEC(
+            "BatchV1Api", "list_cron_job_for_all_namespaces", "V1CronJob"
+        ),
+        "daemonsets": K8S_RESOURCE_SPEC(
+            "AppsV1Api", "list_daemon_set_for_all_namespaces", "V1DaemonSet"
+        ),
+        "deployments": K8S_RESOURCE_SPEC(
+            "AppsV1Api", "list_deployment_for_all_namespaces", "V1Deployment"
+        ),
+        "endpoints": K8S_RESOURCE_SPEC(
+            "CoreV1Api", "list_endpoints_for_all_namespaces", "V1Endpoints"
+        ),
+        "events": K8S_RESOURCE_SPEC(
+            "CoreV1Api", "list_event_for_all_namespaces", "CoreV1Event"
+        ),
+        "hpas": K8S_RESOURCE_SPEC(
+            "AutoscalingV1Api",
+            "list_horizontal_pod_autoscaler_for_all_namespaces",
+            "V1HorizontalPodAutoscaler",
+        ),
+        "ingress_classes": K8S_RESOURCE_SPEC(
+            "NetworkingV1Api", "list_ingress_class", "V1IngressClass"
+        ),
+        "ingresses": K8S_RESOURCE_SPEC(
+            "NetworkingV1Api", "list_ingress_for_all_namespaces", "V1Ingress"
+        ),
+        "network_policies": K8S_RESOURCE_SPEC(
+            "NetworkingV1Api",
+            "list_network_policy_for_all_namespaces",
+            "V1NetworkPolicy",
+        ),
+        "nodes": K8S_RESOURCE_SPEC("CoreV1Api", "list_node", "V1Node"),
+        "pod_warning_events": K8S_RESOURCE_SPEC(
+            "CoreV1Api",
+            "list_event_for_all_namespaces",
+            "CoreV1Event",
+            field_selector="type=Warning,involvedObject.kind=Pod",
+            summarize=True,
+        ),
+        "pods": K8S_RESOURCE_SPEC("CoreV1Api", "list_pod_for_all_namespaces", "V1Pod"),
+        "pvcs": K8S_RESOURCE_SPEC(
+            "CoreV1Api",
+            "list_persistent_volume_claim_for_all_namespaces",
+            "V1PersistentVolumeClaim",
+        ),
+        "replica_sets": K8S_RESOURCE_SPEC(
+            "AppsV1Api", "list_replica_set_for_all_namespaces", "V1ReplicaSet"
+        ),
+        "replication_controllers": K8S_RESOURCE_SPEC(
+            "CoreV1Api",
+            "list_replication_controller_for_all_namespaces",
+            "V1ReplicationController",
+        ),
+        "secrets": K8S_RESOURCE_SPEC(
+            "CoreV1Api", "list_secret_for_all_namespaces", "V1Secret"
+        ),
+        "secrets_metadata": K8S_RESOURCE_SPEC(
+            "CoreV1Api",
+            "list_secret_for_all_namespaces",
+            "V1Secret",
+            metadata_only=True,
+        ),
+        "services": K8S_RESOURCE_SPEC(
+            "CoreV1Api", "list_service_for_all_namespaces", "V1Service"
+        ),
+        "statefulsets": K8S_RESOURCE_SPEC(
+            "AppsV1Api", "list_stateful_set_for_all_namespaces", "V1StatefulSet"
+        ),
+        "storage_classes": K8S_RESOURCE_SPEC(
+            "StorageV1Api", "list_storage_class", "V1StorageClass"
+        ),
+        "warning_events": K8S_RESOURCE_SPEC(
+            "CoreV1Api",
+            "list_event_for_all_namespaces",
+            "CoreV1Event",
+            field_selector="type=Warning",
+            summarize=True,
+        ),
+    }
+
+    # secret payloads never hit the disk, `secrets_metadata` is saved instead,
+    # summaries are computed from the saved `events` when scanned
+    SNAPSHOT_EXCLUDED = frozenset(
+        ("secrets", *(kind for kind, spec in RESOURCES.items() if spec.summarize))
+    )
+
+    def __init__(
+        self,
+        page_sizes=None,
+        raw_json=False,
+        watch=False,
+        snapshot_path=None,
+        events_window=None,
+        namespaces=None,
+        label_selector=None,
+        concurrency=DEFAULT_CONCURRENCY,
+        request_timeout=DEFAULT_REQUEST_TIMEOUT,
+        retries=DEFAULT_RETRIES,
+        partial=False,
+    ):
+        self._page_sizes = {**self.PAGE_SIZES, **(page_sizes or {})}
+        # skip OpenAPI models deserialization, objects are lazy views
+        # over the parsed JSON with the same attributes instead
+        self._raw_json = raw_json
+        self._apis = None
+        # with watch the resources are listed once and kept current for
+        # the next runs, connections stay open until `close`
+        self._watch_cache = (
+            WatchCache(self._fetch_scope, self._watch_scope) if watch else None
+        )
+        self._exit_stack = contextlib.AsyncExitStack()
+        # everything collected gets saved there to be scanned offline later
+        self._snapshot_path = snapshot_path
+        self._events_window = (
+            self.EVENTS_WINDOW if events_window is None else events_window
+        )
+        # namespaced resources are listed from these namespaces only,
+        # and the ones labeled with objects' labels filtered by the selector
+        self._namespaces = sorted(set(namespaces or ()))
+        self._label_selector = label_selector
+        self._scheduling = (concurrency, request_timeout, retries)
+        self._scheduler = None
+        # resources failed to be listed are reported by the returned data
+        # instead of failing the whole collection
+        self._partial = partial
+
+    @classmethod
+    def configure(cls, options):
+        events_window = None
+        if options.events_window is not None:
+            events_window = timedelta(minutes=options.events_window)
+        if options.from_snapshot is not None:
+            return KubernetesSnapshotCollector(
+                options.from_snapshot,
+                raw_json=options.raw_json,
+                events_window=events_window,
+                namespaces=options.namespaces,
+                label_selector=options.selector,
+                partial=options.partial_results,
+            )
+        return cls(
+            raw_json=options.raw_json,
+            watch=options.interval is not None,
+            snapshot_path=options.save_snapshot,
+            events_window=events_window,
+            namespaces=options.namespaces,
+            label_selector=options.selector,
+            concurrency=options.max_concurrency,
+            request_timeout=options.request_timeout,
+            retries=options.retries,
+            partial=options.partial_results,
+        )
+
+    def source(self):
+        return {
+            "cluster": self.cluster,
+            "namespaces": self._namespaces,
+            "selector": self._label_selector,
+        }
+
+    async def _open_apis(self, exit_stack):
+        from kubernetes_asyncio import client, config
+        from kubernetes_asyncio.client.api_client import ApiClient
 
         # Load kube config
         await config.load_kube_config()
+        self._scheduler = RequestScheduler(*self._scheduling)
+
+        api = await exit_stack.enter_async_context(ApiClient())
+        self.cluster = api.configuration.host
+        metadata_api = await exit_stack.enter_async_context(
+            ApiClient(header_name="Accept", header_value=PARTIAL_METADATA_ACCEPT)
+        )
+        # Get an instance of each API class used by the resources
+        self._apis = {
+            (spec.api, spec.metadata_only): getattr(client, spec.api)(
+                metadata_api if spec.metadata_only else api
+            )
+            for spec in self.RESOURCES.values()
+        }
+
+    @contextlib.asynccontextmanager
+    async def session(self):
+        if self._apis is not None:
+            # reuse already opened session
+            yield
+            return
+
+        if self._watch_cache is not None:
+            await self._open_apis(self._exit_stack)
+            yield
+            return
+
+        async with contextlib.AsyncExitStack() as exit_stack:
+            await self._open_apis(exit_stack)
+            try:
+                yield
+            finally:
+                self._apis = None
+
+    async def close(self):
+        if self._watch_cache is not None:
+            await self._watch_cache.close()
+        await self._exit_stack.aclose()
+        self._apis = None
+
+    def get_page_size(self, kind):
+        return self._page_sizes.get(kind, self.DEFAULT_PAGE_SIZE)
+
+    @staticmethod
+    async def _request(api, spec, namespace=None, **kwargs):
+        if namespace is None:
+            method = getattr(api, spec.method)
+        else:
+            method = functools.partial(
+                getattr(api, _namespaced_method(spec.method)), namespace
+            )
+        response = await method(_preload_content=False, **kwargs)
+        if not HTTPStatus.OK <= response.status < HTTPStatus.MULTIPLE_CHOICES:
+            from kubernetes_asyncio.client.rest import ApiException, RESTResponse
+
+            body = await response.read()
+            raise ApiException(http_resp=RESTResponse(response, body))
+        return response
+
+    async def _get(self, api, spec, **kwargs):
+        """Returns response to the list request and its body."""
+
+        async def request():
+            response = await self._request(api, spec, **kwargs)
+            return response, await response.read()
+
+        response, body = await self._scheduler.run(request)
+        count_received(len(body))
+        return response, body
+
+    async def _read_page(self, api, spec, **kwargs):
+        response, body = await self._get(api, spec, **kwargs)
+
+        if self._raw_json:
+            page = json_loads(body)
+            items = wrap_items(page["items"], openapi_model(spec.model))
+            metadata = page.get("metadata") or {}
+            return items, metadata.get("continue"), metadata.get("resourceVersion")
+
+        from kubernetes_asyncio.client.rest import RESTResponse
+
+        page = api.api_client.deserialize(
+            RESTResponse(response, body), f"{spec.model}List"
+        )
+        if page.metadata is None:
+            return page.items, None, None
+        return page.items, page.metadata._continue, page.metadata.resource_version
+
+    def _scopes(self, spec):
+        """Returns namespaces to list the resource from, `None` for all."""
+        if not self._namespaces or _namespaced_method(spec.method) is None:
+            return [None]
+        return self._namespaces
+
+    def _selectors(self, spec, namespace):
+        params = {"namespace": namespace}
+        if spec.field_selector is not None:
+            params["field_selector"] = spec.field_selector
+        if self._label_selected(spec):
+            params["label_selector"] = self._label_selector
+        return params
+
+    def _label_selected(self, spec):
+        """
+        Tells whether the label selector is passed to apiserver. Objects
+        looked up by the checks have to be there whether labeled or not,
+        the reported ones are narrowed down by `KubernetesData` otherwise.
+        """
+        # events are not labeled with the labels of the objects they're about
+        if (
+            self._label_selector is None
+            or _namespaced_method(spec.method) is None
+            or spec.model == "CoreV1Event"
+        ):
+            return False
+        return any(self.RESOURCES.get(kind) == spec for kind in self.reported_only)
+
+    def _list_params(self, spec, namespace, page_size, _continue):
+        return {
+            **self._selectors(spec, namespace),
+            "limit": page_size,
+            "_continue": _continue,
+        }
+
+    async def _list_pages(self, api, spec, namespace, page_size):
+        """Returns all the listed items and the list's resourceVersion."""
+        items = []
+        _continue = None
+        while True:
+            page_items, _continue, resource_version = await self._read_page(
+                api, spec, **self._list_params(spec, namespace, page_size, _continue)
+            )
+            items.extend(page_items)
+            if not _continue:
+                return items, resource_version
+
+    def _aggregator(self, spec):
+        return EventAggregator(spec.field_selector, window=self._events_window)
+
+    async def _summarize_pages(self, api, spec, namespace, page_size):
+        """
+        Returns summaries of the listed events and the list's resourceVersion.
+        Pages are folded as they arrive, only the summaries are kept.
+        """
+        aggregator = self._aggregator(spec)
+        _continue = None
+        while True:
+            _, body = await self._get(
+                api, spec, **self._list_params(spec, namespace, page_size, _continue)
+            )
+            page = json_loads(body)
+            aggregator.add(page["items"])
+            metadata = page.get("metadata") or {}
+            _continue = metadata.get("continue")
+            if not _continue:
+                return aggregator.summaries(), metadata.get("resourceVersion")
+
+    def _deserialize_item(self, api_client, spec, obj):
+        if self._raw_json:
+            return K8sObject(obj, openapi_model(spec.model))
+        return api_client.deserialize(SimpleNamespace(data=json.dumps(obj)), spec.model)
+
+    async def _watch_items(self, kind, resource_version, namespace=None):
+        spec = self.RESOURCES[kind]
+        api = self._apis[spec.api, spec.metadata_only]
+        response = await self._request(
+            api,
+            spec,
+            **self._selectors(spec, namespace),
+            watch=True,
+            resource_version=resource_version,
+            allow_watch_bookmarks=True,
+            timeout_seconds=self.WATCH_TIMEOUT,
+        )
+        async with response:
+            async for line in response.content:
+                if not line.strip():
+                    continue
+                event = json_loads(line)
+                obj = event["object"]
+                if event["type"] == "ERROR":
+                    from kubernetes_asyncio.client.rest import ApiException
+
+                    raise ApiException(status=obj.get("code"), reason=obj.get("reason"))
+                resource_version = obj["metadata"]["resourceVersion"]
+                if event["type"] != "BOOKMARK":
+                    obj = self._deserialize_item(api.api_client, spec, obj)
+                yield event["type"], obj, resource_version
+
+    def _watch_scope(self, scope, resource_version):
+        kind, namespace = _split_scope(scope)
+        return self._watch_items(kind, resource_version, namespace)
+
+    async def _fetch_items(self, kind, namespace=None):
+        from kubernetes_asyncio.client.rest import ApiException
+
+        spec = self.RESOURCES[kind]
+        api = self._apis[spec.api, spec.metadata_only]
+        page_size = self.get_page_size(kind)
+        list_pages = self._summarize_pages if spec.summarize else self._list_pages
 
         try:
-            async with ApiClient() as api:
-                # Get an instance of the API class
-                v1 = client.CoreV1Api(api)
-                v1apps = AppsV1Api(api)
-                v1autoscaling = AutoscalingV1Api(api)
-                v1networking = NetworkingV1Api(api)
-                v1storage = StorageV1Api(api)
-                v1batch = BatchV1Api(api)
-
-                hpas = _fetch_items(
-                    v1autoscaling.list_horizontal_pod_autoscaler_for_all_namespaces()
-                )
+            return await list_pages(api, spec, namespace, page_size)
+        except ApiException as api_exception:
+            if api_exception.status != HTTPStatus.GONE:
+                raise
+            # continue token expired in the middle of the listing,
+            # the only way to get a consistent list is to start over
+            return await list_pages(api, spec, namespace, page_size)
+
+    async def _fetch_scope(self, scope):
+        return await self._fetch_items(*_split_scope(scope))
+
+    async def _list_scope(self, kind, namespace):
+        # summaries are recomputed on every run, events age out of the window
+        if self._watch_cache is not None and not self.RESOURCES[kind].summarize:
+            scope = kind if namespace is None else (kind, namespace)
+            return await self._watch_cache.get(scope)
+        items, _ = await self._fetch_items(kind, namespace)
+        return items
+
+    async def _list(self, kind):
+        scopes = self._scopes(self.RESOURCES[kind])
+        if len(scopes) == 1:
+            return await self._list_scope(kind, scopes[0])
+        lists = await asyncio.gather(
+            *(self._list_scope(kind, namespace) for namespace in scopes)
+        )
+        return list(chain.from_iterable(lists))
+
+    async def _load(self, kind):
+        async with self.session():
+            if self.timings is None:
+                return await self._list(kind)
+            with self.timings.measure_list(kind) as timing:
+                items = await self._list(kind)
+                timing.objects = len(items)
+            return items
+
+    def _save_snapshot(self, data):
+        resources = {
+            kind: [to_json(item) for item in items]
+            for kind, items in data.loaded().items()
+            if kind not in self.SNAPSHOT_EXCLUDED
+        }
+        save_snapshot(self._snapshot_path, resources)
+
+    async def fetch_data(self, resources=None):
+        from kubernetes_asyncio.client.rest import ApiException
+
+        kinds = self.RESOURCES.keys() if resources is None else sorted(resources)
+        unknown = set(kinds) - self.RESOURCES.keys()
+        if unknown:
+            unknown = ", ".join(sorted(unknown))
+            raise ValueError(f"Unknown Kubernetes resources: {unknown}")
+        if self._snapshot_path is not None:
+            # snapshot has to serve any set of checks, not just the current one
+            kinds = self.RESOURCES.keys() - self.SNAPSHOT_EXCLUDED
 
-                tasks = {
-                    "configmaps": _fetch_items(v1.list_config_map_for_all_namespaces()),
-                    "cronjobs": _fetch_items(
-                        v1batch.list_cron_job_for_all_namespaces()
-                    ),
-                    "daemonsets": _fetch_items(
-                        v1apps.list_daemon_set_for_all_namespaces()
-                    ),
-                    "deployments": _fetch_items(
-                        v1apps.list_deployment_for_all_namespaces()
-                    ),
-                    "endpoints": _fetch_items(v1.list_endpoints_for_all_namespaces()),
-                    "hpas": hpas,
-                    "ingress_classes": _fetch_items(v1networking.list_ingress_class()),
-                    "ingresses": _fetch_items(
-                        v1networking.list_ingress_for_all_namespaces()
-                    ),
-                    "network_policies": _fetch_items(
-                        v1networking.list_network_policy_for_all_namespaces()
-                    ),
-                    "nodes": _fetch_items(v1.list_node(watch=False)),
-                    "pods": _fetch_items(v1.list_pod_for_all_namespaces()),
-                    "pvcs": _fetch_items(
-                        v1.list_persistent_volume_claim_for_all_namespaces()
-                    ),
-                    "replicationControllers": _fetch_items(
-                        v1.list_replication_controller_for_all_namespaces()
-                    ),
-                    "replicaSets": _fetch_items(
-                        v1apps.list_replica_set_for_all_namespaces()
-                    ),
-                    "secrets": _fetch_items(v1.list_secret_for_all_namespaces()),
-                    "services": _fetch_items(v1.list_service_for_all_namespaces()),
-                    "statefulsets": _fetch_items(
-                        v1apps.list_stateful_set_for_all_namespaces()
-                    ),
-                    "storageClasses": _fetch_items(v1storage.list_storage_class()),
-                    "events": _fetch_items(v1.list_event_for_all_namespaces()),
-                }
-                results = dict(zip(tasks, await asyncio.gather(*tasks.values())))
-                return KubernetesData(**results)
+        try:
+            async with self.session():
+                # everything not collected here will be fetched on demand
+                data = KubernetesData(
+                    loader=self._load, label_selector=self._label_selector
+                )
+                await asyncio.gather(
+                    *(data.load(kind) for kind in kinds),
+                    return_exceptions=self._partial,
+                )
+                for kind, error in sorted(data.errors.items()):
+                    print(
+                        f"Failed to collect Kubernetes {kind}: {describe_error(error)}"
+                    )
+                if self._snapshot_path is not None:
+                    await asyncio.to_thread(self._save_snapshot, data)
+                return data
 
         except ApiException as api_exception:
             # Handle exceptions raised by Kubernetes API interactions
@@ -258,11 +894,115 @@ class KubernetesDataCollector(DataCollector, name=CheckProviders.K8S):
             return None
 
 
+class KubernetesSnapshotCollector(KubernetesDataCollector):
+    """
+    Serves resources saved with `--save-snapshot` without touching apiserver.
+    Namespaces and the label selector narrow the saved resources down the
+    same way they narrow down the listings.
+    """
+
+    def __init__(
+        self,
+        path,
+        raw_json=False,
+        events_window=None,
+        namespaces=None,
+        label_selector=None,
+        partial=False,
+    ):
+        super().__init__(
+            raw_json=raw_json,
+            events_window=events_window,
+            namespaces=namespaces,
+            label_selector=label_selector,
+            partial=partial,
+        )
+        self._path = path
+        self._snapshot = None
+        self._api_client = None
+        self.cluster = f"snapshot:{os.path.abspath(path)}"
+
+    async def _open_apis(self, exit_stack):
+        from kubernetes_asyncio.client.api_client import ApiClient
+
+        # nothing is requested, the client only deserializes the models
+        self._api_client = await exit_stack.enter_async_context(ApiClient())
+        self._apis = {}
+
+    async def _fetch_items(self, kind, namespace=None):
+        if self._snapshot is None:
+            self._snapshot = asyncio.ensure_future(
+                asyncio.to_thread(load_snapshot, self._path)
+            )
+        snapshot = await self._snapshot
+        spec = self.RESOURCES[kind]
+        if spec.summarize:
+            # selector is matched locally, the way apiserver would
+            aggregator = self._aggregator(spec)
+            aggregator.add(self._select(snapshot.get("events", ()), spec, namespace))
+            return aggregator.summaries(), None
+        if kind not in snapshot:
+            raise LookupError(f"Kubernetes {kind} are not in the snapshot {self._path}")
+
+        items = self._select(snapshot[kind], spec, namespace)
+        if self._raw_json:
+            return wrap_items(items, openapi_model(spec.model)), None
+        page = json.dumps({"items": items})
+        items = self._api_client.deserialize(
+            SimpleNamespace(data=page), f"{spec.model}List"
+        ).items
+        return items, None
+
+    def _select(self, items, spec, namespace):
+        """Returns saved items the apiserver would list with the parameters."""
+        if namespace is not None:
+            items = [
+                item for item in items if item["metadata"].get("namespace") == namespace
+            ]
+        if self._label_selected(spec):
+            items = [
+                item
+                for item in items
+                if matches_label_selector(
+                    item["metadata"].get("labels"), self._label_selector
+                )
+            ]
+        return items
+
+
 # Main Application
 
 
+# checks and data inherited by the forked workers of the parallel mode
+_worker_state = None
+# set in the forked workers only, these can't fetch anything on demand
+_in_worker = False
+
+
+def _init_worker():
+    global _in_worker
+    _in_worker = True
+
+
+def _run_batch(batch, data):
+    if len(batch) == 1:
+        return [batch[0].execute(data)]
+    return evaluate_objects(batch, data)
+
+
+def _run_forked_batch(names):
+    checks, data = _worker_state
+    return _run_batch([checks[name] for name in names], data)
+
+
 class ResourceChecker:
-    _check_reports: dict[str, list[CheckReport]]
+    _check_reports: MutableMapping[str, Sequence[CheckReport]]
+
+    # reports of checks which could not be evaluated, by provider
+    ERROR_REPORTS = {
+        CheckProviders.K8S: CheckReportK8s,
+        CheckProviders.MySQL: CheckReportMySQL,
+    }
 
     def __init__(
         self,
@@ -270,19 +1010,252 @@ class ResourceChecker:
         collector: DataCollector,
         checks: list[Check],
         provider: str,
+        incremental: IncrementalScan | None = None,
+        compact_reports: bool = False,
+        parallel: int | None = None,
+        timings: Timings | None = None,
+        profiler: Profiler | None = None,
+        partial: bool = False,
     ):
         self.display = display
         self._collector = collector
         self._checks = checks
         self._provider = provider
-        self._check_reports = {}
+        # column-wise storage trades access speed for memory on large scans
+        self._check_reports = ReportStore() if compact_reports else {}
+        self._incremental = incremental
+        self._parallel = parallel
+        self._timings = timings
+        self._profiler = profiler
+        # failing checks are reported as errored instead of ending the run
+        self._partial = partial
+        collector.reported_only = self._reported_only_resources()
+
+    def _required_resources(self):
+        resources = set()
+        for check in self._checks:
+            # checks without declared resources load them on demand
+            if check.Enabled is not False and check.Resources is not None:
+                resources.update(check.Resources)
+        return resources
+
+    def _reported_only_resources(self):
+        """Returns kinds the checks report on, but never look objects up in."""
+        reported, looked_up = set(), set()
+        for check in self._checks:
+            if check.Enabled is False:
+                continue
+            if check.Resources is None:
+                # resources fetched on demand could be anything
+                return frozenset()
+            if check.ReportedResource is not None:
+                reported.add(check.ReportedResource)
+            looked_up.update(set(check.Resources) - {check.ReportedResource})
+        return frozenset(reported - looked_up)
+
+    @staticmethod
+    async def _run_check(check, data):
+        if inspect.iscoroutinefunction(check.execute):
+            return await check.execute(data)
+        if check.Resources is None:
+            # resources can be fetched on demand, which blocks the check
+            # until the fetch finishes on the event loop
+            return await asyncio.to_thread(check.execute, data)
+        return check.execute(data)
+
+    @staticmethod
+    def _is_cpu_bound(check):
+        return check.Resources is not None and not inspect.iscoroutinefunction(
+            check.execute
+        )
+
+    @contextlib.contextmanager
+    def _worker_pool(self, data):
+        global _worker_state
+
+        if self._parallel < 2 or "fork" not in multiprocessing.get_all_start_methods():
+            # no pool, checks still run concurrently on the event loop
+            yield None
+            return
+
+        # workers are forked on first submit and share the collected data
+        # copy-on-write, so nothing but check names and reports is pickled
+        _worker_state = (
+            {check.__class__.__name__: check for check in self._checks},
+            data,
+        )
+        try:
+            with ProcessPoolExecutor(
+                self._parallel,
+                mp_context=multiprocessing.get_context("fork"),
+                initializer=_init_worker,
+            ) as pool:
+                yield pool
+        finally:
+            _worker_state = None
+
+    def _batches(self, checks):
+        """
+        Groups object checks of the same kind to be evaluated in one pass,
+        other checks run on their own.
+        """
+        batches = {}
+        for check in checks:
+            if isinstance(check, ObjectCheck) and self._is_cpu_bound(check):
+                batches.setdefault(check.ReportedResource, []).append(check)
+            else:
+                batches[id(check)] = [check]
+        return list(batches.values())
+
+    @staticmethod
+    async def _run_in_pool(pool, batch):
+        reports = await asyncio.get_running_loop().run_in_executor(
+            pool, _run_forked_batch, [check.__class__.__name__ for check in batch]
+        )
+        for check, check_reports in zip(batch, reports):
+            for report in check_reports:
+                # unpickled reports carry their own copy of the metadata
+                report.check_metadata = check.report_metadata
+        return reports
+
+    async def _run_pooled(self, pool, check, data):
+        # incremental scans re-run checks against partial data the workers
+        # do not have, these are executed in process
+        if (
+            pool is None
+            or data is not _worker_state[1]
+            or not self._is_cpu_bound(check)
+        ):
+            return await self._run_check(check, data)
+        return (await self._run_in_pool(pool, [check]))[0]
+
+    async def _evaluate(self, check, data, run_check):
+        if self._incremental is None:
+            return await run_check(check, data)
+        return await self._incremental.run(check, data, run_check)
+
+    @staticmethod
+    def _count_objects(check, data):
+        """Counts objects the check was run against, when known upfront."""
+        if not isinstance(data, KubernetesData) or check.Resources is None:
+            return None
+        loaded = data.loaded()
+        kinds = [check.ReportedResource] if check.ReportedResource else check.Resources
+        return sum(len(loaded.get(kind, ())) for kind in kinds)
+
+    async def _measure(self, check, data, run_check):
+        if self._timings is None:
+            return await self._evaluate(check, data, run_check)
+        with self._timings.measure_check(check.CheckID) as timing:
+            reports = await self._evaluate(check, data, run_check)
+        timing.objects = self._count_objects(check, data)
+        timing.reports = len(reports)
+        return reports
+
+    def _error_report(self, check, message):
+        report = self.ERROR_REPORTS[self._provider](check.report_metadata)
+        report.status = "ERROR"
+        report.status_extended = message
+        return report
+
+    def _failed_inputs(self, check, data):
+        """Returns description of the check's resources failed to be collected."""
+        if not isinstance(data, KubernetesData) or check.Resources is None:
+            return None
+        failed = sorted(set(check.Resources) & data.errors.keys())
+        if not failed:
+            return None
+        return "; ".join(
+            f"{kind} not collected: {describe_error(data.errors[kind])}"
+            for kind in failed
+        )
+
+    async def _evaluate_batch(self, batch, data, run_check, pool=None):
+        if not self._partial:
+            return await self._run_batch(batch, data, run_check, pool)
+        failed = [(check, self._failed_inputs(check, data)) for check in batch]
+        results = [
+            (check, [self._error_report(check, message)])
+            for check, message in failed
+            if message is not None
+        ]
+        batch = [check for check, message in failed if message is None]
+        if not batch:
+            return results
+        try:
+            return results + await self._run_batch(batch, data, run_check, pool)
+        except Exception as error:
+            if len(batch) == 1:
+                message = f"Failed to run: {describe_error(error)}"
+                return results + [(batch[0], [self._error_report(batch[0], message)])]
+        # one of the checks evaluated together failed, tell which one
+        for check in batch:
+            results += await self._evaluate_batch([check], data, run_check, pool)
+        return results
+
+    async def _run_batch(self, batch, data, run_check, pool=None):
+        if len(batch) == 1:
+            return [(batch[0], await self._measure(batch[0], data, run_check))]
+        if pool is None:
+            return list(zip(batch, _run_batch(batch, data)))
+        return list(zip(batch, await self._run_in_pool(pool, batch)))
+
+    async def _evaluate_all(self, checks, data):
+        """Yields `(check, reports)` in the order the checks complete."""
+        # incremental scans re-evaluate each check on its own, measured
+        # checks are run one at a time to tell their costs apart
+        measured = self._timings is not None
+        batches = (
+            [[check] for check in checks]
+            if self._incremental is not None or measured
+            else self._batches(checks)
+        )
+
+        if not self._parallel or measured:
+            for batch in batches:
+                for item in await self._evaluate_batch(batch, data, self._run_check):
+                    yield item
+            return
+
+        with self._worker_pool(data) as pool:
+            run_check = functools.partial(self._run_pooled, pool)
+            tasks = [
+                asyncio.create_task(self._evaluate_batch(batch, data, run_check, pool))
+                for batch in batches
+            ]
+            try:
+                for task in asyncio.as_completed(tasks):
+                    for item in await task:
+                        yield item
+            finally:
+                for task in tasks:
+                    task.cancel()
 
     async def execute(self):
-        data = await self._collector.fetch_data()
-        if data is None:
-            print("Failed to collect inventory")
-            exit(1)
-
+        async with self._collector.session():
+            return await self._execute()
+
+    async def close(self):
+        await self._collector.close()
+
+    async def stream(self, collected=None):
+        """
+        Yields `(check, reports)` as the checks complete. Reports are handed
+        over as they are, none of them are kept by the checker. `collected`
+        is called once the data is collected, before any check runs.
+        """
+        async with self._collector.session():
+            data = await self._collect()
+            if collected is not None:
+                collected()
+            checks = [check for check in self._checks if check.Enabled is not False]
+            with profiled(self._profiler, "execute"):
+                async for item in self._evaluate_all(checks, data):
+                    yield item
+            if self._incremental is not None:
+                self._incremental.save()
+
+    async def _run_checks(self, data):
         total_checks = len(self._checks)
 
         completed_checks = 0
@@ -290,15 +1263,10 @@ class ResourceChecker:
         # Display the progress bar header
         self.display.display_progress_bar_header()
 
-        for check in self._checks:
-            if check.Enabled is False:
-                continue
-            check_reports = (
-                await check.execute(data)
-                if inspect.iscoroutinefunction(check.execute)
-                else check.execute(data)
-            )
-            self._check_reports[check.__class__.__name__] = check_reports
+        checks = [check for check in self._checks if check.Enabled is not False]
+        results = {}
+        async for check, check_reports in self._evaluate_all(checks, data):
+            results[check.__class__.__name__] = check_reports
             completed_checks += 1
             self.display.display_progress_bar(
                 completed_checks / total_checks, check.CheckTitle
@@ -306,16 +1274,49 @@ class ResourceChecker:
 
             print()  # New line after the progress bar completion
 
+        # reports are kept in check order, whichever finished first
+        for check in checks:
+            name = check.__class__.__name__
+            self._check_reports[name] = results[name]
+
+    async def _collect(self):
+        with profiled(self._profiler, "collect"):
+            data = await self._collector.fetch_data(self._required_resources())
+        if data is None:
+            print("Failed to collect inventory")
+            exit(1)
+        if self._incremental is not None:
+            self._incremental.track(data, source=self._collector.source())
+        return data
+
+    async def _execute(self):
+        data = await self._collect()
+
+        with profiled(self._profiler, "execute"):
+            await self._run_checks(data)
+
+        if self._incremental is not None:
+            self._incremental.save()
         return self._check_reports
 
     @property
     def failing_reports(self) -> list[CheckReport]:
         failing = []
         for check_list in self._check_reports.values():
-            failing.extend(item for item in check_list if not item.passed)
+            failing.extend(
+                item for item in check_list if not item.passed and not item.errored
+            )
 
         return failing
 
+    @property
+    def errored_reports(self) -> list[CheckReport]:
+        errored = []
+        for check_list in self._check_reports.values():
+            errored.extend(item for item in check_list if item.errored)
+
+        return errored
+
     @property
     def failing_objects(self):
         items = self.failing_reports
@@ -326,6 +1327,10 @@ class ResourceChecker:
     def reports(self):
         return self._check_reports
 
+    @property
+    def timings(self):
+        return self._timings
+
 
 class JobDefinition:
     def __init__(self, check_modules):
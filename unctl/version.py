@@ -1,7 +1,10 @@
+import functools
 import json
-import requests
-import toml
-from importlib.metadata import version
+import os
+import sys
+import threading
+import time
+from importlib.metadata import PackageNotFoundError, version
 
 try:
     from packaging.version import parse
@@ -10,29 +13,36 @@ except ImportError:
 
 from colorama import Fore, Style
 
+from unctl.lib.cache import user_cache_dir
 
+# set to any value to skip the release check, same as `--no-update-check`
+DISABLE_ENV = "UNCTL_NO_UPDATE_CHECK"
+# PyPI is asked at most once per this many seconds
+CHECK_INTERVAL = 24 * 60 * 60
+CACHE_FILE = "release_check.json"
+
+
+@functools.cache
 def current():
     try:
-        return toml.load("pyproject.toml")["tool"]["poetry"]["version"]
-    except Exception:
         return version(__package__)
+    except PackageNotFoundError:
+        pass
+    # not installed, running from the source tree
+    import toml
 
-
-def check():
-    if last() > parse(current()):
-        print(
-            f"{Fore.YELLOW}A new release of unctl is available: "
-            f"{Fore.RED + Style.BRIGHT}{current()}{Style.RESET_ALL} -> "
-            f"{Fore.GREEN + Style.BRIGHT}{last()}{Style.RESET_ALL}"
-        )
-        print(
-            f"{Fore.YELLOW}To update, run: "
-            f"{Fore.GREEN + Style.BRIGHT}pip install --upgrade unctl{Style.RESET_ALL}"
-        )
+    pyproject = os.path.join(os.path.dirname(__file__), os.pardir, "pyproject.toml")
+    try:
+        return toml.load(pyproject)["tool"]["poetry"]["version"]
+    except (OSError, KeyError, toml.TomlDecodeError):
+        return "0"
 
 
 def last():
     """Return version of package on pypi.python.org using json."""
+    # slow to import, it's only needed by the background check
+    import requests
+
     url = f"https://pypi.python.org/pypi/{__package__}/json"
     req = requests.get(url, timeout=3)
     version = parse("0")
@@ -44,3 +54,96 @@ def last():
             if not ver.is_prerelease:
                 version = max(version, ver)
     return version
+
+
+def _cache_path():
+    return os.path.join(user_cache_dir(), CACHE_FILE)
+
+
+def _load_cached(now):
+    """Returns `(fresh, version)` of the last release check."""
+    try:
+        with open(_cache_path()) as cache_file:
+            cached = json.load(cache_file)
+        checked_at = float(cached["checked_at"])
+    except (OSError, ValueError, KeyError, TypeError):
+        return False, None
+    fresh = 0 <= now - checked_at < CHECK_INTERVAL
+    return fresh, cached.get("latest") and parse(cached["latest"])
+
+
+def _save_cached(now, latest):
+    path = _cache_path()
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(path, "w") as cache_file:
+            json.dump({"checked_at": now, "latest": latest and str(latest)}, cache_file)
+    except OSError:
+        pass
+
+
+def latest():
+    """
+    Returns the latest release, asking PyPI at most once a day. Failures
+    are remembered too, so unreachable PyPI is not retried on every run.
+    """
+    now = time.time()
+    fresh, cached = _load_cached(now)
+    if fresh:
+        return cached
+    try:
+        released = last()
+    except Exception:
+        # offline, behind a proxy or PyPI answering garbage
+        released = None
+    _save_cached(now, released)
+    return released
+
+
+def check_disabled():
+    return bool(os.environ.get(DISABLE_ENV))
+
+
+def notify(released):
+    if released is None or released <= parse(current()):
+        return
+    # stdout may carry machine-readable reports
+    print(
+        f"{Fore.YELLOW}A new release of unctl is available: "
+        f"{Fore.RED + Style.BRIGHT}{current()}{Style.RESET_ALL} -> "
+        f"{Fore.GREEN + Style.BRIGHT}{released}{Style.RESET_ALL}",
+        file=sys.stderr,
+    )
+    print(
+        f"{Fore.YELLOW}To update, run: "
+        f"{Fore.GREEN + Style.BRIGHT}pip install --upgrade unctl{Style.RESET_ALL}",
+        file=sys.stderr,
+    )
+
+
+def check():
+    notify(latest())
+
+
+class ReleaseCheck:
+    """
+    Checks for a new release on a background thread while unctl runs,
+    so slow or unreachable PyPI never delays it.
+    """
+
+    def __init__(self):
+        self._latest = None
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def _run(self):
+        self._latest = latest()
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def notify(self, timeout=0):
+        """Tells about a new release if the check finished within `timeout`."""
+        self._thread.join(timeout)
+        if not self._thread.is_alive():
+            notify(self._latest)